@@ -0,0 +1,13 @@
+from django.contrib import admin
+from .models import DailyItemSales, DailySales
+
+@admin.register(DailySales)
+class DailySalesAdmin(admin.ModelAdmin):
+    list_display = ('date', 'order_count', 'revenue', 'delivery_count', 'pickup_count', 'cash_count', 'card_count')
+    date_hierarchy = 'date'
+
+@admin.register(DailyItemSales)
+class DailyItemSalesAdmin(admin.ModelAdmin):
+    list_display = ('date', 'name', 'units', 'revenue')
+    list_filter = ('date',)
+    search_fields = ('name',)
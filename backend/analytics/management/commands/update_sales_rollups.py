@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from analytics.rollups import rebuild_rollups, update_rollups
+
+
+class Command(BaseCommand):
+    help = 'Fold new orders and status changes into the daily sales rollups'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--trailing-days', type=int, default=2,
+                            help='Also recompute this many recent days, for changes outside the status history')
+        parser.add_argument('--rebuild', action='store_true', help='Discard all rollups and rebuild from scratch')
+
+    def handle(self, *args, **options):
+        if options['rebuild']:
+            rebuilt = rebuild_rollups()
+        else:
+            rebuilt = update_rollups(trailing_days=options['trailing_days'])
+
+        if rebuilt is None:
+            self.stdout.write('Nothing to roll up')
+        else:
+            start, end = rebuilt
+            self.stdout.write(self.style.SUCCESS(f'Rolled up {start} to {end} (exclusive)'))
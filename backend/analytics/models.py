@@ -0,0 +1,44 @@
+from django.db import models
+
+class DailySales(models.Model):
+    """Per-day order totals, excluding cancelled orders."""
+    date = models.DateField(unique=True)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    order_count = models.IntegerField(default=0)
+    cancelled_count = models.IntegerField(default=0)
+    delivery_count = models.IntegerField(default=0)
+    pickup_count = models.IntegerField(default=0)
+    cash_count = models.IntegerField(default=0)
+    card_count = models.IntegerField(default=0)
+
+    class Meta:
+        ordering = ['date']
+
+    def __str__(self):
+        return f"{self.date}: {self.order_count} orders, {self.revenue}"
+
+class DailyItemSales(models.Model):
+    """Units and revenue per order item name per day, excluding cancelled orders."""
+    date = models.DateField()
+    name = models.CharField(max_length=255)
+    units = models.IntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        ordering = ['date', 'name']
+        constraints = [
+            models.UniqueConstraint(fields=['date', 'name'], name='unique_daily_item_sales'),
+        ]
+
+    def __str__(self):
+        return f"{self.date}: {self.units}x {self.name}"
+
+class RollupCheckpoint(models.Model):
+    """High-water marks of the last order and status change folded into the rollups."""
+    name = models.CharField(max_length=50, unique=True)
+    last_order_id = models.BigIntegerField(default=0)
+    last_history_id = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} @ order #{self.last_order_id}"
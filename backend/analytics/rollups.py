@@ -0,0 +1,126 @@
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, DecimalField, F, Max, Min, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from orders.models import Order, OrderItem, OrderStatusHistory
+
+from .models import DailyItemSales, DailySales, RollupCheckpoint
+
+CHECKPOINT_NAME = 'daily_sales'
+# Days recomputed per transaction; bounds memory on a first full build
+CHUNK_DAYS = 31
+
+PLACED = ~Q(status='cancelled')
+
+
+def _midnight(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def rollup_days(start, end):
+    """Recompute the rollups for ``start <= date < end`` from raw orders."""
+    orders = Order.objects.filter(created_at__gte=_midnight(start), created_at__lt=_midnight(end))
+    days = orders.annotate(day=TruncDate('created_at')).values('day').order_by().annotate(
+        revenue=Sum('total', filter=PLACED),
+        order_count=Count('id', filter=PLACED),
+        cancelled_count=Count('id', filter=Q(status='cancelled')),
+        delivery_count=Count('id', filter=PLACED & Q(delivery_method='delivery')),
+        pickup_count=Count('id', filter=PLACED & Q(delivery_method='pickup')),
+        cash_count=Count('id', filter=PLACED & Q(payment_method='cash')),
+        card_count=Count('id', filter=PLACED & Q(payment_method='card')),
+    )
+    items = OrderItem.objects.filter(
+        order__created_at__gte=_midnight(start), order__created_at__lt=_midnight(end),
+    ).exclude(order__status='cancelled').annotate(
+        day=TruncDate('order__created_at'),
+    ).values('day', 'name').order_by().annotate(
+        units=Sum('quantity'),
+        revenue=Sum(F('price') * F('quantity'), output_field=DecimalField(max_digits=14, decimal_places=2)),
+    )
+
+    with transaction.atomic():
+        DailySales.objects.filter(date__gte=start, date__lt=end).delete()
+        DailyItemSales.objects.filter(date__gte=start, date__lt=end).delete()
+        sales = []
+        for row in days:
+            day = row.pop('day')
+            row['revenue'] = row['revenue'] or Decimal('0')
+            sales.append(DailySales(date=day, **row))
+        DailySales.objects.bulk_create(sales)
+        DailyItemSales.objects.bulk_create(
+            (DailyItemSales(date=row['day'], name=row['name'], units=row['units'], revenue=row['revenue'])
+             for row in items),
+            batch_size=1000,
+        )
+
+
+def _runs(days):
+    """Split days into ``(start, end)`` ranges of consecutive days, in order."""
+    runs = []
+    for day in sorted(days):
+        if runs and runs[-1][1] == day:
+            runs[-1][1] = day + timedelta(days=1)
+        else:
+            runs.append([day, day + timedelta(days=1)])
+    return runs
+
+
+def update_rollups(trailing_days=2):
+    """Fold orders and status changes past the high-water marks into the rollups.
+
+    Every day that received new orders is recomputed, and so is every day
+    holding an order whose status changed since the last run (a
+    cancellation weeks after the order was placed moves that day's
+    figures). The last ``trailing_days`` days are always recomputed too,
+    for changes that bypass the status history. Returns the ``(start,
+    end)`` span of the rebuilt days, or ``None``.
+    """
+    checkpoint, _ = RollupCheckpoint.objects.get_or_create(name=CHECKPOINT_NAME)
+    new = Order.objects.filter(id__gt=checkpoint.last_order_id).aggregate(
+        first=Min('created_at'), last=Max('created_at'), last_id=Max('id'),
+    )
+    last_history_id = OrderStatusHistory.objects.filter(
+        id__gt=checkpoint.last_history_id,
+    ).aggregate(last=Max('id'))['last']
+
+    today = timezone.localdate()
+    days = {today - timedelta(days=offset) for offset in range(trailing_days)}
+    if new['last_id'] is not None:
+        day, last = timezone.localdate(new['first']), timezone.localdate(new['last'])
+        while day <= last:
+            days.add(day)
+            day += timedelta(days=1)
+    if last_history_id is not None:
+        changed = OrderStatusHistory.objects.filter(
+            id__gt=checkpoint.last_history_id, id__lte=last_history_id,
+        ).values('order_id')
+        days.update(
+            Order.objects.filter(id__in=changed).annotate(day=TruncDate('created_at'))
+            .values_list('day', flat=True).order_by().distinct()
+        )
+    if not days:
+        return None
+
+    for start, end in _runs(days):
+        while start < end:
+            chunk_end = min(start + timedelta(days=CHUNK_DAYS), end)
+            rollup_days(start, chunk_end)
+            start = chunk_end
+
+    if new['last_id'] is not None or last_history_id is not None:
+        checkpoint.last_order_id = new['last_id'] or checkpoint.last_order_id
+        checkpoint.last_history_id = last_history_id or checkpoint.last_history_id
+        checkpoint.save()
+    return min(days), max(days) + timedelta(days=1)
+
+
+def rebuild_rollups():
+    """Drop every rollup and rebuild from the first order."""
+    DailySales.objects.all().delete()
+    DailyItemSales.objects.all().delete()
+    RollupCheckpoint.objects.filter(name=CHECKPOINT_NAME).delete()
+    return update_rollups()
@@ -0,0 +1,30 @@
+from rest_framework import serializers
+from .models import DailySales
+
+class DailySalesSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = DailySales
+        exclude = ('id',)
+
+class SalesTotalsSerializer(serializers.Serializer):
+    revenue = serializers.DecimalField(max_digits=14, decimal_places=2)
+    order_count = serializers.IntegerField()
+    cancelled_count = serializers.IntegerField()
+    delivery_count = serializers.IntegerField()
+    pickup_count = serializers.IntegerField()
+    cash_count = serializers.IntegerField()
+    card_count = serializers.IntegerField()
+
+class ItemSalesSerializer(serializers.Serializer):
+    name = serializers.CharField()
+    units = serializers.IntegerField()
+    revenue = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+class DateRangeSerializer(serializers.Serializer):
+    start = serializers.DateField()
+    end = serializers.DateField()
+
+    def validate(self, attrs):
+        if attrs['start'] > attrs['end']:
+            raise serializers.ValidationError('start must not be after end')
+        return attrs
@@ -0,0 +1,61 @@
+from datetime import datetime, time, timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from config.bulk import bulk_create_backdated
+from orders.models import Order
+from orders.transitions import transition_orders
+from .models import DailySales
+from .rollups import update_rollups
+
+
+def add_orders(day, count):
+    placed = timezone.make_aware(datetime.combine(day, time(12)))
+    return bulk_create_backdated(
+        Order(customer_name='Test', phone='0', delivery_method='pickup', payment_method='cash',
+              subtotal='10.00', total='10.00', created_at=placed, status_changed_at=placed)
+        for _ in range(count)
+    )
+
+
+class UpdateRollupsTestCase(TestCase):
+    def setUp(self):
+        today = timezone.localdate()
+        self.old, self.older = today - timedelta(days=10), today - timedelta(days=20)
+        self.old_orders = add_orders(self.old, 3)
+        self.older_orders = add_orders(self.older, 2)
+        update_rollups(trailing_days=0)
+
+    def sales(self, day):
+        return DailySales.objects.values_list('order_count', 'cancelled_count', 'revenue').get(date=day)
+
+    def test_late_cancellation_updates_its_day(self):
+        self.assertEqual(self.sales(self.old)[:2], (3, 0))
+        transition_orders([self.old_orders[0].id], 'cancelled')
+        self.assertEqual(update_rollups(trailing_days=0), (self.old, self.old + timedelta(days=1)))
+        self.assertEqual(self.sales(self.old), (2, 1, 20))
+
+    def test_only_changed_days_are_rebuilt(self):
+        # A marker an untouched day would lose if it were recomputed
+        DailySales.objects.filter(date=self.old - timedelta(days=5)).delete()
+        DailySales.objects.create(date=self.old - timedelta(days=5), order_count=99)
+        transition_orders([self.old_orders[0].id, self.older_orders[0].id], 'cancelled')
+        self.assertEqual(update_rollups(trailing_days=0), (self.older, self.old + timedelta(days=1)))
+        self.assertEqual(self.sales(self.older)[:2], (1, 1))
+        self.assertEqual(self.sales(self.old)[:2], (2, 1))
+        self.assertEqual(DailySales.objects.get(date=self.old - timedelta(days=5)).order_count, 99)
+
+    def test_status_changes_are_folded_once(self):
+        transition_orders([self.old_orders[0].id], 'cancelled')
+        update_rollups(trailing_days=0)
+        self.assertIsNone(update_rollups(trailing_days=0))
+
+    def test_new_orders_and_changes_together(self):
+        today = timezone.localdate()
+        add_orders(today, 4)
+        transition_orders([self.older_orders[0].id], 'confirmed')
+        transition_orders([self.older_orders[1].id], 'cancelled')
+        self.assertEqual(update_rollups(), (self.older, today + timedelta(days=1)))
+        self.assertEqual(self.sales(today)[:2], (4, 0))
+        self.assertEqual(self.sales(self.older)[:2], (1, 1))
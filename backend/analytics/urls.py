@@ -0,0 +1,7 @@
+from django.urls import path
+from .views import DailySalesView, ItemSalesView
+
+urlpatterns = [
+    path('daily/', DailySalesView.as_view(), name='analytics-daily'),
+    path('items/', ItemSalesView.as_view(), name='analytics-items'),
+]
@@ -0,0 +1,41 @@
+from django.db.models import Sum
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from .models import DailyItemSales, DailySales
+from .serializers import DailySalesSerializer, DateRangeSerializer, ItemSalesSerializer, SalesTotalsSerializer
+
+
+def _date_range(request):
+    query = DateRangeSerializer(data=request.query_params)
+    query.is_valid(raise_exception=True)
+    return query.validated_data['start'], query.validated_data['end']
+
+
+class DailySalesView(APIView):
+    """Daily sales rows for ``?start=YYYY-MM-DD&end=YYYY-MM-DD`` (inclusive)."""
+
+    def get(self, request, *args, **kwargs):
+        start, end = _date_range(request)
+        days = DailySales.objects.filter(date__range=(start, end))
+        totals = days.aggregate(
+            revenue=Sum('revenue'), order_count=Sum('order_count'), cancelled_count=Sum('cancelled_count'),
+            delivery_count=Sum('delivery_count'), pickup_count=Sum('pickup_count'),
+            cash_count=Sum('cash_count'), card_count=Sum('card_count'),
+        )
+        return Response({
+            'start': start,
+            'end': end,
+            'totals': SalesTotalsSerializer({key: value or 0 for key, value in totals.items()}).data,
+            'days': DailySalesSerializer(days, many=True).data,
+        })
+
+
+class ItemSalesView(APIView):
+    """Units and revenue per item over ``?start=&end=`` (inclusive), best sellers first."""
+
+    def get(self, request, *args, **kwargs):
+        start, end = _date_range(request)
+        items = DailyItemSales.objects.filter(date__range=(start, end)).values('name').order_by().annotate(
+            units=Sum('units'), revenue=Sum('revenue'),
+        ).order_by('-units', 'name')
+        return Response(ItemSalesSerializer(items, many=True).data)
@@ -0,0 +1,42 @@
+"""Shared setup for the benchmark scripts.
+
+Run them from ``backend/`` as ``python -m benchmarks.<name>``. Every run
+builds a throwaway in-memory test database, so ``db.sqlite3`` is never
+touched.
+"""
+import os
+import time
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+django.setup()
+
+from django.db import connection
+from django.test.utils import setup_test_environment
+
+
+def setup_database(path=None, **options):
+    """Create the test database, in memory unless a file ``path`` is given.
+
+    ``options`` are merged into the connection OPTIONS, e.g. to give
+    concurrent writers a busy timeout.
+    """
+    setup_test_environment()
+    if path:
+        connection.settings_dict['TEST']['NAME'] = str(path)
+    connection.settings_dict['OPTIONS'].update(options)
+    connection.creation.create_test_db(verbosity=0)
+
+
+def rate(fn, seconds=2.0):
+    """Call ``fn`` repeatedly for ``seconds`` and return calls per second."""
+    fn()  # warm up
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        fn()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= seconds:
+            return calls / elapsed
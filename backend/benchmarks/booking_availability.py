@@ -0,0 +1,62 @@
+"""Latency of /api/bookings/availability/ with 100k bookings on file.
+
+    python -m benchmarks.booking_availability --bookings 100000
+"""
+import argparse
+import random
+import time
+from datetime import date, time as dt_time, timedelta
+
+from benchmarks._setup import setup_database
+
+setup_database()
+
+from django.test import Client
+
+from bookings.availability import rebuild_occupancy
+from bookings.models import Booking, ServiceSlot
+
+
+def populate(count):
+    rng = random.Random(42)
+    slots = [dt_time(hour, minute) for hour in range(12, 23) for minute in (0, 30)]
+    ServiceSlot.objects.bulk_create(ServiceSlot(time=slot, capacity=60) for slot in slots)
+    start = date(2026, 1, 1)
+    Booking.objects.bulk_create(
+        (
+            Booking(
+                customer_name=f'Guest {i}', phone='0000000000', email=f'guest{i}@example.com',
+                date=start + timedelta(days=rng.randrange(365)), time=rng.choice(slots),
+                guests=rng.randint(1, 8), status=rng.choice(('pending', 'confirmed', 'cancelled')),
+            )
+            for i in range(count)
+        ),
+        batch_size=5000,
+    )
+    # bulk_create bypasses the signals that maintain the index
+    rebuild_occupancy()
+
+
+def main(count, requests):
+    populate(count)
+    client = Client()
+    timings = []
+    for i in range(requests):
+        day = date(2026, 1, 1) + timedelta(days=i % 365)
+        started = time.perf_counter()
+        response = client.get('/api/bookings/availability/', {'date': day.isoformat(), 'guests': 4})
+        timings.append((time.perf_counter() - started) * 1000)
+        assert response.status_code == 200
+    timings.sort()
+    print(f'{count} bookings, {requests} requests')
+    print(f'  p50 {timings[len(timings) // 2]:.2f} ms')
+    print(f'  p95 {timings[int(len(timings) * 0.95)]:.2f} ms')
+    print(f'  max {timings[-1]:.2f} ms')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--bookings', type=int, default=100_000)
+    parser.add_argument('--requests', type=int, default=500)
+    args = parser.parse_args()
+    main(args.bookings, args.requests)
@@ -0,0 +1,163 @@
+"""GET /api/dashboard/summary/ against the list downloads it replaces.
+
+Fills ``--days`` of history one day at a time on a fake clock (orders,
+bookings, contact messages, a stock room), then times:
+
+- the four lists the admin pages fetched to count things: orders, bookings,
+  stock and menu items,
+- the summary rebuilt on every call, after 30 days of history and again
+  after all of it, to show its cost does not grow,
+- the summary served from the cache.
+
+It also checks the query count, and that a new order, booking and message
+show up on the next read.
+
+    python -m benchmarks.dashboard_summary --days 365
+"""
+import argparse
+import random
+import time
+from datetime import time as dt_time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock
+
+from benchmarks._setup import setup_database
+
+setup_database()
+
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from bookings.models import Booking
+from contact.models import ContactMessage
+from dashboard.summary import get_summary, invalidate_summary
+from menu.models import MenuItem
+from orders.models import Order, OrderItem
+from orders.serializers import create_orders
+from stock.alerts import refresh_low_stock_alerts
+from stock.models import StockCategory, StockItem
+
+LISTS = ('/api/orders/', '/api/bookings/', '/api/stock/items/', '/api/menu/items/')
+
+
+def fill_day(day, orders, rng):
+    """One day of orders, bookings and messages, created "on" ``day``."""
+    with mock.patch('django.utils.timezone.now', lambda: day):
+        created = Order.objects.bulk_create(
+            Order(customer_name='History', phone='0', delivery_method=rng.choice(('delivery', 'pickup')),
+                  payment_method='card', subtotal=Decimal('20.00'), total=Decimal('20.00'),
+                  status=rng.choice(('delivered', 'picked-up', 'cancelled')), status_changed_at=day)
+            for _ in range(orders)
+        )
+        OrderItem.objects.bulk_create(
+            OrderItem(order=order, name='Burger', price=Decimal('10.00'), quantity=2) for order in created
+        )
+        Booking.objects.bulk_create(
+            Booking(customer_name='Guest', phone='0', email='g@example.com', date=day.date(), time=day.time(),
+                    guests=rng.randint(1, 8), status=rng.choice(('confirmed', 'cancelled')))
+            for _ in range(orders // 6)
+        )
+        ContactMessage.objects.bulk_create(
+            ContactMessage(name='Visitor', email='v@example.com', message='Thanks!', is_read=True)
+            for _ in range(orders // 15)
+        )
+
+
+def populate_static(rng):
+    category = StockCategory.objects.create(name='Pantry')
+    StockItem.objects.bulk_create(
+        StockItem(name=f'Ingredient {i}', quantity=Decimal(rng.randint(0, 500)), unit='kg', threshold=50,
+                  category=category)
+        for i in range(500)
+    )
+    refresh_low_stock_alerts()
+    MenuItem.objects.bulk_create(
+        MenuItem(name=f'Dish {i}', description='House special.', price='12.50', category=f'Category {i % 8}')
+        for i in range(150)
+    )
+
+
+def mean_ms(call, repeat=20):
+    call()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        call()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def uncached_ms():
+    def call():
+        invalidate_summary()
+        get_summary()
+    return mean_ms(call)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--orders-per-day', type=int, default=300)
+    args = parser.parse_args()
+    rng = random.Random(5)
+    populate_static(rng)
+    today = timezone.now().replace(hour=12, minute=0, second=0, microsecond=0, tzinfo=dt_timezone.utc)
+    start = today - timedelta(days=args.days)
+
+    timings = {}
+    for offset in range(args.days):
+        fill_day(start + timedelta(days=offset), args.orders_per_day, rng)
+        if offset + 1 == 30:
+            timings[Order.objects.count()] = uncached_ms()
+    timings[Order.objects.count()] = uncached_ms()
+    create_orders([{'customer_name': 'Today', 'phone': '0', 'delivery_method': 'pickup', 'payment_method': 'cash',
+                    'subtotal': Decimal('9.00'), 'total': Decimal('9.00'),
+                    'items': [{'name': 'Burger', 'price': Decimal('9.00'), 'quantity': 1}]}])
+
+    client = Client()
+    print(f'{Order.objects.count():,} orders, {Booking.objects.count():,} bookings, '
+          f'{ContactMessage.objects.count():,} messages')
+    total = 0
+    for path in LISTS:
+        response = client.get(path)
+        elapsed = mean_ms(lambda: b''.join(client.get(path)))
+        total += elapsed
+        print(f'  GET {path:20} {len(response.content):>10,} B {elapsed:8.1f} ms')
+    print(f'  four lists together                  {total:8.1f} ms')
+
+    invalidate_summary()
+    connection.queries_log.clear()  # filling history overflowed it; captured queries are counted from its length
+    with CaptureQueriesContext(connection) as queries:
+        get_summary()
+    rebuild_queries = len(queries)  # before the next request resets the query log
+    summary = client.get('/api/dashboard/summary/').json()
+    for orders, elapsed in timings.items():
+        print(f'  summary, rebuilt every call, {orders:>9,} orders: {elapsed:6.2f} ms')
+    cached = mean_ms(lambda: client.get('/api/dashboard/summary/'), repeat=200)
+    print(f'  summary from the cache: {cached:.2f} ms; {rebuild_queries} queries to rebuild it')
+    print(f'  {summary}')
+
+    before = client.get('/api/dashboard/summary/').json()
+    create_orders([{'customer_name': 'Today', 'phone': '0', 'delivery_method': 'pickup', 'payment_method': 'cash',
+                    'subtotal': Decimal('9.00'), 'total': Decimal('9.00'),
+                    'items': [{'name': 'Burger', 'price': Decimal('9.00'), 'quantity': 1}]}])
+    order = Order.objects.latest('id')
+    client.post('/api/orders/transition/', {'ids': [order.id], 'status': 'confirmed'},
+                content_type='application/json')
+    Booking.objects.create(customer_name='Soon', phone='0', email='s@example.com',
+                           date=timezone.localdate() + timedelta(days=1), time=dt_time(19), guests=2)
+    ContactMessage.objects.create(name='New', email='n@example.com', message='Hello')
+    after = client.get('/api/dashboard/summary/').json()
+    fresh = (
+        after['orders_today'] == before['orders_today'] + 1
+        and after['orders_by_status']['confirmed'] == before['orders_by_status']['confirmed'] + 1
+        and after['pending_bookings'] == before['pending_bookings'] + 1
+        and after['unread_messages'] == before['unread_messages'] + 1
+    )
+    print(f'  new order, booking and message visible on the next read: {fresh}')
+    if not fresh:
+        raise SystemExit('Dashboard summary was not invalidated')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+"""Accuracy and cost of the learned delivery ETAs (orders/eta.py).
+
+Simulates a kitchen on a fake clock. Orders arrive at a rate that swings
+between quiet spells and rushes. Each one is confirmed on arrival, which
+sets its ETA. ``--stations`` cooks take confirmed orders in kitchen-queue
+order, and each dish has a true per-portion prep time with noise. Delivery
+rides take their own noisy time. Every status change goes through
+``transition_orders``, so the estimator learns only from what the
+transitions tell it.
+
+After ``--warmup`` orders, each ETA is compared with when the order was
+actually delivered, or ready for pickup. The static baseline is the mean
+lead time per delivery method over the whole run, which is better than any
+fixed constant could do. The run also reports the cost of one estimate and
+the queries it takes.
+
+    python -m benchmarks.eta_accuracy --orders 2000
+"""
+import argparse
+import heapq
+import math
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock
+
+from benchmarks._setup import setup_database
+
+setup_database()
+
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from orders.eta import eta_estimator, order_items, set_estimated_arrival
+from orders.kitchen import kitchen_queue
+from orders.models import Order, PrepTimeStat
+from orders.serializers import create_orders
+from orders.transitions import transition_orders
+
+# True mean prep minutes per portion
+DISHES = {'Burger': 8, 'Pizza': 12, 'Salad': 4, 'Pasta': 10, 'Curry': 14, 'Fries': 3, 'Soup': 5, 'Cake': 2}
+RIDE_MINUTES = 18
+
+
+class Clock:
+    def __init__(self):
+        self.value = datetime(2026, 1, 1, 11, tzinfo=dt_timezone.utc)
+
+    def now(self):
+        return self.value
+
+
+def order_data(rng):
+    method = rng.choice(('delivery', 'pickup'))
+    dishes = rng.sample(sorted(DISHES), rng.randint(1, 3))
+    return {'customer_name': 'Sim', 'phone': '0', 'delivery_method': method, 'payment_method': 'cash',
+            'subtotal': Decimal('10.00'), 'total': Decimal('10.00'),
+            'items': [{'name': name, 'price': Decimal('5.00'), 'quantity': rng.randint(1, 2)} for name in dishes]}
+
+
+def noisy(rng, minutes):
+    return timedelta(minutes=minutes * rng.lognormvariate(0, 0.2))
+
+
+def simulate(orders, stations, warmup, rng, clock):
+    mean_work = statistics.mean(DISHES.values()) * 2 * 1.5  # 2 dishes of 1.5 portions
+    events = []  # (time, sequence, kind, order id)
+    sequence = 0
+
+    def schedule(at, kind, order_id=None):
+        nonlocal sequence
+        sequence += 1
+        heapq.heappush(events, (at, sequence, kind, order_id))
+
+    schedule(clock.value, 'arrive')
+    placed, free, predicted, actual, method = 0, stations, {}, {}, {}
+    while events:
+        clock.value, _, kind, order_id = heapq.heappop(events)
+        if kind == 'arrive':
+            order, = create_orders([order_data(rng)])
+            transition_orders([order.id], 'confirmed')
+            order.refresh_from_db(fields=['estimated_arrival'])
+            predicted[order.id], method[order.id] = order.estimated_arrival, order.delivery_method
+            placed += 1
+            if placed < orders:
+                # Load swings between 50% and 95% of the kitchen's capacity over a two-hour cycle
+                load = 0.725 + 0.225 * math.sin(placed / 20)
+                schedule(clock.value + timedelta(minutes=rng.expovariate(stations * load / mean_work)), 'arrive')
+        elif kind == 'done':
+            free += 1
+            order = Order.objects.get(pk=order_id)
+            if order.delivery_method == 'delivery':
+                transition_orders([order_id], 'out-for-delivery')
+                schedule(clock.value + noisy(rng, RIDE_MINUTES), 'delivered', order_id)
+            else:
+                transition_orders([order_id], 'ready-for-pickup')
+                transition_orders([order_id], 'picked-up')
+                actual[order_id] = clock.value
+        elif kind == 'delivered':
+            transition_orders([order_id], 'delivered')
+            actual[order_id] = clock.value
+
+        while free:
+            waiting = next((entry for entry in kitchen_queue.snapshot() if entry['status'] == 'confirmed'), None)
+            if waiting is None:
+                break
+            free -= 1
+            transition_orders([waiting['id']], 'preparing')
+            work = sum(item['quantity'] * DISHES[item['name']] for item in waiting['items'])
+            schedule(clock.value + noisy(rng, work), 'done', waiting['id'])
+
+    scored = sorted(predicted)[warmup:]
+    return scored, predicted, actual, method
+
+
+def errors(ids, prediction, actual):
+    return sorted(abs((prediction(order_id) - actual[order_id]).total_seconds()) / 60 for order_id in ids)
+
+
+def report(label, minutes):
+    p90 = minutes[int(len(minutes) * 0.9)]
+    print(f'  {label:22} mean abs error {statistics.mean(minutes):5.1f} min, p90 {p90:5.1f} min')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--orders', type=int, default=2000)
+    parser.add_argument('--warmup', type=int, default=300)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+    stations = settings.ETA_KITCHEN_STATIONS
+    rng, clock = random.Random(args.seed), Clock()
+
+    started = time.perf_counter()
+    with mock.patch('django.utils.timezone.now', clock.now):
+        scored, predicted, actual, method = simulate(args.orders, stations, args.warmup, rng, clock)
+    print(f'{args.orders} simulated orders, {stations} stations, in {time.perf_counter() - started:.1f} s; '
+          f'scoring the last {len(scored)}')
+
+    created = dict(Order.objects.filter(id__in=scored).values_list('id', 'created_at'))
+    lead = {m: statistics.mean((actual[i] - created[i]).total_seconds() for i in scored if method[i] == m)
+            for m in ('delivery', 'pickup')}
+    learned = errors(scored, predicted.get, actual)
+    static = errors(scored, lambda i: created[i] + timedelta(seconds=lead[method[i]]), actual)
+    report('learned, load-aware', learned)
+    report('static mean lead time', static)
+
+    eta_estimator.flush(force=True)
+    stats = {key: seconds / 60 for key, seconds in PrepTimeStat.objects.values_list('key', 'seconds')}
+    print('  learned minutes per portion: ' + ', '.join(
+        f'{name} {stats.get(name, 0):.1f} (true {minutes})' for name, minutes in DISHES.items()))
+
+    # Cost of one estimate with a busy kitchen: 200 orders waiting
+    create_orders([order_data(rng) for _ in range(200)])
+    order, = create_orders([order_data(rng)])
+    queue, items = kitchen_queue.snapshot(), order_items(order)
+    calls, started = 0, time.perf_counter()
+    while time.perf_counter() - started < 1:
+        eta_estimator.estimate(order, items, queue, clock.value)
+        calls += 1
+    elapsed = time.perf_counter() - started
+    connection.queries_log.clear()  # the simulation filled it; captured queries are counted from its length
+    with CaptureQueriesContext(connection) as queries:
+        set_estimated_arrival(order)
+    print(f'  estimate over {len(queue)} queued orders: {elapsed / calls * 1e6:.0f} us; '
+          f'set_estimated_arrival ran {len(queries)} query ({queries[0]["sql"].split()[0]})')
+    if statistics.mean(learned) >= statistics.mean(static):
+        raise SystemExit('Learned ETAs are no better than the static baseline')
+
+
+if __name__ == '__main__':
+    main()
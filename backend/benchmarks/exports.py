@@ -0,0 +1,94 @@
+"""Memory use of the streaming exports as the row count grows.
+
+Exports a growing number of contact messages (and orders with items)
+through the real endpoints and records the Python heap peak while the
+body is consumed. A flat peak from 100k to 1M rows is the point.
+
+    python -m benchmarks.exports --rows 1000000
+"""
+import argparse
+import time
+import tracemalloc
+from datetime import timedelta
+from decimal import Decimal
+
+from benchmarks._setup import setup_database
+
+setup_database()
+
+from django.db import transaction
+from django.test import Client
+from django.utils import timezone
+
+from config.bulk import bulk_create_backdated
+from contact.models import ContactMessage
+from orders.models import Order, OrderItem
+
+CHUNK = 50_000
+
+
+def add_messages(count, start):
+    now = timezone.now()
+    for offset in range(0, count, CHUNK):
+        bulk_create_backdated(
+            ContactMessage(name=f'Visitor {start + i}', email=f'v{start + i}@example.com',
+                           subject='Feedback', message='Lovely dinner, thank you!',
+                           created_at=now - timedelta(seconds=start + i))
+            for i in range(offset, min(offset + CHUNK, count))
+        )
+
+
+def add_orders(count):
+    for offset in range(0, count, CHUNK):
+        with transaction.atomic():
+            orders = Order.objects.bulk_create(
+                Order(customer_name='Bench', phone='0', delivery_method='pickup', payment_method='card',
+                      subtotal=Decimal('20.00'), total=Decimal('20.00'))
+                for _ in range(min(CHUNK, count - offset))
+            )
+            OrderItem.objects.bulk_create(
+                OrderItem(order=order, name=name, price=Decimal('10.00'), quantity=1)
+                for order in orders for name in ('Dish', 'Dessert')
+            )
+
+
+def measure(client, path):
+    tracemalloc.start()
+    started = time.perf_counter()
+    response = client.get(path)
+    size = lines = 0
+    for chunk in response.streaming_content:
+        size += len(chunk)
+        lines += chunk.count(b'\n')
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return lines, size, elapsed, peak
+
+
+def report(label, result):
+    lines, size, elapsed, peak = result
+    print(f'{label:34} {lines:>10,} lines {size / 2**20:8.1f} MiB {elapsed:7.1f} s   peak heap {peak / 2**20:6.1f} MiB')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--orders', type=int, default=200_000)
+    args = parser.parse_args()
+    client = Client()
+
+    done = 0
+    for target in sorted({min(100_000, args.rows), args.rows}):
+        add_messages(target - done, done)
+        done = target
+        report(f'contact csv, {target:,} rows', measure(client, '/api/contact/messages/export/'))
+        report(f'contact ndjson, {target:,} rows', measure(client, '/api/contact/messages/export/?format=ndjson'))
+
+    add_orders(args.orders)
+    report(f'orders csv, {args.orders:,} orders', measure(client, '/api/orders/export/'))
+    report(f'orders ndjson, {args.orders:,} orders', measure(client, '/api/orders/export/?format=ndjson'))
+
+
+if __name__ == '__main__':
+    main()
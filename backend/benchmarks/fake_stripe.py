@@ -0,0 +1,99 @@
+"""A local stand-in for the parts of the Stripe API the gateway uses.
+
+Serves ``POST /v1/payment_intents`` (honouring ``Idempotency-Key``) and
+``GET /v1/payment_intents/<id>`` from memory, with optional added latency
+so timeouts and connection reuse can be measured without the network:
+
+    server = FakeStripe(latency=0.05).start()
+    settings.STRIPE_API_BASE = server.url
+"""
+import itertools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+
+class FakeStripe:
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.intents = {}
+        self.by_key = {}
+        self.calls = 0
+        self.connections = 0
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._server.daemon_threads = True
+
+    @property
+    def url(self):
+        return f'http://127.0.0.1:{self._server.server_address[1]}'
+
+    def start(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def create_intent(self, form, key):
+        with self._lock:
+            if key and key in self.by_key:
+                return self.by_key[key]
+            intent_id = f'pi_fake_{next(self._ids)}'
+            intent = {
+                'id': intent_id, 'object': 'payment_intent', 'status': 'requires_payment_method',
+                'amount': int(form['amount']), 'currency': form['currency'],
+                'client_secret': f'{intent_id}_secret',
+                'metadata': {k[len('metadata['):-1]: v for k, v in form.items() if k.startswith('metadata[')},
+            }
+            self.intents[intent_id] = intent
+            if key:
+                self.by_key[key] = intent
+            return intent
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body go out in separate writes; don't let keep-alive stall on them
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with fake._lock:
+                    fake.connections += 1
+
+            def log_message(self, format, *args):
+                pass
+
+            def reply(self, status, body):
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                form = {k: v[0] for k, v in parse_qs(self.rfile.read(length).decode()).items()}
+                fake.calls += 1
+                time.sleep(fake.latency)
+                if self.path != '/v1/payment_intents':
+                    return self.reply(404, {'error': {'message': 'Unrecognized request URL'}})
+                self.reply(200, fake.create_intent(form, self.headers.get('Idempotency-Key')))
+
+            def do_GET(self):
+                fake.calls += 1
+                time.sleep(fake.latency)
+                intent = fake.intents.get(self.path.rsplit('/', 1)[-1])
+                if intent is None:
+                    return self.reply(404, {'error': {'message': 'No such payment_intent', 'type': 'invalid_request_error'}})
+                self.reply(200, intent)
+
+        return Handler
@@ -0,0 +1,137 @@
+"""values()-based list responses vs the ModelSerializers they replace.
+
+Fills every list endpoint with ``--rows`` rows (nullable columns left empty
+in some of them), then checks that each list, rendered to JSON, is
+byte-for-byte what the viewset's serializer produces, in UTC and in a
++05:30 time zone and across order cursor pages. Then times both paths.
+
+    python -m benchmarks.fast_lists --rows 10000
+"""
+import argparse
+import random
+from datetime import date, time as dt_time, timedelta
+from decimal import Decimal
+
+from benchmarks._setup import rate, setup_database
+
+setup_database()
+
+from django.db.models import F
+from django.test import RequestFactory
+from django.utils import timezone
+from rest_framework import viewsets
+from rest_framework.renderers import JSONRenderer
+
+from bookings.models import Booking
+from bookings.views import BookingViewSet
+from contact.models import ContactMessage
+from contact.views import ContactMessageViewSet
+from orders.models import Order, OrderItem
+from orders.views import OrderViewSet
+from stock.models import LowStockAlert, StockCategory, StockItem
+from stock.views import LowStockAlertViewSet, StockCategoryViewSet, StockItemViewSet
+
+VIEWSETS = {
+    '/api/orders/?page_size=200': OrderViewSet,
+    '/api/bookings/': BookingViewSet,
+    '/api/contact/messages/': ContactMessageViewSet,
+    '/api/stock/items/': StockItemViewSet,
+    '/api/stock/categories/': StockCategoryViewSet,
+    '/api/stock/alerts/': LowStockAlertViewSet,
+}
+
+
+def populate(count, rng):
+    orders = Order.objects.bulk_create(
+        Order(customer_name=f'Customer {i} é', phone=f'07{i:08d}', address=None if i % 3 else f'{i} Main St',
+              delivery_method=rng.choice(('delivery', 'pickup')), payment_method=rng.choice(('cash', 'card')),
+              subtotal=Decimal(rng.randint(100, 99_999)) / 100, delivery_fee=Decimal('5.00') if i % 2 else 0,
+              total=Decimal(rng.randint(100, 99_999)) / 100, status=rng.choice(Order.ACTIVE_STATUSES),
+              estimated_arrival=timezone.now() + timedelta(minutes=i) if i % 4 else None)
+        for i in range(count)
+    )
+    OrderItem.objects.bulk_create(
+        OrderItem(order=order, name=f'Dish {n}', price=Decimal(rng.randint(100, 5000)) / 100,
+                  quantity=rng.randint(1, 4), image=None if n % 2 else f'https://images.example.com/{n}.jpg')
+        for order in orders for n in range(rng.randint(1, 4))
+    )
+    Booking.objects.bulk_create(
+        Booking(customer_name=f'Guest {i}', phone='0', email=f'guest{i}@example.com',
+                date=date.today() + timedelta(days=i % 60), time=dt_time(12 + i % 10, 30 * (i % 2)),
+                guests=rng.randint(1, 10), status=rng.choice(('pending', 'confirmed', 'cancelled')),
+                special_request=None if i % 5 else 'Window seat')
+        for i in range(count)
+    )
+    ContactMessage.objects.bulk_create(
+        ContactMessage(name=f'Visitor {i}', email=f'v{i}@example.com', phone=None if i % 2 else '0',
+                       subject=None if i % 3 else 'Hello', message='Lovely dinner, thank you! ' * 3)
+        for i in range(count)
+    )
+    categories = StockCategory.objects.bulk_create(StockCategory(name=f'Category {i}') for i in range(20))
+    items = StockItem.objects.bulk_create(
+        StockItem(name=f'Ingredient {i}', quantity=Decimal(rng.randint(0, 100_000)) / 100, unit='kg',
+                  threshold=rng.randint(0, 50), category=categories[i % 20])
+        for i in range(count)
+    )
+    LowStockAlert.objects.bulk_create(
+        LowStockAlert(stock_item=item, quantity=item.quantity, threshold=item.threshold) for item in items[::10]
+    )
+
+
+def before_view(viewset):
+    # The same viewset without ValuesListMixin, i.e. list() through the serializer
+    serializer_class = viewset.serializer_class
+    plain = type(f'Serializer{viewset.__name__}', (viewsets.ModelViewSet,), {
+        'queryset': viewset.queryset, 'serializer_class': serializer_class,
+        'pagination_class': viewset.pagination_class,
+    })
+    return plain.as_view({'get': 'list'})
+
+
+def render(view, factory, path):
+    response = view(factory.get(path))
+    response.accepted_renderer = JSONRenderer()
+    return response.render().content
+
+
+def check_parity(factory):
+    ok = True
+    for tz in ('UTC', 'Asia/Colombo'):
+        with timezone.override(tz):
+            for path, viewset in VIEWSETS.items():
+                before, after = before_view(viewset), viewset.as_view({'get': 'list'})
+                same = render(before, factory, path) == render(after, factory, path)
+                ok &= same
+                print(f'  parity {tz:12} {path:28} {same}')
+    # A later cursor page, and the low-stock action
+    cursor = OrderViewSet.as_view({'get': 'list'})(factory.get('/api/orders/?page_size=200')).data['next']
+    page = cursor.replace('http://testserver', '')
+    same = render(before_view(OrderViewSet), factory, page) == render(OrderViewSet.as_view({'get': 'list'}), factory, page)
+    print(f'  parity second order page {same}')
+    low = StockItemViewSet.queryset.filter(quantity__lte=F('threshold'))
+    low_same = JSONRenderer().render(StockItemViewSet.serializer_class(low, many=True).data) == render(
+        StockItemViewSet.as_view({'get': 'low'}), factory, '/api/stock/items/low/')
+    print(f'  parity {low.count()} low stock items {low_same}')
+    return ok and same and low_same
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=10_000)
+    parser.add_argument('--seconds', type=float, default=3)
+    args = parser.parse_args()
+    populate(args.rows, random.Random(3))
+    factory = RequestFactory()
+
+    print(f'{args.rows} rows per table')
+    if not check_parity(factory):
+        raise SystemExit('values() lists differ from the serializers')
+    for path, viewset in VIEWSETS.items():
+        before, after = before_view(viewset), viewset.as_view({'get': 'list'})
+        old = rate(lambda: render(before, factory, path), args.seconds)
+        new = rate(lambda: render(after, factory, path), args.seconds)
+        print(f'  {path:28} serializer {old:8.1f} req/s, values() {new:8.1f} req/s ({new / old:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
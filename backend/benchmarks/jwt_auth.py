@@ -0,0 +1,66 @@
+"""Authenticated request cost: simplejwt's DB lookup vs token claims.
+
+Hits a cheap admin endpoint with a bearer token under both
+authentication classes and reports queries and requests per second.
+Queries are counted on a second request, once the claims path has the
+user's row in its per-process cache.
+
+    python -m benchmarks.jwt_auth
+"""
+from benchmarks._setup import rate, setup_database
+
+setup_database()
+
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.utils.module_loading import import_string
+from rest_framework.views import APIView
+
+from stock.models import StockCategory
+from users.authentication import is_revoked
+from users.models import CustomUser
+from users.serializers import MyTokenObtainPairSerializer
+
+ROUNDS = 3
+PATH = '/api/stock/categories/'
+MODES = {
+    'JWTAuthentication (DB row)': 'rest_framework_simplejwt.authentication.JWTAuthentication',
+    'ClaimsJWTAuthentication': 'users.authentication.ClaimsJWTAuthentication',
+}
+
+
+def measure(client, token):
+    headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+    client.get(PATH, **headers)
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(PATH, **headers)
+    assert response.status_code == 200, response.status_code
+    return len(queries), rate(lambda: client.get(PATH, **headers), seconds=1)
+
+
+def main():
+    StockCategory.objects.bulk_create(StockCategory(name=f'Category {i}') for i in range(5))
+    admin = CustomUser.objects.create_user(email='admin@example.com', password='x', name='Admin', is_admin=True)
+    token = str(MyTokenObtainPairSerializer.get_token(admin).access_token)
+
+    results = {}
+    for _ in range(ROUNDS):
+        for label, auth_class in MODES.items():
+            # Views copy the setting at import time, so swap it on the base class
+            APIView.authentication_classes = [import_string(auth_class)]
+            queries, per_second = measure(Client(), token)
+            best = results.get(label, (queries, 0))[1]
+            results[label] = (queries, max(best, per_second))
+
+    for label, (queries, per_second) in results.items():
+        print(f'{label:28} {queries} queries/request   {per_second:8.1f} req/s')
+
+    admin.is_active = False
+    admin.save(update_fields=['is_active'])
+    status = Client().get(PATH, HTTP_AUTHORIZATION=f'Bearer {token}').status_code
+    print(f'after deactivation: revoked={is_revoked(admin.pk)}, request status {status}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""Kitchen display reads: in-process queue vs querying the orders table.
+
+Fills the database with ``--history`` finished orders plus ``--active``
+orders still in the kitchen, then compares reading the kitchen view from
+``kitchen_queue`` with running the equivalent query on every read. It also
+checks that bumps and writes from another worker keep the queue exact.
+
+    python -m benchmarks.kitchen_queue --history 200000 --active 60
+"""
+import argparse
+import random
+from decimal import Decimal
+
+from benchmarks._setup import rate, setup_database
+
+setup_database()
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from orders.kitchen import KITCHEN_VERSION_KEY, entry, item_entries, kitchen_queue, priority
+from orders.models import Order, OrderItem
+from orders.serializers import create_orders
+
+FINISHED = ('delivered', 'picked-up', 'cancelled')
+
+
+def order_data(rng, status='pending'):
+    return {'customer_name': 'Kitchen', 'phone': '0', 'delivery_method': rng.choice(('delivery', 'pickup')),
+            'payment_method': 'cash', 'subtotal': Decimal('10.00'), 'total': Decimal('10.00'), 'status': status,
+            'items': [{'name': f'Dish {n}', 'price': Decimal('10.00'), 'quantity': rng.randint(1, 3)}
+                      for n in range(rng.randint(1, 4))]}
+
+
+def populate(history, active, rng):
+    batch = 5000
+    for start in range(0, history, batch):
+        orders = Order.objects.bulk_create(
+            Order(customer_name='Past', phone='0', delivery_method=rng.choice(('delivery', 'pickup')),
+                  payment_method='cash', subtotal=Decimal('10.00'), total=Decimal('10.00'),
+                  status=rng.choice(FINISHED))
+            for _ in range(min(batch, history - start))
+        )
+        OrderItem.objects.bulk_create(
+            OrderItem(order=order, name='Dish', price=Decimal('10.00'), quantity=1) for order in orders
+        )
+    create_orders([order_data(rng, rng.choice(Order.KITCHEN_STATUSES)) for _ in range(active)])
+
+
+def query_kitchen():
+    orders = Order.objects.filter(status__in=Order.KITCHEN_STATUSES).prefetch_related('items')
+    rows = [(priority(order), entry(order, item_entries(order.items.all()))) for order in orders]
+    return [row for _, row in sorted(rows, key=lambda row: row[0])]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--history', type=int, default=200_000)
+    parser.add_argument('--active', type=int, default=60)
+    parser.add_argument('--seconds', type=float, default=2)
+    args = parser.parse_args()
+    rng = random.Random(7)
+
+    populate(args.history, args.active, rng)
+    client = Client()
+    kitchen = Order.objects.filter(status__in=Order.KITCHEN_STATUSES).order_by('created_at', 'id')
+    sql, params = kitchen.query.sql_with_params()
+    plan = connection.cursor().execute('EXPLAIN QUERY PLAN ' + sql, params).fetchall()
+    plan = ' + '.join(row[-1] for row in plan)
+    print(f'{args.history} finished orders, {args.active} in the kitchen; rebuild plan: {plan}')
+
+    kitchen_queue.snapshot()
+    with CaptureQueriesContext(connection) as queries:
+        kitchen_queue.snapshot()
+    print(f'queries per read: queue {len(queries)}', end=', ')
+    with CaptureQueriesContext(connection) as queries:
+        query_kitchen()
+    print(f'query {len(queries)}')
+
+    queued = rate(kitchen_queue.snapshot, args.seconds)
+    queried = rate(query_kitchen, args.seconds)
+    print(f'read:  queue {queued:,.0f}/s, query {queried:,.0f}/s ({queued / queried:.0f}x)')
+    queued = rate(lambda: client.get('/api/orders/kitchen/'), args.seconds)
+    print(f'GET /api/orders/kitchen/ {queued:,.0f} req/s')
+
+    ids = [row['id'] for row in kitchen_queue.snapshot()[:10]]
+    response = client.post('/api/orders/kitchen/bump/', {'ids': ids + [0]}, content_type='application/json')
+    create_orders([order_data(rng) for _ in range(5)])
+    print(f'bump 10 + unknown id: HTTP {response.status_code}; '
+          f'queue matches table after bumps and new orders: {kitchen_queue.snapshot() == query_kitchen()}')
+
+    # Another worker moves an order on and bumps the shared version
+    Order.objects.filter(pk=kitchen_queue.snapshot()[0]['id']).update(status='cancelled')
+    cache.set(KITCHEN_VERSION_KEY, 0, timeout=None)
+    print(f'queue matches table after a write from another worker: {kitchen_queue.snapshot() == query_kitchen()}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,274 @@
+"""HTTP load test for every API router.
+
+Boots the app on a local threaded WSGI server against a dataset from the
+``generate_data`` command in a throwaway SQLite file. It then drives each scenario below at the given
+concurrency and prints (or writes) a JSON report with throughput,
+p50/p95/p99 latency and SQL queries per request. Reports from different
+commits can be diffed directly:
+
+    python -m benchmarks.loadtest --concurrency 8 --requests 400 --output bench.json
+    python -m benchmarks.loadtest --only orders_list --only menu_list
+
+Stripe calls go to the local fake in ``benchmarks/fake_stripe.py``, so the
+payments scenario never leaves the machine.
+"""
+import argparse
+import http.client
+import io
+import itertools
+import json
+import logging
+import platform
+import random
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+
+from benchmarks._setup import setup_database
+from benchmarks.fake_stripe import FakeStripe
+
+setup_database(Path(tempfile.mkdtemp()) / 'loadtest.sqlite3', transaction_mode='IMMEDIATE', timeout=30)
+
+import django
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management import call_command
+from django.core.servers.basehttp import ThreadedWSGIServer, WSGIRequestHandler
+from django.db import connection
+
+from menu.models import MenuItem
+from orders.models import Order
+from users.models import CustomUser
+
+LOGIN_EMAIL = 'loadtest@example.com'
+LOGIN_PASSWORD = 'load-test-password'
+
+
+# --- dataset -----------------------------------------------------------------
+
+def populate(sizes, seed=1):
+    call_command('generate_data', seed=seed, orders=sizes['orders'], menu_items=sizes['menu_items'],
+                 stock_items=sizes['stock_items'], bookings=sizes['bookings'], users=sizes['users'],
+                 messages=sizes['messages'], stdout=io.StringIO())
+    CustomUser.objects.create_user(email=LOGIN_EMAIL, password=LOGIN_PASSWORD, name='Load Test', is_admin=True)
+
+
+# --- stubs and server --------------------------------------------------------
+
+def start_fake_stripe():
+    from payments import gateway
+
+    fake = FakeStripe().start()
+    settings.STRIPE_API_BASE = fake.url
+    gateway.reset_client()
+    return fake
+
+
+class QueryCountingHandler(WSGIHandler):
+    """Adds an ``X-Query-Count`` header with the SQL statements the request ran."""
+
+    def __call__(self, environ, start_response):
+        count = [0]
+
+        def counter(execute, sql, params, many, context):
+            count[0] += 1
+            return execute(sql, params, many, context)
+
+        def counting_start_response(status, headers, exc_info=None):
+            return start_response(status, headers + [('X-Query-Count', str(count[0]))], exc_info)
+
+        with connection.execute_wrapper(counter):
+            return super().__call__(environ, counting_start_response)
+
+
+class QuietRequestHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server():
+    settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, '127.0.0.1']
+    # Failures are tallied per status code in the report instead
+    logging.getLogger('django.request').setLevel(logging.CRITICAL)
+    server = ThreadedWSGIServer(('127.0.0.1', 0), QuietRequestHandler, allow_reuse_address=False)
+    server.set_app(QueryCountingHandler())
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# --- scenarios ---------------------------------------------------------------
+
+def order_payload(rng, dishes):
+    name, price = rng.choice(dishes)
+    return {
+        'customer_name': 'Load Test', 'phone': '0000000000', 'address': '1 Main St',
+        'delivery_method': 'delivery', 'payment_method': 'card',
+        'subtotal': str(price * 2), 'delivery_fee': '5.00', 'total': str(price * 2 + 5),
+        'items': [{'name': name, 'price': str(price), 'quantity': 2}],
+    }
+
+
+def build_scenarios():
+    """Name -> callable(rng) returning ``(method, path, body)``."""
+    ids = {
+        'menu': list(MenuItem.objects.values_list('id', flat=True)[:1000]),
+        'orders': list(Order.objects.values_list('id', flat=True)[:1000]),
+    }
+    dishes = list(MenuItem.objects.values_list('name', 'price')[:50])
+    payable = itertools.cycle(ids['orders'])
+    today = date.today()
+    return {
+        'menu_list': lambda rng: ('GET', '/api/menu/items/', None),
+        'menu_detail': lambda rng: ('GET', f"/api/menu/items/{rng.choice(ids['menu'])}/", None),
+        'orders_list': lambda rng: ('GET', '/api/orders/', None),
+        'orders_detail': lambda rng: ('GET', f"/api/orders/{rng.choice(ids['orders'])}/", None),
+        'orders_create': lambda rng: ('POST', '/api/orders/', order_payload(rng, dishes)),
+        'bookings_list': lambda rng: ('GET', '/api/bookings/', None),
+        'bookings_availability': lambda rng: (
+            'GET', f'/api/bookings/availability/?date={today + timedelta(days=rng.randrange(60))}&guests=4', None),
+        'bookings_create': lambda rng: ('POST', '/api/bookings/', {
+            'customer_name': 'Load Test', 'phone': '0000000000', 'email': 'load@example.com',
+            'date': str(today + timedelta(days=rng.randrange(60))), 'time': '19:00', 'guests': 4}),
+        'stock_categories': lambda rng: ('GET', '/api/stock/categories/', None),
+        'stock_items': lambda rng: ('GET', '/api/stock/items/', None),
+        'stock_low': lambda rng: ('GET', '/api/stock/items/low/', None),
+        'stock_alerts': lambda rng: ('GET', '/api/stock/alerts/', None),
+        'contact_list': lambda rng: ('GET', '/api/contact/messages/', None),
+        'contact_create': lambda rng: ('POST', '/api/contact/messages/', {
+            'name': 'Load Test', 'email': 'load@example.com', 'message': 'Hello'}),
+        'users_login': lambda rng: ('POST', '/api/users/login/', {
+            'email': LOGIN_EMAIL, 'password': LOGIN_PASSWORD}),
+        'payments_create_intent': lambda rng: ('POST', '/api/payments/create-intent/', {
+            'order_id': next(payable)}),
+        'analytics_daily': lambda rng: (
+            'GET', f'/api/analytics/daily/?start={today - timedelta(days=30)}&end={today}', None),
+    }
+
+
+# --- driver ------------------------------------------------------------------
+
+def request(port, method, path, body):
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+    headers = {'Accept': 'application/json'}
+    payload = None
+    if body is not None:
+        payload = json.dumps(body)
+        headers['Content-Type'] = 'application/json'
+    started = time.perf_counter()
+    try:
+        conn.request(method, path, payload, headers)
+        response = conn.getresponse()
+        response.read()
+        elapsed = time.perf_counter() - started
+        return elapsed, response.status, int(response.getheader('X-Query-Count', 0))
+    finally:
+        conn.close()
+
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run_scenario(port, scenario, requests, concurrency, seed):
+    rngs = [random.Random(seed + i) for i in range(requests)]
+    results = []
+
+    def one(rng):
+        return request(port, *scenario(rng))
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        started = time.perf_counter()
+        results = list(pool.map(one, rngs))
+        wall = time.perf_counter() - started
+
+    latencies = sorted(elapsed * 1000 for elapsed, _, _ in results)
+    errors = sum(1 for _, status, _ in results if status >= 400)
+    status_codes = {}
+    for _, status, _ in results:
+        status_codes[str(status)] = status_codes.get(str(status), 0) + 1
+    return {
+        'requests': requests,
+        'errors': errors,
+        'status_codes': status_codes,
+        'throughput_rps': round(requests / wall, 1),
+        'latency_ms': {
+            'mean': round(statistics.fmean(latencies), 2),
+            'p50': round(percentile(latencies, 0.50), 2),
+            'p95': round(percentile(latencies, 0.95), 2),
+            'p99': round(percentile(latencies, 0.99), 2),
+        },
+        'queries_per_request': round(statistics.fmean(q for _, _, q in results), 2),
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=200, help='requests per scenario')
+    parser.add_argument('--only', action='append', help='run just these scenarios (repeatable)')
+    parser.add_argument('--menu-items', type=int, default=200)
+    parser.add_argument('--orders', type=int, default=20_000)
+    parser.add_argument('--bookings', type=int, default=20_000)
+    parser.add_argument('--stock-items', type=int, default=500)
+    parser.add_argument('--users', type=int, default=1_000)
+    parser.add_argument('--messages', type=int, default=5_000)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help='write the JSON report here instead of stdout')
+    args = parser.parse_args()
+
+    sizes = {'menu_items': args.menu_items, 'orders': args.orders, 'bookings': args.bookings,
+             'stock_items': args.stock_items, 'users': args.users, 'messages': args.messages}
+    populate(sizes, seed=args.seed)
+    fake_stripe = start_fake_stripe()
+    server = start_server()
+    port = server.server_address[1]
+
+    scenarios = build_scenarios()
+    unknown = set(args.only or ()) - set(scenarios)
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(sorted(unknown))}")
+
+    report = {
+        'meta': {
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'concurrency': args.concurrency,
+            'requests_per_scenario': args.requests,
+            'dataset': sizes,
+            'seed': args.seed,
+        },
+        'results': {},
+    }
+    try:
+        for name, scenario in scenarios.items():
+            if args.only and name not in args.only:
+                continue
+            report['results'][name] = run_scenario(port, scenario, args.requests, args.concurrency, args.seed)
+    finally:
+        server.shutdown()
+        fake_stripe.stop()
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
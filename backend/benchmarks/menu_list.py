@@ -0,0 +1,61 @@
+"""Requests/sec for GET /api/menu/items/ before and after the cached snapshot.
+
+    python -m benchmarks.menu_list
+"""
+from benchmarks._setup import rate, setup_database
+
+setup_database()
+
+from django.test import RequestFactory
+from rest_framework import viewsets
+
+from menu.cache import bump_menu_version
+from menu.models import MenuItem
+from menu.serializers import MenuItemSerializer
+from menu.views import menu_items
+
+
+class UncachedMenuItemViewSet(viewsets.ModelViewSet):
+    queryset = MenuItem.objects.all()
+    serializer_class = MenuItemSerializer
+
+
+def populate(count):
+    MenuItem.objects.all().delete()
+    MenuItem.objects.bulk_create(
+        MenuItem(
+            name=f'Item {i}',
+            description='Slow-cooked, hand-pressed and served with house sauce.',
+            price='12.50',
+            category=f'Category {i % 12}',
+            image=f'https://images.example.com/menu/{i}.jpg',
+        )
+        for i in range(count)
+    )
+    # bulk_create skips post_save, so bump the version by hand
+    bump_menu_version()
+
+
+def main():
+    factory = RequestFactory()
+    before = UncachedMenuItemViewSet.as_view({'get': 'list'})
+    after = menu_items
+
+    def hit(view, **headers):
+        def request():
+            response = view(factory.get('/api/menu/items/', headers=headers))
+            if hasattr(response, 'render'):
+                response.render()
+        return request
+
+    for count in (1_000, 10_000):
+        populate(count)
+        etag = after(factory.get('/api/menu/items/'))['ETag']
+        print(f'{count} items')
+        print(f'  before (serialize every hit): {rate(hit(before)):10.1f} req/s')
+        print(f'  after  (cached snapshot):     {rate(hit(after)):10.1f} req/s')
+        print(f'  after  (If-None-Match, 304):  {rate(hit(after, if_none_match=etag)):10.1f} req/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""GET /api/menu/items/: prebuilt, precompressed payload vs rendering the snapshot through DRF.
+
+"viewset" is the list action as it was before the payload was prebuilt:
+the cached snapshot handed to ``Response`` and rendered by ``JSONRenderer``
+on every hit. "prebuilt" is ``menu_items``, which sends stored bytes. For
+each Accept-Encoding it reports bytes on the wire, CPU time per request and
+the time to build a snapshot.
+
+    python -m benchmarks.menu_payload --items 1000
+"""
+import argparse
+import json
+import time
+
+from benchmarks._setup import setup_database
+
+setup_database()
+
+from django.test import RequestFactory
+from rest_framework import viewsets
+from rest_framework.response import Response
+
+from menu import cache
+from menu.models import MenuItem
+from menu.views import menu_items
+
+ACCEPT = {
+    'none': '',
+    'gzip': 'gzip, deflate',
+    'browser': 'gzip, deflate, br, zstd',
+}
+
+
+class SnapshotViewSet(viewsets.GenericViewSet):
+    def list(self, request):
+        snapshot = cache.get_menu_snapshot()
+        return Response(json.loads(snapshot['bodies']['identity']))
+
+
+def populate(count):
+    MenuItem.objects.bulk_create(
+        MenuItem(
+            name=f'Item {i}',
+            description='Slow-cooked, hand-pressed and served with house sauce.',
+            price='12.50',
+            category=f'Category {i % 12}',
+            image=f'https://images.example.com/menu/{i}.jpg',
+        )
+        for i in range(count)
+    )
+
+
+def cpu_per_request(call, seconds=2.0):
+    call()
+    calls = 0
+    started = time.process_time()
+    while time.process_time() - started < seconds:
+        call()
+        calls += 1
+    return (time.process_time() - started) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--items', type=int, default=1000)
+    args = parser.parse_args()
+
+    populate(args.items)
+    started = time.perf_counter()
+    snapshot = cache.refresh_menu_snapshot()
+    print(f'{args.items} items; snapshot build {(time.perf_counter() - started) * 1000:.0f} ms, codings: '
+          + ', '.join(f'{coding} {len(body):,} B' for coding, body in snapshot['bodies'].items()))
+
+    factory = RequestFactory()
+    viewset = SnapshotViewSet.as_view({'get': 'list'})
+    for label, accept in ACCEPT.items():
+        def old():
+            return viewset(factory.get('/api/menu/items/', headers={'accept-encoding': accept})).render()
+
+        def new():
+            return menu_items(factory.get('/api/menu/items/', headers={'accept-encoding': accept}))
+
+        old_response, new_response = old(), new()
+        assert json.loads(old_response.content) == json.loads(snapshot['bodies']['identity'])
+        old_cpu, new_cpu = cpu_per_request(old), cpu_per_request(new)
+        print(f'Accept-Encoding {label!r:10} viewset {len(old_response.content):>9,} B {old_cpu * 1e6:8.0f} us CPU | '
+              f'prebuilt {new_response.get("Content-Encoding", "identity"):8} {len(new_response.content):>9,} B '
+              f'{new_cpu * 1e6:6.0f} us CPU')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""Menu search: FTS5 index vs the portable icontains scan.
+
+Builds a menu of ``--items`` dishes and times representative queries on
+both paths, then checks the triggers keep the index in step with writes.
+
+    python -m benchmarks.menu_search --items 50000
+"""
+import argparse
+import random
+import statistics
+import time
+from decimal import Decimal
+
+from benchmarks._setup import setup_database
+
+setup_database()
+
+from django.db import connection
+
+from menu import search
+from menu.models import MenuItem
+
+ADJECTIVES = ('Classic', 'Smoky', 'Truffle', 'Spicy', 'Golden', 'Garden', 'Royal', 'Rustic', 'Crispy', 'Charred')
+DISHES = ('Burger', 'Pizza', 'Risotto', 'Steak', 'Salad', 'Cake', 'Fries', 'Lemonade', 'Curry', 'Ramen')
+WORDS = ('fresh', 'basil', 'garlic', 'aged', 'parmesan', 'smoked', 'paprika', 'citrus', 'herbs', 'butter',
+         'chilli', 'lime', 'coconut', 'mushroom', 'onion', 'cheddar', 'honey', 'ginger', 'sesame', 'tomato')
+QUERIES = ('truffle', 'truf', 'smoky burger', 'garlic butter', 'ramen ginger', 'pizza', 'coconut curry lime', 'zzz')
+SYLLABLES = ('ka', 'lo', 'mi', 'ran', 'sel', 'to', 'vu', 'zen', 'pa', 'ri', 'no', 'sha')
+ROUNDS = 20
+
+
+def populate(count, rng):
+    # A realistic long tail: the common words first, then a few hundred rarer ones, Zipf-weighted
+    vocabulary = list(WORDS) + sorted({''.join(rng.choices(SYLLABLES, k=3)) for _ in range(600)})
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    MenuItem.objects.bulk_create(
+        (MenuItem(
+            name=f'{rng.choice(ADJECTIVES)} {rng.choice(DISHES)} {i}',
+            description=' '.join(rng.choices(vocabulary, weights, k=rng.randint(8, 30))).capitalize() + '.',
+            price=Decimal(rng.randint(300, 4000)) / 100,
+            category=rng.choice(DISHES) + 's',
+        ) for i in range(count)),
+        batch_size=5000,
+    )
+
+
+def count_matches(terms):
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT count(*) FROM {search.FTS_TABLE} WHERE {search.FTS_TABLE} MATCH %s',
+                       [' '.join(f'"{term}"*' for term in terms)])
+        return cursor.fetchone()[0]
+
+
+def time_ms(fn):
+    samples = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--items', type=int, default=50_000)
+    args = parser.parse_args()
+    populate(args.items, random.Random(1))
+    assert search.fts_available(), 'this SQLite build has no FTS5'
+
+    print(f'{args.items:,} menu items, median of {ROUNDS} runs, top 20')
+    print(f'{"query":22} {"fts5 ms":>9} {"icontains ms":>13} {"matches":>8}')
+    for query in QUERIES:
+        terms = search.search_terms(query)
+        fts = time_ms(lambda: search._fts_search(terms, 20))
+        scan = time_ms(lambda: search._scan_search(terms, 20))
+        matches = count_matches(terms)
+        print(f'{query:22} {fts:9.2f} {scan:13.2f} {matches:8,}')
+
+    item = MenuItem.objects.first()
+    item.name = 'Saffron Paella'
+    item.save()
+    found = [i.id for i in search.search_menu('paell')] == [item.id]
+    item.delete()
+    gone = not search.search_menu('paella')
+    print(f'triggers: update indexed={found}, delete removed={gone}')
+    print('example:', search.search_menu('smoky burg', limit=1)[0].highlight)
+
+
+if __name__ == '__main__':
+    main()
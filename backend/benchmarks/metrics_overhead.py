@@ -0,0 +1,66 @@
+"""Per-request cost of MetricsMiddleware on cheap and query-heavy endpoints.
+
+Runs alternate between the two middleware stacks and the best round of
+each is compared, so machine noise does not swamp a sub-millisecond cost.
+
+    python -m benchmarks.metrics_overhead
+"""
+import timeit
+
+from benchmarks._setup import rate, setup_database
+
+setup_database()
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.test import Client, RequestFactory, override_settings
+from django.urls import resolve
+
+from config.metrics import MetricsMiddleware
+
+from menu.models import MenuItem
+from orders.models import Order, OrderItem
+from stock.models import StockCategory
+
+ROUNDS = 5
+ENDPOINTS = ('/api/stock/categories/', '/api/menu/items/1/', '/api/orders/')
+
+
+def populate():
+    StockCategory.objects.bulk_create(StockCategory(name=f'Category {i}') for i in range(5))
+    MenuItem.objects.create(name='Dish', description='House special.', price='10.00', category='Mains')
+    orders = Order.objects.bulk_create(
+        Order(customer_name='Bench', phone='0', delivery_method='pickup', payment_method='cash',
+              subtotal='10.00', total='10.00')
+        for _ in range(50)
+    )
+    OrderItem.objects.bulk_create(OrderItem(order=o, name='Dish', price='10.00', quantity=1) for o in orders)
+
+
+def fixed_cost_us(calls=20_000):
+    """The middleware's own cost around a view that does nothing."""
+    request = RequestFactory().get('/api/orders/')
+    request.resolver_match = resolve('/api/orders/')
+    middleware = MetricsMiddleware(lambda request: HttpResponse())
+    return timeit.timeit(lambda: middleware(request), number=calls) / calls * 1e6
+
+
+def main():
+    populate()
+    print(f'fixed cost per request: {fixed_cost_us():.1f} us')
+    without = [m for m in settings.MIDDLEWARE if m != 'config.metrics.MetricsMiddleware']
+    for path in ENDPOINTS:
+        baseline = measured = 0
+        for _ in range(ROUNDS):
+            with override_settings(MIDDLEWARE=without):
+                client = Client()
+                baseline = max(baseline, rate(lambda: client.get(path), seconds=1))
+            client = Client()
+            measured = max(measured, rate(lambda: client.get(path), seconds=1))
+        cost_us = (1 / measured - 1 / baseline) * 1e6
+        print(f'{path:28} without {baseline:8.1f} req/s   with {measured:8.1f} req/s   '
+              f'overhead {cost_us:6.1f} us ({(baseline / measured - 1) * 100:+.1f}%)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""Load test for the order status SSE stream.
+
+Opens N concurrent kitchen streams against ``orders.sse`` in-process, then
+reports Python heap per idle connection (tracemalloc) and how long one
+order save takes to fan out to every client:
+
+    python -m benchmarks.order_stream --connections 5000
+
+Socket and server buffers are not included; they depend on the ASGI server.
+"""
+import argparse
+import asyncio
+import threading
+import time
+import tracemalloc
+
+from benchmarks._setup import setup_database
+
+setup_database()
+
+from orders.events import hub
+from orders.models import Order
+from orders.sse import order_stream_app
+
+
+class FakeClient:
+    def __init__(self):
+        self.closed = asyncio.Event()
+        self.events = 0
+        self.ready = asyncio.Event()
+        self.received = asyncio.Event()
+
+    async def receive(self):
+        if not self.ready.is_set():
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        await self.closed.wait()
+        return {'type': 'http.disconnect'}
+
+    async def send(self, message):
+        if message['type'] == 'http.response.body':
+            if self.ready.is_set() and message['body'].startswith(b'event: status'):
+                self.events += 1
+                self.received.set()
+            self.ready.set()
+
+
+def scope():
+    return {'type': 'http', 'method': 'GET', 'path': '/api/orders/stream/', 'headers': []}
+
+
+async def run(connections):
+    order = await asyncio.to_thread(
+        Order.objects.create, customer_name='Load Test', phone='0', delivery_method='pickup',
+        payment_method='cash', subtotal=10, total=10,
+    )
+
+    tracemalloc.start()
+    baseline = tracemalloc.take_snapshot()
+    clients = [FakeClient() for _ in range(connections)]
+    tasks = [asyncio.ensure_future(order_stream_app(scope(), c.receive, c.send)) for c in clients]
+    started = time.perf_counter()
+    for client in clients:
+        await client.ready.wait()
+    connect_time = time.perf_counter() - started
+    used = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(baseline, 'filename'))
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+
+    def bump():
+        order.status = 'preparing'
+        order.save()
+
+    threading.Thread(target=bump).start()
+    for client in clients:
+        await client.received.wait()
+    fanout_time = time.perf_counter() - started
+
+    print(f'connections open:      {len(hub)}')
+    print(f'connect time:          {connect_time:.2f} s')
+    print(f'heap per connection:   {used / connections / 1024:.1f} KiB')
+    print(f'fan-out to all:        {fanout_time * 1000:.1f} ms')
+
+    for client in clients:
+        client.closed.set()
+    await asyncio.gather(*tasks)
+    print(f'after disconnect:      {len(hub)} subscriptions')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--connections', type=int, default=2000)
+    asyncio.run(run(parser.parse_args().connections))
@@ -0,0 +1,120 @@
+"""Conflicting status changes from parallel staff sessions, and bulk transitions.
+
+Every thread races the others to confirm or cancel each of the same
+pending orders through POST /api/orders/transition/ with
+``expected: pending``. Each order must end up changed exactly once: one
+update per order, a conflict for everyone else, one history row, and stock
+restocked once for every cancelled order.
+Finishes by timing one bulk transition against the same number of
+PATCHes.
+
+    python -m benchmarks.order_transitions --threads 8 --orders 200
+"""
+import argparse
+import json
+import random
+import tempfile
+import threading
+import time
+from collections import Counter
+from decimal import Decimal
+from pathlib import Path
+
+from benchmarks._setup import setup_database
+
+setup_database(Path(tempfile.mkdtemp()) / 'order_transitions.sqlite3', transaction_mode='IMMEDIATE', timeout=30)
+
+from django.db import connection
+from django.test import Client
+
+from menu.models import MenuItem
+from orders.models import Order, OrderStatusHistory
+from orders.serializers import create_orders
+from stock.models import RecipeIngredient, StockCategory, StockItem
+
+OPENING_STOCK = Decimal('100000')
+
+
+def order_data():
+    return {'customer_name': 'Race', 'phone': '0', 'delivery_method': 'pickup', 'payment_method': 'cash',
+            'subtotal': Decimal('10.00'), 'total': Decimal('10.00'),
+            'items': [{'name': 'Burger', 'price': Decimal('10.00'), 'quantity': 1}]}
+
+
+def populate():
+    dish = MenuItem.objects.create(name='Burger', description='-', price=Decimal('10.00'), category='Burgers')
+    patty = StockItem.objects.create(name='Patty', quantity=OPENING_STOCK, unit='pcs', threshold=10,
+                                     category=StockCategory.objects.create(name='Meat'))
+    RecipeIngredient.objects.create(menu_item=dish, stock_item=patty, quantity=Decimal('1'))
+    return patty
+
+
+def worker(seed, ids, barrier, outcomes, lock):
+    rng = random.Random(seed)
+    client = Client()
+    ids = rng.sample(ids, len(ids))
+    barrier.wait()
+    try:
+        for order_id in ids:
+            target = rng.choice(('confirmed', 'cancelled'))
+            response = client.post('/api/orders/transition/', json.dumps(
+                {'ids': [order_id], 'status': target, 'expected': 'pending'}), content_type='application/json')
+            result = response.json()[0]
+            with lock:
+                outcomes.append((order_id, target, result.get('code', result['status'])))
+    finally:
+        connection.close()
+
+
+def main(threads, orders):
+    patty = populate()
+    ids = [order.id for order in create_orders([order_data() for _ in range(orders)])]
+    outcomes, lock = [], threading.Lock()
+    barrier = threading.Barrier(threads)
+    workers = [threading.Thread(target=worker, args=(seed, ids, barrier, outcomes, lock)) for seed in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    codes = Counter(code for _, _, code in outcomes)
+    winners = Counter(order_id for order_id, _, code in outcomes if code == 'updated')
+    final = dict(Order.objects.filter(id__in=ids).values_list('id', 'status'))
+    won_status = {order_id: target for order_id, target, code in outcomes if code == 'updated'}
+    history = Counter(OrderStatusHistory.objects.filter(order_id__in=ids).values_list('order_id', flat=True))
+    cancelled = sum(status == 'cancelled' for status in final.values())
+    stock = StockItem.objects.get(pk=patty.pk).quantity
+    print(f'{threads} threads x {orders} orders in {elapsed:.2f} s; results {dict(sorted(codes.items()))}')
+    checks = {
+        'one winner per order': sorted(winners.values()) == [1] * orders,
+        'final status is the winner\'s': final == won_status,
+        'one history row per order': sorted(history.values()) == [1] * orders,
+        'stock restocked once per cancellation': stock == OPENING_STOCK - orders + cancelled,
+    }
+    for name, ok in checks.items():
+        print(f'  {name}: {ok}')
+
+    client = Client()
+    bulk_ids = [order.id for order in create_orders([order_data() for _ in range(orders)])]
+    started = time.perf_counter()
+    response = client.post('/api/orders/transition/', {'ids': bulk_ids, 'status': 'confirmed'},
+                           content_type='application/json')
+    bulk = time.perf_counter() - started
+    assert response.status_code == 200, response.content
+    started = time.perf_counter()
+    for order_id in bulk_ids:
+        client.patch(f'/api/orders/{order_id}/', {'status': 'preparing'}, content_type='application/json')
+    single = time.perf_counter() - started
+    print(f'{orders} orders: one bulk transition {bulk * 1000:.0f} ms, {orders} PATCHes {single * 1000:.0f} ms')
+    if not all(checks.values()):
+        raise SystemExit('Conflicting transitions were not resolved cleanly')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--orders', type=int, default=200)
+    args = parser.parse_args()
+    main(args.threads, args.orders)
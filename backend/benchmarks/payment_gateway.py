@@ -0,0 +1,88 @@
+"""Payment gateway behaviour against a local fake Stripe.
+
+Compares a fresh client per call with the shared pooled client under
+concurrency, then checks idempotent retries, intent reuse in
+``CreatePaymentIntentView`` and the timeout bound on a stalled gateway.
+
+    python -m benchmarks.payment_gateway
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+from benchmarks._setup import setup_database
+
+setup_database()
+
+from django.conf import settings
+from django.test import Client
+
+from benchmarks.fake_stripe import FakeStripe
+from orders.models import Order
+from payments import gateway
+
+CALLS = 400
+CONCURRENCY = 8
+LATENCY = 0.005
+
+
+def make_orders(count):
+    return Order.objects.bulk_create(
+        Order(customer_name='Bench', phone='0', delivery_method='pickup', payment_method='card',
+              subtotal=Decimal('10.00'), total=Decimal('10.00'))
+        for _ in range(count)
+    )
+
+
+def throughput(fake, orders, create):
+    fake.connections = 0
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=CONCURRENCY) as pool:
+        list(pool.map(create, orders))
+    elapsed = time.perf_counter() - started
+    return len(orders) / elapsed, fake.connections
+
+
+def fresh_client_create(order):
+    client = gateway._build_client()
+    amount = int(order.total * 100)
+    return client.v1.payment_intents.create(
+        params={'amount': amount, 'currency': 'usd', 'metadata': {'order_id': order.id}},
+        options={'idempotency_key': f'fresh-{order.id}'},
+    )
+
+
+def main():
+    fake = FakeStripe(latency=LATENCY).start()
+    settings.STRIPE_API_BASE = fake.url
+    gateway.reset_client()
+
+    orders = make_orders(CALLS * 2)
+    fresh = throughput(fake, orders[:CALLS], fresh_client_create)
+    pooled = throughput(fake, orders[CALLS:], gateway.create_payment_intent)
+    print(f'fresh client per call: {fresh[0]:7.1f} intents/s, {fresh[1]} connections opened')
+    print(f'shared pooled client:  {pooled[0]:7.1f} intents/s, {pooled[1]} connections opened')
+
+    order = make_orders(1)[0]
+    first, second = gateway.create_payment_intent(order), gateway.create_payment_intent(order)
+    print(f'idempotent retry returns the same intent: {first.id == second.id}')
+
+    client = Client()
+    order = make_orders(1)[0]
+    calls = fake.calls
+    codes = [client.post('/api/payments/create-intent/', {'order_id': order.id}).status_code for _ in range(3)]
+    print(f'create-intent x3 for one order: HTTP {codes}, gateway calls {fake.calls - calls}')
+
+    fake.latency = 5
+    settings.STRIPE_TIMEOUT = (0.5, 0.5)
+    settings.STRIPE_MAX_NETWORK_RETRIES = 1
+    gateway.reset_client()
+    order = make_orders(1)[0]
+    started = time.perf_counter()
+    response = client.post('/api/payments/create-intent/', {'order_id': order.id})
+    print(f'stalled gateway: HTTP {response.status_code} after {time.perf_counter() - started:.2f} s')
+    fake.stop()
+
+
+if __name__ == '__main__':
+    main()
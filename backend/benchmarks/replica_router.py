@@ -0,0 +1,104 @@
+"""Read/write splitting against a local SQLite replica.
+
+Sets up a primary and one replica file, then checks which database each
+request reads from: replica reads for opted-in endpoints, the primary for
+everything else, read-your-writes for a client right after it writes, and
+replica catch-up after ``sync_replicas``. Finishes with list throughput
+while a writer keeps the primary busy. Pins go to a file cache, since the
+router refuses a per-process one.
+
+    python -m benchmarks.replica_router
+"""
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+os.environ['DJANGO_DB_REPLICAS'] = 'replica.sqlite3'
+
+from benchmarks._setup import rate, setup_database
+
+workdir = Path(tempfile.mkdtemp())
+setup_database(workdir / 'primary.sqlite3', transaction_mode='IMMEDIATE', timeout=30)
+
+from django.db import connections
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from orders.management.commands.sync_replicas import sync_sqlite_replicas
+from orders.serializers import create_orders
+from stock.models import StockCategory
+
+override_settings(CACHES={'default': {
+    'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': str(workdir / 'cache'),
+}}).enable()
+
+# The replica alias mirrors default under test settings; point it at its own file
+connections['replica1'].settings_dict['NAME'] = str(workdir / 'replica.sqlite3')
+connections['replica1'].settings_dict.pop('TEST', None)
+
+ORDER = {'customer_name': 'Replica', 'phone': '0', 'delivery_method': 'pickup', 'payment_method': 'cash',
+         'subtotal': '10.00', 'total': '10.00', 'items': [{'name': 'Dish', 'price': '10.00', 'quantity': 1}]}
+
+
+def databases_used(client, method, path, **kwargs):
+    captured = {alias: CaptureQueriesContext(connections[alias]) for alias in ('default', 'replica1')}
+    for context in captured.values():
+        context.__enter__()
+    try:
+        response = getattr(client, method)(path, **kwargs)
+    finally:
+        for context in captured.values():
+            context.__exit__(None, None, None)
+    used = sorted(alias for alias, context in captured.items() if len(context))
+    return response, used
+
+
+def main():
+    StockCategory.objects.bulk_create(StockCategory(name=f'Category {i}') for i in range(5))
+    create_orders([ORDER] * 200)
+    sync_sqlite_replicas()
+
+    alice = Client(REMOTE_ADDR='10.0.0.1')
+    bob = Client(REMOTE_ADDR='10.0.0.2')
+    for path in ('/api/orders/', '/api/stock/categories/', '/api/menu/items/search/?q=dish', '/api/bookings/'):
+        _, used = databases_used(bob, 'get', path)
+        print(f'GET {path:34} -> {used}')
+
+    response, used = databases_used(alice, 'post', '/api/orders/', data=ORDER, content_type='application/json')
+    new_id = response.json()['id']
+    print(f'POST /api/orders/ (alice)               -> {used}')
+    response, used = databases_used(alice, 'get', '/api/orders/')
+    print(f'GET /api/orders/ (alice, just wrote)    -> {used}, sees new order: '
+          f'{response.json()["results"][0]["id"] == new_id}')
+    response, used = databases_used(bob, 'get', '/api/orders/')
+    print(f'GET /api/orders/ (bob, before sync)     -> {used}, sees new order: '
+          f'{response.json()["results"][0]["id"] == new_id}')
+    sync_sqlite_replicas()
+    response, used = databases_used(bob, 'get', '/api/orders/')
+    print(f'GET /api/orders/ (bob, after sync)      -> {used}, sees new order: '
+          f'{response.json()["results"][0]["id"] == new_id}')
+
+    stop = threading.Event()
+
+    def writer():
+        while not stop.is_set():
+            create_orders([ORDER])
+        connections.close_all()
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        time.sleep(0.2)
+        replica = rate(lambda: bob.get('/api/orders/'), seconds=3)
+        with override_settings(DATABASE_REPLICAS=[]):
+            primary = rate(lambda: bob.get('/api/orders/'), seconds=3)
+        print(f'order list while a writer runs: primary {primary:.1f} req/s, replica {replica:.1f} req/s')
+    finally:
+        stop.set()
+        thread.join()
+
+
+if __name__ == '__main__':
+    main()
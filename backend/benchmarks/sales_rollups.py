@@ -0,0 +1,111 @@
+"""Dashboard sales queries: raw aggregation over orders vs the daily rollups.
+
+    python -m benchmarks.sales_rollups --orders 1000000
+"""
+import argparse
+import random
+import time
+from datetime import timedelta
+from decimal import Decimal
+
+from benchmarks._setup import setup_database
+
+setup_database()
+
+from django.db.models import Count, DecimalField, F, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from analytics.models import DailyItemSales, DailySales
+from analytics.rollups import update_rollups
+from orders.models import Order, OrderItem
+
+DISHES = [(f'Dish {i}', Decimal(8 + i % 20)) for i in range(40)]
+DAYS = 365
+BATCH = 20_000
+
+
+def populate(count, days=DAYS, seed=7):
+    """Insert ``count`` orders spread over the last ``days`` days."""
+    rng = random.Random(seed)
+    now = timezone.now()
+    created_at = Order._meta.get_field('created_at')
+    # Let bulk_create keep the back-dated timestamps
+    created_at.auto_now_add = False
+    try:
+        for offset in range(0, count, BATCH):
+            orders = [
+                Order(
+                    customer_name='Bench', phone='0', delivery_method=rng.choice(('delivery', 'pickup')),
+                    payment_method=rng.choice(('cash', 'card')), subtotal=Decimal('20.00'), total=Decimal('25.00'),
+                    status='cancelled' if rng.random() < 0.05 else 'delivered',
+                    created_at=now - timedelta(days=rng.randrange(days), seconds=rng.randrange(3600)),
+                )
+                for _ in range(min(BATCH, count - offset))
+            ]
+            Order.objects.bulk_create(orders)
+            OrderItem.objects.bulk_create(
+                OrderItem(order=order, name=name, price=price, quantity=rng.randint(1, 3))
+                for order in orders
+                for name, price in rng.sample(DISHES, rng.randint(1, 4))
+            )
+    finally:
+        created_at.auto_now_add = True
+
+
+def timed(fn, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def raw_daily(start):
+    placed = ~Q(status='cancelled')
+    return list(Order.objects.filter(created_at__date__gte=start).annotate(day=TruncDate('created_at'))
+                .values('day').order_by().annotate(revenue=Sum('total', filter=placed),
+                                                    orders=Count('id', filter=placed)))
+
+
+def raw_items(start):
+    return list(OrderItem.objects.filter(order__created_at__date__gte=start).exclude(order__status='cancelled')
+                .values('name').order_by().annotate(
+                    units=Sum('quantity'),
+                    revenue=Sum(F('price') * F('quantity'), output_field=DecimalField())))
+
+
+def rollup_daily(start):
+    return list(DailySales.objects.filter(date__gte=start).values('date', 'revenue', 'order_count'))
+
+
+def rollup_items(start):
+    return list(DailyItemSales.objects.filter(date__gte=start).values('name').order_by()
+                .annotate(units=Sum('units'), revenue=Sum('revenue')))
+
+
+def main(count):
+    started = time.perf_counter()
+    populate(count)
+    print(f'generated {count} orders in {time.perf_counter() - started:.1f} s')
+
+    started = time.perf_counter()
+    update_rollups()
+    print(f'initial rollup build: {time.perf_counter() - started:.1f} s')
+
+    populate(count // DAYS, days=1, seed=8)
+    print(f'incremental update after ~1 day of orders: {timed(update_rollups, repeat=1):.0f} ms')
+
+    today = timezone.localdate()
+    for label, days in (('30 days', 30), ('365 days', DAYS)):
+        start = today - timedelta(days=days)
+        print(f'{label}:')
+        print(f'  daily totals  raw {timed(lambda: raw_daily(start)):9.1f} ms   rollup {timed(lambda: rollup_daily(start)):7.1f} ms')
+        print(f'  item units    raw {timed(lambda: raw_items(start)):9.1f} ms   rollup {timed(lambda: rollup_items(start)):7.1f} ms')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--orders', type=int, default=1_000_000)
+    main(parser.parse_args().orders)
@@ -0,0 +1,136 @@
+"""Concurrent writers and readers under the development vs production SQLite profile.
+
+Each profile runs in its own process against a fresh database file. Writer
+threads alternate between placing an order (which also consumes stock) and
+creating a booking (which updates slot occupancy), while reader threads list
+recent orders. Every iteration is treated as a request, so connections are
+closed or kept according to CONN_MAX_AGE, just as in the server.
+
+    python -m benchmarks.sqlite_profile --writers 8 --readers 4 --seconds 10
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+PROFILES = ('development', 'production')
+
+
+def run_profile(args):
+    from benchmarks._setup import setup_database
+
+    setup_database(Path(tempfile.mkdtemp()) / 'profile.sqlite3')
+
+    from datetime import date, time as dt_time, timedelta
+    from decimal import Decimal
+
+    from django.db import OperationalError, close_old_connections, connection
+
+    from bookings.models import Booking, ServiceSlot
+    from menu.models import MenuItem
+    from orders.models import Order
+    from orders.serializers import create_orders
+    from stock.models import RecipeIngredient, StockCategory, StockItem
+
+    dish = MenuItem.objects.create(name='House Burger', description='-', price=Decimal('12.00'), category='Burgers')
+    category = StockCategory.objects.create(name='Meat')
+    patty = StockItem.objects.create(name='Patty', quantity=Decimal('1000000'), unit='pcs', threshold=10,
+                                     category=category)
+    RecipeIngredient.objects.create(menu_item=dish, stock_item=patty, quantity=Decimal('1'))
+    ServiceSlot.objects.bulk_create(ServiceSlot(time=dt_time(h), capacity=10_000) for h in range(12, 23))
+    journal_mode = connection.cursor().execute('PRAGMA journal_mode').fetchone()[0]
+    connection.close()
+
+    order = {'customer_name': 'Bench', 'phone': '0', 'delivery_method': 'pickup', 'payment_method': 'cash',
+             'subtotal': Decimal('12.00'), 'total': Decimal('12.00'),
+             'items': [{'name': dish.name, 'price': Decimal('12.00'), 'quantity': 1}]}
+    counts = {'writes': 0, 'reads': 0, 'locked': 0, 'connections': 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + args.seconds
+
+    def count(key):
+        with lock:
+            counts[key] += 1
+
+    def request(fn):
+        close_old_connections()
+        if connection.connection is None:
+            count('connections')
+        try:
+            fn()
+            return True
+        except OperationalError as e:
+            if 'locked' not in str(e):
+                raise
+            count('locked')
+            return False
+        finally:
+            close_old_connections()
+
+    def writer(n):
+        i = 0
+        while time.perf_counter() < deadline:
+            i += 1
+            if i % 2:
+                ok = request(lambda: create_orders([order]))
+            else:
+                ok = request(lambda: Booking.objects.create(
+                    customer_name='Bench', phone='0', email='bench@example.com', guests=2,
+                    date=date.today() + timedelta(days=(n + i) % 30), time=dt_time(12 + i % 11)))
+            if ok:
+                count('writes')
+        connection.close()
+
+    def reader():
+        while time.perf_counter() < deadline:
+            if request(lambda: list(Order.objects.prefetch_related('items').order_by('-created_at', '-id')[:50])):
+                count('reads')
+        connection.close()
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(args.writers)]
+    threads += [threading.Thread(target=reader) for _ in range(args.readers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stock_left = StockItem.objects.get(pk=patty.pk).quantity
+    orders = Order.objects.count()
+    print(json.dumps({
+        'journal_mode': journal_mode,
+        'writes_per_s': round(counts['writes'] / args.seconds, 1),
+        'reads_per_s': round(counts['reads'] / args.seconds, 1),
+        'locked_errors': counts['locked'],
+        'connections_opened': counts['connections'],
+        'stock_consistent': Decimal('1000000') - stock_left == orders,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--writers', type=int, default=8)
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--profile', choices=PROFILES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.profile:
+        return run_profile(args)
+
+    print(f'{args.writers} writers, {args.readers} readers, {args.seconds:g} s per profile')
+    for profile in PROFILES:
+        result = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.sqlite_profile', '--profile', profile, '--writers', str(args.writers),
+             '--readers', str(args.readers), '--seconds', str(args.seconds)],
+            env={**os.environ, 'DJANGO_DB_PROFILE': profile}, capture_output=True, text=True, check=True,
+        )
+        print(f'{profile:12} {result.stdout.strip().splitlines()[-1]}')
+
+
+if __name__ == '__main__':
+    main()
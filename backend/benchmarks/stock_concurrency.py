@@ -0,0 +1,109 @@
+"""Many simultaneous checkouts against the same stock rows.
+
+Places orders from parallel threads through POST /api/orders/, cancels a
+share of them, and checks the final stock against the exact expected
+figure, i.e. that no decrement or restock was lost:
+
+    python -m benchmarks.stock_concurrency --threads 16 --orders 50
+"""
+import argparse
+import json
+import random
+import tempfile
+import threading
+import time
+from decimal import Decimal
+from pathlib import Path
+
+from benchmarks._setup import setup_database
+
+# A file database so every thread gets its own connection. IMMEDIATE
+# transactions plus a busy timeout let SQLite queue the writers.
+setup_database(Path(tempfile.mkdtemp()) / 'stock_concurrency.sqlite3',
+               transaction_mode='IMMEDIATE', timeout=30)
+
+from django.db import connection
+from django.test import Client
+
+from menu.models import MenuItem
+from stock.models import RecipeIngredient, StockCategory, StockItem
+
+RECIPES = {
+    'Classic Burger': {'Burger Buns': 1, 'Beef Patties': 1},
+    'Double Burger': {'Burger Buns': 1, 'Beef Patties': 2},
+}
+OPENING_STOCK = Decimal('100000')
+
+
+def populate():
+    category = StockCategory.objects.create(name='Kitchen')
+    stock = {
+        name: StockItem.objects.create(name=name, quantity=OPENING_STOCK, unit='pcs', threshold=10, category=category)
+        for name in ('Burger Buns', 'Beef Patties')
+    }
+    for dish, ingredients in RECIPES.items():
+        menu_item = MenuItem.objects.create(name=dish, description=dish, price='10.00', category='Burgers')
+        for name, quantity in ingredients.items():
+            RecipeIngredient.objects.create(menu_item=menu_item, stock_item=stock[name], quantity=quantity)
+
+
+def worker(seed, orders, expected, lock, errors):
+    rng = random.Random(seed)
+    client = Client()
+    used = {'Burger Buns': 0, 'Beef Patties': 0}
+    try:
+        for _ in range(orders):
+            lines = {dish: rng.randint(1, 3) for dish in rng.sample(sorted(RECIPES), rng.randint(1, 2))}
+            response = client.post('/api/orders/', json.dumps({
+                'customer_name': 'Load', 'phone': '0', 'delivery_method': 'pickup', 'payment_method': 'cash',
+                'subtotal': '10.00', 'total': '10.00',
+                'items': [{'name': dish, 'price': '10.00', 'quantity': qty} for dish, qty in lines.items()],
+            }), content_type='application/json')
+            assert response.status_code == 201, response.content
+
+            if rng.random() < 0.2:
+                cancel = client.patch(f"/api/orders/{response.json()['id']}/", json.dumps({'status': 'cancelled'}),
+                                      content_type='application/json')
+                assert cancel.status_code == 200, cancel.content
+                continue
+            for dish, qty in lines.items():
+                for name, per_portion in RECIPES[dish].items():
+                    used[name] += per_portion * qty
+    except Exception as exc:
+        errors.append(exc)
+    finally:
+        connection.close()
+    with lock:
+        for name, quantity in used.items():
+            expected[name] -= quantity
+
+
+def main(threads, orders):
+    populate()
+    expected = {name: OPENING_STOCK for name in ('Burger Buns', 'Beef Patties')}
+    lock, errors = threading.Lock(), []
+    workers = [threading.Thread(target=worker, args=(seed, orders, expected, lock, errors)) for seed in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    actual = dict(StockItem.objects.values_list('name', 'quantity'))
+    print(f'{threads} threads x {orders} orders in {elapsed:.2f} s ({threads * orders / elapsed:.0f} orders/s)')
+    for name in expected:
+        print(f'  {name}: expected {expected[name]}, actual {actual[name]}')
+    if errors:
+        raise SystemExit(f'{len(errors)} worker(s) failed: {errors[0]!r}')
+    if any(actual[name] != expected[name] for name in expected):
+        raise SystemExit('Lost stock updates detected')
+    print('No lost updates')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--orders', type=int, default=50)
+    args = parser.parse_args()
+    main(args.threads, args.orders)
@@ -0,0 +1,115 @@
+"""Packing a night of confirmed bookings onto tables (bookings/seating.py).
+
+Builds a dining room of ``--tables`` tables of 2 to 8 seats in groups of
+four that can be pushed together, and ``--bookings`` confirmed bookings
+between 17:00 and 21:30, busiest around 19:30. Compares the optimizer with
+seating in booking order at the first free table or table group, the way a
+host working down the list would. Then times confirming single bookings,
+which seats each one around the current plan.
+
+    python -m benchmarks.table_assignment --bookings 500
+"""
+import argparse
+import random
+import statistics
+import time
+from datetime import date, time as dt_time
+
+from benchmarks._setup import setup_database
+
+setup_database()
+
+from bookings.models import Booking, Table, TableAssignment
+from bookings.seating import Schedule, optimize_service, pack, service_options, service_parties
+
+SERVICE_DATE = date(2026, 12, 24)
+TABLE_SEATS = (2, 2, 2, 4, 4, 4, 6, 8)
+PARTY_SIZES = (1, 2, 2, 2, 2, 3, 4, 4, 4, 5, 6, 6, 8, 10, 12)
+
+
+def populate(tables, bookings, rng):
+    Table.objects.bulk_create(
+        Table(name=f'T{i:03d}', seats=TABLE_SEATS[i % len(TABLE_SEATS)], group=f'Zone {i // 4}')
+        for i in range(tables)
+    )
+    Booking.objects.bulk_create(
+        Booking(customer_name=f'Guest {i}', phone='0', email=f'guest{i}@example.com', date=SERVICE_DATE,
+                time=booking_time(rng), guests=rng.choice(PARTY_SIZES), status='confirmed')
+        for i in range(bookings)
+    )
+
+
+def booking_time(rng):
+    quarter = min(max(round(rng.gauss(10, 6)), 0), 18)  # quarter hours after 17:00
+    return dt_time(17 + quarter // 4, quarter % 4 * 15)
+
+
+def first_come(parties, options):
+    """Booking order, first free seating in table order."""
+    options = sorted(options, key=lambda option: option[1])
+    schedule = Schedule(options)
+    for party in sorted(parties):
+        for seating in options:
+            if seating[0] - seating[2] < party[1] <= seating[0] and schedule.is_free(seating[1], party[2], party[3]):
+                schedule.place(party, seating)
+                break
+    return schedule
+
+
+def totals(schedule, parties):
+    covers = sum(party[1] for party in parties)
+    seated = sum(party[1] for party, _ in schedule.placed.values())
+    wasted = sum(seating[0] - party[1] for party, seating in schedule.placed.values())
+    return f'{seated}/{covers} covers ({seated / covers:.1%}), {len(schedule.placed)}/{len(parties)} parties, ' \
+           f'{wasted} empty seats at taken tables'
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--tables', type=int, default=300)
+    parser.add_argument('--bookings', type=int, default=500)
+    parser.add_argument('--confirms', type=int, default=50)
+    args = parser.parse_args()
+    rng = random.Random(11)
+    populate(args.tables, args.bookings, rng)
+
+    parties, options = service_parties(SERVICE_DATE), service_options()
+    print(f'{len(parties)} bookings, {args.tables} tables, {len(options)} seatings including pushed-together groups')
+    started = time.perf_counter()
+    schedule = pack(parties, options)
+    packed = time.perf_counter() - started
+    print(f'  first come, first seated: {totals(first_come(parties, options), parties)}')
+    print(f'  optimizer:                {totals(schedule, parties)}')
+
+    started = time.perf_counter()
+    plan = optimize_service(SERVICE_DATE)
+    optimized = time.perf_counter() - started
+    assert plan['seated_covers'] == sum(party[1] for party, _ in schedule.placed.values())
+    stays = {}
+    for booking_id, table_id in TableAssignment.objects.filter(date=SERVICE_DATE).values_list('booking_id', 'table_id'):
+        stays.setdefault(table_id, []).append(next(p for p in parties if p[0] == booking_id))
+    overlaps = sum(a[3] > b[2] for held in stays.values() for a, b in zip(sorted(held, key=lambda p: p[2]),
+                                                                        sorted(held, key=lambda p: p[2])[1:]))
+    print(f'  packing {packed * 1000:.0f} ms; optimize_service with reads and writes {optimized * 1000:.0f} ms; '
+          f'overlapping stays {overlaps}')
+
+    # Confirming one more booking at a time, on the day after
+    day = date(2026, 12, 26)
+    pending = Booking.objects.bulk_create(
+        Booking(customer_name='Walk-up', phone='0', email='w@example.com', date=day, time=booking_time(rng),
+                guests=rng.choice(PARTY_SIZES)) for _ in range(args.confirms)
+    )
+    timings = []
+    for booking in pending:
+        booking.status = 'confirmed'
+        started = time.perf_counter()
+        booking.save()
+        timings.append(time.perf_counter() - started)
+    print(f'  confirming {args.confirms} bookings one at a time: median {statistics.median(timings) * 1000:.1f} ms, '
+          f'max {max(timings) * 1000:.1f} ms per save')
+    if overlaps or optimized >= 1:
+        raise SystemExit('Seating plan overlaps or took a second or more')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Booking
+from .models import Booking, ServiceSlot, Table
 
 @admin.register(Booking)
 class BookingAdmin(admin.ModelAdmin):
@@ -7,3 +7,12 @@ class BookingAdmin(admin.ModelAdmin):
     list_filter = ('date', 'status')
     search_fields = ('customer_name', 'email', 'phone')
     ordering = ('-date', '-time')
+
+@admin.register(ServiceSlot)
+class ServiceSlotAdmin(admin.ModelAdmin):
+    list_display = ('time', 'capacity')
+
+@admin.register(Table)
+class TableAdmin(admin.ModelAdmin):
+    list_display = ('name', 'seats', 'group', 'available')
+    list_filter = ('group', 'available')
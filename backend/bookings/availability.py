@@ -0,0 +1,100 @@
+from datetime import time as dt_time
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from .models import Booking, ServiceSlot, SlotOccupancy
+
+# Bookings in these statuses hold seats
+OCCUPYING_STATUSES = ('pending', 'confirmed')
+
+
+def slot_time(value):
+    """Round a booking time down to the start of its slot."""
+    minutes = value.hour * 60 + value.minute
+    minutes -= minutes % settings.BOOKING_SLOT_MINUTES
+    return dt_time(minutes // 60, minutes % 60)
+
+
+def covered_slots(time):
+    """The slot starts a party arriving at ``time`` is still seated for.
+
+    A party stays ``BOOKING_DINING_MINUTES``: its own slot and every later
+    one that starts before it leaves. A stay past midnight is counted
+    only until then.
+    """
+    start = slot_time(time)
+    first = start.hour * 60 + start.minute
+    end = min(time.hour * 60 + time.minute + settings.BOOKING_DINING_MINUTES, 24 * 60)
+    return tuple(dt_time(minutes // 60, minutes % 60) for minutes in range(first, end, settings.BOOKING_SLOT_MINUTES))
+
+
+def footprint(date, time, guests, status):
+    """The ``(date, slots, guests)`` a booking occupies, or ``None`` if it holds no seats."""
+    if status not in OCCUPYING_STATUSES:
+        return None
+    return date, covered_slots(time), guests
+
+
+def _adjust(date, time, delta):
+    SlotOccupancy.objects.get_or_create(date=date, time=time)
+    SlotOccupancy.objects.filter(date=date, time=time).update(guests=F('guests') + delta)
+
+
+def apply_occupancy_change(previous, current):
+    """Move seats from one footprint to another (either may be ``None``)."""
+    if previous == current:
+        return
+    deltas = {}
+    for sign, held in ((-1, previous), (1, current)):
+        if held:
+            date, slots, guests = held
+            for time in slots:
+                deltas[date, time] = deltas.get((date, time), 0) + sign * guests
+    with transaction.atomic():
+        for (date, time), delta in deltas.items():
+            if delta:
+                _adjust(date, time, delta)
+
+
+def rebuild_occupancy():
+    """Recompute the whole index from bookings, e.g. after bulk imports."""
+    totals = {}
+    rows = Booking.objects.filter(status__in=OCCUPYING_STATUSES).values_list('date', 'time', 'guests')
+    for date, time, guests in rows.iterator(chunk_size=5000):
+        for slot in covered_slots(time):
+            totals[date, slot] = totals.get((date, slot), 0) + guests
+
+    with transaction.atomic():
+        SlotOccupancy.objects.all().delete()
+        SlotOccupancy.objects.bulk_create(
+            (SlotOccupancy(date=date, time=time, guests=guests) for (date, time), guests in totals.items()),
+            batch_size=1000,
+        )
+    return len(totals)
+
+
+def day_availability(date, guests):
+    """Every service slot on ``date`` with its remaining seats, in one query.
+
+    A slot is available when the party fits in it and in every later
+    service slot it would still be seated for.
+    """
+    booked = SlotOccupancy.objects.filter(date=date, time=OuterRef('time')).values('guests')
+    slots = list(ServiceSlot.objects.annotate(
+        booked=Coalesce(Subquery(booked, output_field=IntegerField()), Value(0)),
+    ).values_list('time', 'capacity', 'booked'))
+    remaining = {time: capacity - booked for time, capacity, booked in slots}
+
+    return [
+        {
+            'time': time,
+            'capacity': capacity,
+            'booked': booked,
+            'remaining': max(capacity - booked, 0),
+            'available': all(remaining.get(slot, guests) >= guests for slot in covered_slots(time)),
+        }
+        for time, capacity, booked in slots
+    ]
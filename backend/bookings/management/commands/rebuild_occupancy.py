@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from bookings.availability import rebuild_occupancy
+
+
+class Command(BaseCommand):
+    help = 'Recompute the per-slot booking occupancy index from scratch'
+
+    def handle(self, *args, **options):
+        slots = rebuild_occupancy()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt occupancy for {slots} slots'))
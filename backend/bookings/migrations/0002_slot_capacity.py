@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:45
+
+from django.db import migrations, models
+
+
+def build_occupancy(apps, schema_editor):
+    from bookings.availability import OCCUPYING_STATUSES, slot_time
+
+    Booking = apps.get_model('bookings', 'Booking')
+    SlotOccupancy = apps.get_model('bookings', 'SlotOccupancy')
+    totals = {}
+    for date, time, guests in Booking.objects.filter(status__in=OCCUPYING_STATUSES).values_list('date', 'time', 'guests'):
+        key = (date, slot_time(time))
+        totals[key] = totals.get(key, 0) + guests
+    SlotOccupancy.objects.bulk_create(
+        SlotOccupancy(date=date, time=time, guests=guests) for (date, time), guests in totals.items()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ServiceSlot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('time', models.TimeField(unique=True)),
+                ('capacity', models.PositiveIntegerField()),
+            ],
+            options={
+                'ordering': ['time'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SlotOccupancy',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('time', models.TimeField()),
+                ('guests', models.IntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('date', 'time'), name='unique_slot_occupancy')],
+            },
+        ),
+        migrations.RunPython(build_occupancy, migrations.RunPython.noop),
+    ]
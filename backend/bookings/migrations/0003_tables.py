@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0002_slot_capacity'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Table',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('seats', models.PositiveIntegerField()),
+                ('group', models.CharField(blank=True, default='', max_length=50)),
+                ('available', models.BooleanField(default=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='TableAssignment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('booking', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='table_assignments', to='bookings.booking')),
+                ('table', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='assignments', to='bookings.table')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['date'], name='table_assignment_date_idx')],
+                'constraints': [models.UniqueConstraint(fields=('booking', 'table'), name='unique_table_assignment')],
+            },
+        ),
+    ]
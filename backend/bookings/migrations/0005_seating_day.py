@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0004_date_status_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SeatingDay',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(unique=True)),
+                ('revision', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+    ]
@@ -1,3 +1,5 @@
+from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.db import models
 
 class Booking(models.Model):
@@ -19,5 +21,82 @@ class Booking(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Bookings from a date on, e.g. a day's seating plan or upcoming bookings for the dashboard
+            models.Index(fields=['date', 'status'], name='booking_date_status_idx'),
+        ]
+
     def __str__(self):
         return f"{self.customer_name} - {self.date} at {self.time}"
+
+class ServiceSlot(models.Model):
+    """A bookable start time and how many guests the room can seat for it."""
+    time = models.TimeField(unique=True)
+    capacity = models.PositiveIntegerField()
+
+    class Meta:
+        ordering = ['time']
+
+    def clean(self):
+        # Occupancy is counted per slot start, so a time between two starts would never see its bookings
+        step = settings.BOOKING_SLOT_MINUTES
+        if self.time is not None and ((self.time.hour * 60 + self.time.minute) % step or self.time.second
+                                      or self.time.microsecond):
+            raise ValidationError({'time': f'Service slots start on the {step}-minute booking grid.'})
+
+    def __str__(self):
+        return f"{self.time} ({self.capacity} seats)"
+
+class SlotOccupancy(models.Model):
+    """Guests held by pending/confirmed bookings per date and slot, kept in sync by signals."""
+    date = models.DateField()
+    time = models.TimeField()
+    guests = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['date', 'time'], name='unique_slot_occupancy'),
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.time}: {self.guests} guests"
+
+class Table(models.Model):
+    """A dining table. Tables sharing a ``group`` can be pushed together for larger parties."""
+    name = models.CharField(max_length=50, unique=True)
+    seats = models.PositiveIntegerField()
+    group = models.CharField(max_length=50, blank=True, default='')
+    available = models.BooleanField(default=True)
+
+    class Meta:
+        ordering = ['name']
+
+    def __str__(self):
+        return f"{self.name} ({self.seats} seats)"
+
+class TableAssignment(models.Model):
+    """A table held by a confirmed booking, written by the seating optimizer (see ``seating.py``)."""
+    booking = models.ForeignKey(Booking, related_name='table_assignments', on_delete=models.CASCADE)
+    table = models.ForeignKey(Table, related_name='assignments', on_delete=models.CASCADE)
+    # The booking's date, so a day's plan is read and replaced through one index
+    date = models.DateField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['booking', 'table'], name='unique_table_assignment'),
+        ]
+        indexes = [
+            models.Index(fields=['date'], name='table_assignment_date_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.table.name} for booking #{self.booking_id} on {self.date}"
+
+class SeatingDay(models.Model):
+    """A date with a seating plan. Changing the plan updates this row first, so it is changed one writer at a time."""
+    date = models.DateField(unique=True)
+    revision = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"Seating plan for {self.date} (revision {self.revision})"
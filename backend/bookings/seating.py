@@ -0,0 +1,268 @@
+"""Table assignment for confirmed bookings.
+
+A party holds its tables from the booking time for ``BOOKING_DINING_MINUTES``.
+It sits at one table, or at up to ``BOOKING_MAX_COMBINED_TABLES`` tables of
+one ``group`` pushed together, seating the sum of their seats.
+
+``optimize_service(date)`` re-packs a whole day. Parties are placed largest
+first, each on the smallest seating that is free for its whole stay (best
+fit decreasing). A party left over may then
+take a seating from one placed party that can move somewhere else. The
+plan replaces the day's ``TableAssignment`` rows in one transaction.
+
+``seat_booking`` places one newly confirmed booking around the current
+plan. If nothing is free it re-packs the day, keeping the new plan only if
+it seats more guests.
+
+Both read a day's plan and then write it, so they first lock the day's
+``SeatingDay`` row with an UPDATE. A second confirmation for the same date
+waits for the first to commit and then sees its tables taken, instead of
+seating its party at them too.
+"""
+import bisect
+from collections import defaultdict
+from itertools import combinations
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+
+from .models import Booking, SeatingDay, Table, TableAssignment
+
+
+def minutes(value):
+    return value.hour * 60 + value.minute
+
+
+def stay_mask(start, end):
+    """The minutes ``start``..``end`` as bits."""
+    return ((1 << (end - start)) - 1) << start
+
+
+def seatings(tables):
+    """Every way to seat a party as ``(seats, table ids, seats at the smallest table)``, smallest first."""
+    options = [(seats, (table_id,), seats) for table_id, seats, _ in tables]
+    groups = defaultdict(list)
+    for table_id, seats, group in tables:
+        if group:
+            groups[group].append((table_id, seats))
+    for members in groups.values():
+        for size in range(2, settings.BOOKING_MAX_COMBINED_TABLES + 1):
+            for combo in combinations(members, size):
+                options.append((
+                    sum(seats for _, seats in combo), tuple(table_id for table_id, _ in combo),
+                    min(seats for _, seats in combo),
+                ))
+    options.sort(key=lambda option: (option[0], len(option[1]), option[1]))
+    return options
+
+
+class Schedule:
+    """Which bookings hold each table and when.
+
+    Each table's busy minutes are one integer bitmask, so checking a
+    seating against a stay is a few ANDs.
+    """
+
+    def __init__(self, options):
+        self.options = options
+        self.capacities = [seating[0] for seating in options]
+        self._fitting = {}
+        self.busy = defaultdict(int)  # table id -> mask of held minutes
+        self.stays = defaultdict(list)  # table id -> (start, end, booking id)
+        self.placed = {}  # booking id -> (party, seating)
+
+    def blocking(self, table_ids, start, end):
+        """Bookings holding any of ``table_ids`` at some point during ``start``..``end``."""
+        return {
+            booking_id
+            for table_id in table_ids
+            for held_start, held_end, booking_id in self.stays[table_id]
+            if held_start < end and start < held_end
+        }
+
+    def is_free(self, table_ids, start, end):
+        stay = stay_mask(start, end)
+        return not any(self.busy[table_id] & stay for table_id in table_ids)
+
+    def fitting(self, guests):
+        """Seatings for ``guests``, smallest first, skipping groups with a table to spare."""
+        if guests not in self._fitting:
+            self._fitting[guests] = [
+                seating for seating in self.options[bisect.bisect_left(self.capacities, guests):]
+                if seating[0] - seating[2] < guests
+            ]
+        return self._fitting[guests]
+
+    def best_seating(self, party):
+        """The smallest seating free for ``party``'s whole stay, or ``None``."""
+        _, guests, start, end = party
+        stay, busy = stay_mask(start, end), self.busy
+        for seating in self.fitting(guests):
+            for table_id in seating[1]:
+                if busy[table_id] & stay:
+                    break
+            else:
+                return seating
+        return None
+
+    def place(self, party, seating):
+        booking_id, _, start, end = party
+        stay = stay_mask(start, end)
+        for table_id in seating[1]:
+            self.busy[table_id] |= stay
+            self.stays[table_id].append((start, end, booking_id))
+        self.placed[booking_id] = (party, seating)
+
+    def remove(self, booking_id):
+        (_, _, start, end), seating = self.placed.pop(booking_id)
+        stay = stay_mask(start, end)
+        for table_id in seating[1]:
+            self.busy[table_id] &= ~stay
+            self.stays[table_id].remove((start, end, booking_id))
+
+    def seat_by_moving_one(self, party):
+        """Seat ``party`` by moving one placed booking to another free seating."""
+        booking_id, guests, start, end = party
+        tried = set()
+        for seating in self.fitting(guests):
+            blockers = self.blocking(seating[1], start, end)
+            if len(blockers) != 1 or blockers <= tried:
+                continue
+            other = blockers.pop()
+            tried.add(other)
+            other_party, other_seating = self.placed[other]
+            self.remove(other)
+            self.place(party, seating)
+            moved = self.best_seating(other_party)
+            if moved is not None:
+                self.place(other_party, moved)
+                return True
+            self.remove(booking_id)
+            self.place(other_party, other_seating)
+        return False
+
+
+def pack(parties, options):
+    """Seat ``(booking id, guests, start, end)`` parties on ``options``; returns the ``Schedule``."""
+    schedule = Schedule(options)
+    unseated = []
+    for party in sorted(parties, key=lambda party: (-party[1], party[2], party[0])):
+        seating = schedule.best_seating(party)
+        if seating is None:
+            unseated.append(party)
+        else:
+            schedule.place(party, seating)
+    for party in unseated:
+        schedule.seat_by_moving_one(party)
+    return schedule
+
+
+def lock_day(date):
+    """Hold ``date``'s plan until the transaction ends."""
+    # An UPDATE, not a SELECT: it takes the row lock (the write lock on SQLite) that a read would not
+    if not SeatingDay.objects.filter(date=date).update(revision=F('revision') + 1):
+        SeatingDay.objects.get_or_create(date=date)
+        SeatingDay.objects.filter(date=date).update(revision=F('revision') + 1)
+
+
+def service_parties(date):
+    dining = settings.BOOKING_DINING_MINUTES
+    rows = Booking.objects.filter(date=date, status='confirmed').values_list('id', 'guests', 'time')
+    return [(booking_id, guests, minutes(time), minutes(time) + dining) for booking_id, guests, time in rows]
+
+
+def service_options():
+    return seatings(list(Table.objects.filter(available=True).values_list('id', 'seats', 'group')))
+
+
+def current_schedule(date, parties, options):
+    """The stored plan for ``date`` as a ``Schedule``."""
+    tables = defaultdict(list)
+    for booking_id, table_id in TableAssignment.objects.filter(date=date).values_list('booking_id', 'table_id'):
+        tables[booking_id].append(table_id)
+    seats = dict(Table.objects.filter(id__in={t for ids in tables.values() for t in ids}).values_list('id', 'seats'))
+    schedule = Schedule(options)
+    for party in parties:
+        table_ids = tables.get(party[0])
+        if table_ids:
+            held = [seats[table_id] for table_id in table_ids]
+            schedule.place(party, (sum(held), tuple(sorted(table_ids)), min(held)))
+    return schedule
+
+
+def seated_covers(schedule):
+    return sum(party[1] for party, _ in schedule.placed.values())
+
+
+def save_schedule(date, schedule):
+    TableAssignment.objects.filter(date=date).delete()
+    TableAssignment.objects.bulk_create(
+        TableAssignment(booking_id=booking_id, table_id=table_id, date=date)
+        for booking_id, (_, seating) in schedule.placed.items()
+        for table_id in seating[1]
+    )
+
+
+def optimize_service(date, only_if_better=False):
+    """Re-pack the confirmed bookings on ``date``; returns the day's ``seating_plan``."""
+    with transaction.atomic():
+        lock_day(date)
+        parties, options = service_parties(date), service_options()
+        schedule = pack(parties, options)
+        if not only_if_better or seated_covers(schedule) > seated_covers(current_schedule(date, parties, options)):
+            save_schedule(date, schedule)
+    return seating_plan(date)
+
+
+def seat_booking(booking_id):
+    """Seat a newly confirmed booking without moving anyone else, or re-pack its day if it does not fit."""
+    with transaction.atomic():
+        TableAssignment.objects.filter(booking_id=booking_id).delete()
+        booking_id, guests, time, date = Booking.objects.values_list('id', 'guests', 'time', 'date').get(pk=booking_id)
+        lock_day(date)
+        party = (booking_id, guests, minutes(time), minutes(time) + settings.BOOKING_DINING_MINUTES)
+        options = service_options()
+        schedule = current_schedule(date, service_parties(date), options)
+        seating = schedule.best_seating(party)
+        if seating is not None:
+            TableAssignment.objects.bulk_create(
+                TableAssignment(booking_id=booking_id, table_id=table_id, date=date) for table_id in seating[1]
+            )
+            return True
+    optimize_service(date, only_if_better=True)
+    return TableAssignment.objects.filter(booking_id=booking_id).exists()
+
+
+def release_booking(booking_id):
+    TableAssignment.objects.filter(booking_id=booking_id).delete()
+
+
+def seating_plan(date):
+    """Confirmed bookings on ``date`` with their tables, plus seated and wasted seat totals."""
+    tables = defaultdict(list)
+    for booking_id, name, seats in (
+        TableAssignment.objects.filter(date=date).order_by('table__name')
+        .values_list('booking_id', 'table__name', 'table__seats')
+    ):
+        tables[booking_id].append((name, seats))
+
+    bookings = []
+    covers = seated = wasted = 0
+    rows = Booking.objects.filter(date=date, status='confirmed').order_by('time', 'id').values(
+        'id', 'customer_name', 'time', 'guests')
+    for row in rows:
+        held = tables.get(row['id'], [])
+        covers += row['guests']
+        if held:
+            seated += row['guests']
+            wasted += sum(seats for _, seats in held) - row['guests']
+        bookings.append({**row, 'tables': [name for name, _ in held]})
+    return {
+        'date': date,
+        'covers': covers,
+        'seated_covers': seated,
+        'wasted_seats': wasted,
+        'unseated': [booking['id'] for booking in bookings if not booking['tables']],
+        'bookings': bookings,
+    }
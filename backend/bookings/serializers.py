@@ -5,3 +5,10 @@ class BookingSerializer(serializers.ModelSerializer):
     class Meta:
         model = Booking
         fields = '__all__'
+
+class SeatingQuerySerializer(serializers.Serializer):
+    date = serializers.DateField()
+
+class AvailabilityQuerySerializer(serializers.Serializer):
+    date = serializers.DateField()
+    guests = serializers.IntegerField(min_value=1, default=1)
@@ -0,0 +1,40 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .availability import apply_occupancy_change, footprint
+from .models import Booking
+from .seating import release_booking, seat_booking
+
+FOOTPRINT_FIELDS = ('date', 'time', 'guests', 'status')
+
+
+@receiver(pre_save, sender=Booking)
+def remember_previous_footprint(sender, instance, **kwargs):
+    previous = None
+    if instance.pk:
+        previous = Booking.objects.filter(pk=instance.pk).values(*FOOTPRINT_FIELDS).first()
+    instance._previous_state = previous
+    instance._previous_footprint = footprint(**previous) if previous else None
+
+
+@receiver(post_save, sender=Booking)
+def update_occupancy_on_save(sender, instance, **kwargs):
+    current = footprint(instance.date, instance.time, instance.guests, instance.status)
+    apply_occupancy_change(getattr(instance, '_previous_footprint', None), current)
+
+
+@receiver(post_save, sender=Booking)
+def update_tables_on_save(sender, instance, **kwargs):
+    previous = getattr(instance, '_previous_state', None)
+    if previous == {field: getattr(instance, field) for field in FOOTPRINT_FIELDS}:
+        return
+    if instance.status == 'confirmed':
+        seat_booking(instance.pk)
+    elif previous and previous['status'] == 'confirmed':
+        release_booking(instance.pk)
+
+
+@receiver(post_delete, sender=Booking)
+def update_occupancy_on_delete(sender, instance, **kwargs):
+    previous = footprint(instance.date, instance.time, instance.guests, instance.status)
+    apply_occupancy_change(previous, None)
@@ -1,3 +1,80 @@
-from django.test import TestCase
+from datetime import date, time
 
-# Create your tests here.
+from django.core.exceptions import ValidationError
+from django.test import TestCase, override_settings
+
+from config.testing import ConcurrentTestCase, run_concurrently
+
+from .availability import day_availability, rebuild_occupancy
+from .models import Booking, SeatingDay, ServiceSlot, SlotOccupancy, Table, TableAssignment
+
+
+class ServiceSlotTestCase(TestCase):
+    def test_off_grid_slot_is_rejected(self):
+        with self.assertRaises(ValidationError):
+            ServiceSlot(time=time(19, 10), capacity=40).full_clean()
+        ServiceSlot(time=time(19, 30), capacity=40).full_clean()
+
+    def test_booking_between_starts_counts_toward_its_slot(self):
+        ServiceSlot.objects.create(time=time(19), capacity=40)
+        Booking.objects.create(customer_name='Guest', phone='0', email='g@example.com', date=date(2026, 12, 24),
+                               time=time(19, 10), guests=4)
+        slot, = day_availability(date(2026, 12, 24), guests=2)
+        self.assertEqual((slot['booked'], slot['remaining']), (4, 36))
+
+
+@override_settings(BOOKING_SLOT_MINUTES=30, BOOKING_DINING_MINUTES=120)
+class OverlappingSlotsTestCase(TestCase):
+    DAY = date(2026, 12, 24)
+
+    def setUp(self):
+        ServiceSlot.objects.bulk_create(ServiceSlot(time=time(hour, minute), capacity=10)
+                                        for hour in (18, 19, 20, 21) for minute in (0, 30))
+        self.booking = Booking.objects.create(customer_name='Party', phone='0', email='p@example.com', date=self.DAY,
+                                              time=time(19), guests=8)
+
+    def booked(self):
+        return {slot['time']: slot['booked'] for slot in day_availability(self.DAY, guests=1) if slot['booked']}
+
+    def test_party_holds_seats_until_it_leaves(self):
+        seated = {time(19): 8, time(19, 30): 8, time(20): 8, time(20, 30): 8}
+        self.assertEqual(self.booked(), seated)
+        rebuild_occupancy()
+        self.assertEqual(self.booked(), seated)
+
+        self.booking.time = time(20)
+        self.booking.save()
+        self.assertEqual(self.booked(), {time(20): 8, time(20, 30): 8, time(21): 8, time(21, 30): 8})
+        self.booking.status = 'cancelled'
+        self.booking.save()
+        self.assertEqual(self.booked(), {})
+        self.assertFalse(SlotOccupancy.objects.exclude(guests=0).exists())
+
+    def test_later_party_must_fit_every_slot_it_stays_for(self):
+        available = {slot['time']: slot['available'] for slot in day_availability(self.DAY, guests=4)}
+        # 18:00 would still be seated at 19:00 and 19:30; 21:00 starts after the party leaves
+        self.assertEqual([available[time(18)], available[time(18, 30)], available[time(20, 30)], available[time(21)]],
+                         [False, False, False, True])
+
+
+class SeatingConcurrencyTestCase(ConcurrentTestCase):
+    def test_overlapping_confirmations_get_different_tables(self):
+        Table.objects.bulk_create(Table(name=f'T{i}', seats=4) for i in range(2))
+        bookings = Booking.objects.bulk_create(
+            Booking(customer_name=f'Guest {i}', phone='0', email='g@example.com', date=date(2026, 12, 24),
+                    time=time(19), guests=4)
+            for i in range(2)
+        )
+
+        def confirm(booking):
+            def run():
+                booking.status = 'confirmed'
+                booking.save()
+            return run
+
+        run_concurrently(*(confirm(booking) for booking in bookings))
+        assignments = list(TableAssignment.objects.values_list('booking_id', 'table_id'))
+        self.assertEqual(len(assignments), 2)
+        self.assertEqual({booking_id for booking_id, _ in assignments}, {booking.id for booking in bookings})
+        self.assertEqual(len({table_id for _, table_id in assignments}), 2)
+        self.assertEqual(SeatingDay.objects.get().date, date(2026, 12, 24))
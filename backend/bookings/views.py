@@ -1,7 +1,55 @@
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from config.exports import EXPORT_CHUNK_SIZE, EXPORT_RENDERERS, ExportQuerySerializer, date_range_filter, stream_export
+from config.fastread import ValuesListMixin, ValuesSerializer
+from .availability import day_availability
 from .models import Booking
-from .serializers import BookingSerializer
+from .seating import optimize_service, seating_plan
+from .serializers import AvailabilityQuerySerializer, BookingSerializer, SeatingQuerySerializer
 
-class BookingViewSet(viewsets.ModelViewSet):
+EXPORT_FIELDS = ['id', 'date', 'time', 'guests', 'status', 'customer_name', 'phone', 'email',
+                 'special_request', 'created_at', 'updated_at']
+
+class BookingViewSet(ValuesListMixin, viewsets.ModelViewSet):
     queryset = Booking.objects.all()
     serializer_class = BookingSerializer
+    values_serializer = ValuesSerializer(BookingSerializer)
+
+    @action(detail=False, methods=['get'])
+    def availability(self, request):
+        query = AvailabilityQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        date, guests = query.validated_data['date'], query.validated_data['guests']
+        return Response({
+            'date': date,
+            'guests': guests,
+            'slots': day_availability(date, guests),
+        })
+
+    @action(detail=False, methods=['get'])
+    def seating(self, request):
+        """Tables held by each confirmed booking on ``date``."""
+        query = SeatingQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        return Response(seating_plan(query.validated_data['date']))
+
+    @action(detail=False, methods=['post'], url_path='seating/optimize')
+    def optimize_seating(self, request):
+        """Re-pack every confirmed booking on ``date`` onto the tables."""
+        query = SeatingQuerySerializer(data=request.data)
+        query.is_valid(raise_exception=True)
+        return Response(optimize_service(query.validated_data['date']))
+
+    @action(detail=False, methods=['get'], renderer_classes=EXPORT_RENDERERS)
+    def export(self, request):
+        """Stream bookings whose date falls in ``start``..``end`` as CSV or NDJSON."""
+        query = ExportQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        rows = (
+            Booking.objects.filter(**date_range_filter('date', timestamp=False, **query.validated_data))
+            .order_by('date', 'time', 'id')
+            .values(*EXPORT_FIELDS)
+            .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        )
+        return stream_export(request, 'bookings', EXPORT_FIELDS, rows)
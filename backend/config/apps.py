@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class ProjectConfig(AppConfig):
+    name = 'config'
+    verbose_name = 'Project'
+
+    def ready(self):
+        if 'config.metrics.MetricsMiddleware' in settings.MIDDLEWARE:
+            from .metrics import install_serializer_timer
+            install_serializer_timer()
@@ -2,6 +2,15 @@
 ASGI config for config project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Order status streams are routed to ``orders.sse`` directly so long-lived
+connections never hold a Django request thread.
+
+The streams only exist when the project is served through this module,
+e.g. ``uvicorn config.asgi:application`` or ``daphne config.asgi:application``.
+Plain ``manage.py runserver`` is WSGI and answers them with 404 unless
+daphne is installed, which settings then add to INSTALLED_APPS so that
+runserver serves ASGI. The frontend falls back to polling when a stream
+fails.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/6.0/howto/deployment/asgi/
@@ -13,4 +22,13 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+from orders.sse import match_stream_path, order_stream_app  # noqa: E402
+
+
+async def application(scope, receive, send):
+    if scope['type'] == 'http' and match_stream_path(scope['path']):
+        await order_stream_app(scope, receive, send)
+    else:
+        await django_application(scope, receive, send)
@@ -0,0 +1,43 @@
+"""Bulk inserts of back-dated rows.
+
+``auto_now_add`` fields are overwritten with the current time when a row
+is inserted, including through ``bulk_create``. ``bulk_create_backdated``
+inserts the rows as usual and then writes the values the instances held
+back by primary key, in the same transaction. The model field is never
+touched, so rows other threads create meanwhile keep their timestamps,
+and no reader ever sees the placeholder values.
+
+The write-back is one ``executemany`` of a plain ``UPDATE ... WHERE pk``:
+``bulk_update`` builds a ``CASE`` expression per batch and costs several
+times the insert itself on the generator's chunk sizes.
+"""
+from django.db import connections, transaction
+
+
+def bulk_create_backdated(objects, fields=('created_at',), batch_size=None):
+    """``bulk_create`` instances of one model, keeping what they hold in ``fields``."""
+    objects = list(objects)
+    if not objects:
+        return objects
+    model = type(objects[0])
+    manager = model._default_manager
+    connection = connections[manager.db]
+    fields = [model._meta.get_field(name) for name in fields]
+    wanted = [[getattr(obj, field.attname) for field in fields] for obj in objects]
+    quote = connection.ops.quote_name
+    sql = 'UPDATE {} SET {} WHERE {} = %s'.format(
+        quote(model._meta.db_table),
+        ', '.join(f'{quote(field.column)} = %s' for field in fields),
+        quote(model._meta.pk.column),
+    )
+    with transaction.atomic(using=manager.db):
+        objects = manager.bulk_create(objects, batch_size=batch_size)
+        params = []
+        for obj, values in zip(objects, wanted):
+            for field, value in zip(fields, values):
+                setattr(obj, field.attname, value)
+            params.append([field.get_db_prep_save(value, connection) for field, value in zip(fields, values)]
+                          + [obj.pk])
+        with connection.cursor() as cursor:
+            cursor.executemany(sql, params)
+    return objects
@@ -0,0 +1,167 @@
+"""Serializer-free list responses built from ``values()`` rows.
+
+``ValuesSerializer(SomeModelSerializer)`` reads the serializer's readable
+fields once and compiles one converter per column: ISO dates, times and
+UTC datetimes, DRF's decimal strings, and plain pass-through for strings,
+numbers, booleans and primary keys. Any other simple field falls back to
+the field's own ``to_representation``. Rows then come from a ``values()``
+query over just those columns and are turned into the same dicts
+``SomeModelSerializer(many=True).data`` would produce, without building a
+model instance or walking serializer fields per row.
+
+Nested ``many=True`` serializers over a reverse foreign key (an order's
+``items``) are fetched with one extra query per page. Fields that need the
+instance (``SerializerMethodField``, ``source='*'``, many-to-many,
+hyperlinks) raise ``TypeError`` when the reader is built.
+
+Viewsets opt in with ``ValuesListMixin`` and a ``values_serializer``.
+"""
+import decimal
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import relations, serializers
+from rest_framework.response import Response
+from rest_framework.settings import ISO_8601, api_settings
+
+# Field types whose to_representation returns the database value unchanged
+PASS_THROUGH = (
+    serializers.BooleanField, serializers.CharField, serializers.FloatField, serializers.IntegerField,
+    serializers.ReadOnlyField,
+)
+
+
+def iso_datetime(tz):
+    def convert(value):
+        if tz is not None:
+            value = value.astimezone(tz)
+        value = value.isoformat()
+        return value[:-6] + 'Z' if value.endswith('+00:00') else value
+    return convert
+
+
+def iso(value):
+    return value.isoformat()
+
+
+def decimal_string(field):
+    exponent = decimal.Decimal('.1') ** field.decimal_places
+    context = decimal.getcontext().copy()
+    if field.max_digits is not None:
+        context.prec = field.max_digits
+
+    def convert(value):
+        return f'{value.quantize(exponent, rounding=field.rounding, context=context):f}'
+    return convert
+
+
+def column_converter(field):
+    """A converter for one field's column value, or ``None`` to pass it through unchanged.
+
+    ``iso_datetime`` is returned uncalled: it is bound to the active time
+    zone once per request.
+    """
+    if isinstance(field, serializers.DateTimeField):
+        if getattr(field, 'format', api_settings.DATETIME_FORMAT) == ISO_8601 and not hasattr(field, 'timezone'):
+            return iso_datetime
+        return field.to_representation
+    if isinstance(field, (serializers.DateField, serializers.TimeField)):
+        default = api_settings.DATE_FORMAT if isinstance(field, serializers.DateField) else api_settings.TIME_FORMAT
+        return iso if getattr(field, 'format', default) == ISO_8601 else field.to_representation
+    if isinstance(field, serializers.DecimalField):
+        plain = (
+            getattr(field, 'coerce_to_string', api_settings.COERCE_DECIMAL_TO_STRING)
+            and not field.localize and not field.normalize_output and field.decimal_places is not None
+        )
+        return decimal_string(field) if plain else field.to_representation
+    if isinstance(field, serializers.ChoiceField):
+        # Values come back unchanged as long as every choice key is a string
+        return None if all(isinstance(key, str) for key in field.choices) else field.to_representation
+    if isinstance(field, relations.PrimaryKeyRelatedField):
+        return None if field.pk_field is None else field.pk_field.to_representation
+    if isinstance(field, PASS_THROUGH):
+        return None
+    if isinstance(field, (serializers.SerializerMethodField, relations.RelatedField, relations.ManyRelatedField,
+                          serializers.Serializer, serializers.ListSerializer)):
+        raise TypeError(f'{type(field).__name__} {field.field_name!r} needs the model instance')
+    return field.to_representation
+
+
+class ValuesSerializer:
+    def __init__(self, serializer_class):
+        self.model = serializer_class.Meta.model
+        pk = self.model._meta.pk.attname
+        self.lookups = [pk]
+        self.columns = []  # (output key, values() lookup, converter)
+        self.nested = []  # (output key, ValuesSerializer, foreign key attname)
+
+        for field in serializer_class().fields.values():
+            if field.write_only:
+                continue
+            if field.source == '*':
+                raise TypeError(f'{field.field_name!r} uses source="*" and needs the model instance')
+            if isinstance(field, serializers.ListSerializer) and isinstance(field.child, serializers.ModelSerializer):
+                relation = self.model._meta.get_field(field.source)
+                if not relation.one_to_many:
+                    raise TypeError(f'{field.field_name!r} is not a reverse foreign key')
+                self.nested.append((field.field_name, ValuesSerializer(type(field.child)), relation.field.attname))
+                self.columns.append((field.field_name, None, None))
+                continue
+            lookup = field.source.replace('.', '__')
+            if lookup not in self.lookups:
+                self.lookups.append(lookup)
+            self.columns.append((field.field_name, lookup, column_converter(field)))
+
+    def rows(self, queryset):
+        """``queryset`` as ``values()`` rows carrying every column the output needs."""
+        return queryset.prefetch_related(None).values(*self.lookups)
+
+    def convert(self, rows):
+        rows = list(rows)
+        tz = timezone.get_current_timezone() if settings.USE_TZ else None
+        columns = [
+            (key, lookup, converter(tz) if converter is iso_datetime else converter)
+            for key, lookup, converter in self.columns
+        ]
+        children = {key: self._children(reader, attname, rows) for key, reader, attname in self.nested}
+
+        pk = self.model._meta.pk.attname
+        data = []
+        for row in rows:
+            item = {}
+            for key, lookup, converter in columns:
+                if lookup is None:
+                    item[key] = children[key].get(row[pk], [])
+                    continue
+                value = row[lookup]
+                item[key] = value if converter is None or value is None else converter(value)
+            data.append(item)
+        return data
+
+    def _children(self, reader, attname, rows):
+        pk = self.model._meta.pk.attname
+        ids = [row[pk] for row in rows]
+        if not ids:
+            return {}
+        queryset = reader.model._default_manager.filter(**{f'{attname}__in': ids}).order_by(attname, 'pk')
+        child_rows = list(queryset.values(attname, *reader.lookups))
+        grouped = {}
+        for row, item in zip(child_rows, reader.convert(child_rows)):
+            grouped.setdefault(row[attname], []).append(item)
+        return grouped
+
+
+class ValuesListMixin:
+    """Serve ``list`` through ``values_serializer`` instead of the viewset's serializer.
+
+    Filtering, ordering and pagination still apply to the queryset; only the
+    row fetching and representation change.
+    """
+    values_serializer = None
+
+    def list(self, request, *args, **kwargs):
+        rows = self.values_serializer.rows(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(self.values_serializer.convert(page))
+        return Response(self.values_serializer.convert(rows))
@@ -0,0 +1,249 @@
+"""Always-on request metrics exported in Prometheus text format.
+
+``MetricsMiddleware`` records per route (the URL name, e.g. ``order-list``):
+request count by method and status, a latency histogram, SQL statements
+and time (via ``connection.execute_wrapper``), and time spent building
+serializer ``.data``. ``metrics_view`` serves them at ``/api/_metrics``.
+
+A streamed response (the CSV/NDJSON exports) runs its queries while the
+body is read, after the view has returned. Its body is wrapped so every
+chunk is produced with the request's stats active, and the request is
+recorded when the stream ends.
+
+The serializer timer is a patched ``BaseSerializer.data``, installed once
+from ``ProjectConfig.ready()`` when the middleware is enabled. Outside a
+measured request it only costs a context variable lookup.
+
+Counters live in process memory, so each worker reports its own series.
+"""
+import bisect
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+
+from django.db import connections
+from django.http import HttpResponse
+from rest_framework.serializers import BaseSerializer
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+METRICS_PATH = '/api/_metrics'
+
+_current = ContextVar('request_metrics', default=None)
+
+
+class RequestStats:
+    __slots__ = ('queries', 'query_seconds', 'serializer_seconds', 'serializing')
+
+    def __init__(self):
+        self.queries = 0
+        self.query_seconds = 0.0
+        self.serializer_seconds = 0.0
+        self.serializing = False
+
+
+class Histogram:
+    __slots__ = ('buckets', 'counts', 'total', 'count')
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests = {}
+            self.latency = {}
+            self.query_counts = {}
+            self.query_seconds = {}
+            self.serializer_seconds = {}
+
+    def record(self, route, method, status, seconds, stats):
+        with self._lock:
+            key = (route, method, str(status))
+            self.requests[key] = self.requests.get(key, 0) + 1
+            if (route, method) not in self.latency:
+                self.latency[route, method] = Histogram(LATENCY_BUCKETS)
+                self.query_counts[route, method] = Histogram(QUERY_COUNT_BUCKETS)
+            self.latency[route, method].observe(seconds)
+            self.query_counts[route, method].observe(stats.queries)
+            self.query_seconds[route] = self.query_seconds.get(route, 0.0) + stats.query_seconds
+            self.serializer_seconds[route] = self.serializer_seconds.get(route, 0.0) + stats.serializer_seconds
+
+    def render(self):
+        lines = []
+        with self._lock:
+            lines += _counter('http_requests_total', 'Requests handled.',
+                              {('route', 'method', 'status'): self.requests})
+            lines += _histogram('http_request_duration_seconds', 'Request latency in seconds.', self.latency)
+            lines += _histogram('http_request_db_queries', 'SQL statements per request.', self.query_counts)
+            lines += _counter('db_query_duration_seconds_total', 'Time spent executing SQL.',
+                              {('route',): {(route,): value for route, value in self.query_seconds.items()}})
+            lines += _counter('serializer_duration_seconds_total', 'Time spent building serializer data.',
+                              {('route',): {(route,): value for route, value in self.serializer_seconds.items()}})
+        return '\n'.join(lines) + '\n'
+
+
+def _labels(names, values):
+    pairs = ','.join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return '{' + pairs + '}' if pairs else ''
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _counter(name, help_text, series):
+    lines = [f'# HELP {name} {help_text}', f'# TYPE {name} counter']
+    for names, values in series.items():
+        for key, value in sorted(values.items()):
+            lines.append(f'{name}{_labels(names, key)} {value}')
+    return lines
+
+
+def _histogram(name, help_text, histograms):
+    lines = [f'# HELP {name} {help_text}', f'# TYPE {name} histogram']
+    for (route, method), histogram in sorted(histograms.items()):
+        cumulative = 0
+        for bound, count in zip((*histogram.buckets, '+Inf'), histogram.counts):
+            cumulative += count
+            le = bound if bound == '+Inf' else repr(float(bound))
+            lines.append(f'{name}_bucket{_labels(("route", "method", "le"), (route, method, le))} {cumulative}')
+        labels = _labels(('route', 'method'), (route, method))
+        lines.append(f'{name}_sum{labels} {histogram.total}')
+        lines.append(f'{name}_count{labels} {histogram.count}')
+    return lines
+
+
+registry = MetricsRegistry()
+
+
+def _time_queries(execute, sql, params, many, context):
+    stats = _current.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.queries += 1
+        stats.query_seconds += time.perf_counter() - started
+
+
+_serializer_timer_installed = False
+
+
+def install_serializer_timer():
+    """Time ``BaseSerializer.data``, the one entry point every top-level serializer goes through."""
+    global _serializer_timer_installed
+    if _serializer_timer_installed:
+        return
+    _serializer_timer_installed = True
+    original = BaseSerializer.data
+
+    def data(self):
+        stats = _current.get()
+        if stats is None or stats.serializing:
+            return original.fget(self)
+        stats.serializing = True
+        started = time.perf_counter()
+        try:
+            return original.fget(self)
+        finally:
+            stats.serializer_seconds += time.perf_counter() - started
+            stats.serializing = False
+
+    BaseSerializer.data = property(data)
+
+
+@contextmanager
+def _measuring(stats):
+    """Count queries on every connection, and serializer time, towards ``stats``."""
+    token = _current.set(stats)
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(_time_queries))
+            yield
+    finally:
+        _current.reset(token)
+
+
+_END = object()
+
+
+def _measured_stream(content, stats, done):
+    # Each chunk is produced inside its own measuring block, so nothing is
+    # left set between chunks or if the client goes away mid-stream
+    iterator = iter(content)
+    try:
+        while True:
+            with _measuring(stats):
+                chunk = next(iterator, _END)
+            if chunk is _END:
+                return
+            yield chunk
+    finally:
+        if hasattr(iterator, 'close'):
+            iterator.close()
+        done()
+
+
+async def _measured_async_stream(content, stats, done):
+    iterator = aiter(content)
+    try:
+        while True:
+            with _measuring(stats):
+                chunk = await anext(iterator, _END)
+            if chunk is _END:
+                return
+            yield chunk
+    finally:
+        if hasattr(iterator, 'aclose'):
+            await iterator.aclose()
+        done()
+
+
+
+class MetricsMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if request.path == METRICS_PATH:
+            return self.get_response(request)
+
+        stats = RequestStats()
+        started = time.perf_counter()
+        with _measuring(stats):
+            response = self.get_response(request)
+
+        def done():
+            match = request.resolver_match
+            route = (match.view_name or match.route) if match else 'unmatched'
+            registry.record(route, request.method, response.status_code, time.perf_counter() - started, stats)
+
+        if not response.streaming:
+            done()
+        elif response.is_async:
+            response.streaming_content = _measured_async_stream(response.streaming_content, stats, done)
+        else:
+            response.streaming_content = _measured_stream(response.streaming_content, stats, done)
+        return response
+
+
+def metrics_view(request):
+    return HttpResponse(registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -0,0 +1,109 @@
+"""Send selected read-only endpoints to read replicas.
+
+Viewsets opt in with ``replica_actions`` (e.g. ``('list', 'retrieve')``);
+``ReplicaMiddleware`` turns replica reads on for safe requests to those
+actions, and ``ReplicaRouter`` then spreads their queries over
+``DATABASE_REPLICAS``. Everything else, and every write, uses ``default``.
+
+Read-your-writes: once a request writes, its remaining queries go to the
+primary, and a client that has just written successfully is pinned to the
+primary for ``REPLICA_PIN_SECONDS``. Clients are identified by their
+Authorization header, or their address when anonymous. Pins live in the
+``REPLICA_PIN_CACHE`` cache, which must be shared by every worker (Redis,
+Memcached, a database or file cache): with a per-process cache a client's
+next read could land on a worker that never saw its pin, so
+``ReplicaMiddleware`` refuses to start with one while replicas are on.
+"""
+import hashlib
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DEFAULT_DB_ALIAS
+
+PIN_KEY = 'replica:pin:{client}'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+# Backends that keep their entries inside one process, or keep none at all
+UNSHARED_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+# None: replicas off; otherwise a one-item list flipped to True on the first write
+_replica_reads = ContextVar('replica_reads', default=None)
+
+
+@contextmanager
+def replica_reads():
+    """Let reads in this block use a replica until the block writes."""
+    token = _replica_reads.set([False])
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        state = _replica_reads.get()
+        if state is None or state[0] or not settings.DATABASE_REPLICAS:
+            return DEFAULT_DB_ALIAS
+        return random.choice(settings.DATABASE_REPLICAS)
+
+    def db_for_write(self, model, **hints):
+        state = _replica_reads.get()
+        if state is not None:
+            state[0] = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+def client_key(request):
+    identity = request.META.get('HTTP_AUTHORIZATION') or request.META.get('REMOTE_ADDR', '')
+    return hashlib.sha1(identity.encode()).hexdigest()
+
+
+class ReplicaMiddleware:
+    def __init__(self, get_response):
+        if settings.DATABASE_REPLICAS:
+            backend = settings.CACHES[settings.REPLICA_PIN_CACHE]['BACKEND']
+            if backend in UNSHARED_CACHE_BACKENDS:
+                raise ImproperlyConfigured(
+                    f'Read replicas pin clients to the primary in REPLICA_PIN_CACHE, which must be shared by '
+                    f'every worker; {backend} is not'
+                )
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.replica_token = None
+        try:
+            response = self.get_response(request)
+        finally:
+            if request.replica_token is not None:
+                _replica_reads.reset(request.replica_token)
+
+        if request.method not in SAFE_METHODS and response.status_code < 400 and settings.DATABASE_REPLICAS:
+            caches[settings.REPLICA_PIN_CACHE].set(
+                PIN_KEY.format(client=client_key(request)), True, timeout=settings.REPLICA_PIN_SECONDS,
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if request.method not in SAFE_METHODS or not settings.DATABASE_REPLICAS:
+            return None
+        actions = getattr(view_func, 'actions', None) or {}
+        replica_actions = getattr(getattr(view_func, 'cls', None), 'replica_actions', ())
+        if actions.get(request.method.lower()) not in replica_actions:
+            return None
+        if caches[settings.REPLICA_PIN_CACHE].get(PIN_KEY.format(client=client_key(request))) is None:
+            request.replica_token = _replica_reads.set([False])
+        return None
@@ -27,19 +27,40 @@ INSTALLED_APPS = [
     'contact',
     'orders',
     'payments',
+    'analytics',
+    'dashboard',
+    'config',
 ]
 
+# Order status streams (/api/orders/<id>/stream/) are served by config/asgi.py
+# and need an ASGI server: uvicorn or daphne. With daphne installed,
+# `manage.py runserver` serves ASGI as well; without it the streams 404 and
+# the frontend falls back to polling.
+try:
+    import daphne  # noqa: F401
+except ImportError:
+    pass
+else:
+    INSTALLED_APPS.insert(0, 'daphne')
+
 # ... existing code ...
 
 # Stripe Settings
 STRIPE_PUBLISHABLE_KEY = 'pk_test_placeholder'
 STRIPE_SECRET_KEY = 'sk_test_placeholder'
 STRIPE_WEBHOOK_SECRET = 'whsec_placeholder'
+# Outbound Stripe calls (payments/gateway.py): None keeps Stripe's own API host
+STRIPE_API_BASE = None
+STRIPE_TIMEOUT = (2, 10)  # (connect, read) seconds
+STRIPE_MAX_NETWORK_RETRIES = 2
+STRIPE_POOL_SIZE = 20
 BACKEND_URL = 'http://localhost:8000'
 FRONTEND_URL = 'http://localhost:5173'
 
 
 MIDDLEWARE = [
+    'config.metrics.MetricsMiddleware',
+    'config.routers.ReplicaMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
@@ -69,6 +90,7 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'config.wsgi.application'
+ASGI_APPLICATION = 'config.asgi.application'
 
 DATABASES = {
     'default': {
@@ -77,6 +99,60 @@ DATABASES = {
     }
 }
 
+# DJANGO_DB_PROFILE=production tunes SQLite for concurrent traffic: WAL lets
+# readers run alongside the writer, IMMEDIATE transactions take the write
+# lock up front (so a read-then-write transaction waits on the busy timeout
+# instead of failing with "database is locked"), and connections are reused
+# across requests instead of reopened each time.
+DB_PROFILE = os.environ.get('DJANGO_DB_PROFILE', 'development')
+
+SQLITE_PRODUCTION_PRAGMAS = [
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',  # durable across app crashes; WAL keeps the file consistent on power loss
+    'PRAGMA mmap_size=268435456',  # 256 MiB
+    'PRAGMA cache_size=-65536',  # 64 MiB of page cache per connection
+    'PRAGMA temp_store=MEMORY',
+]
+
+if DB_PROFILE == 'production':
+    DATABASES['default'].update({
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'init_command': ';'.join(SQLITE_PRODUCTION_PRAGMAS),
+            'transaction_mode': 'IMMEDIATE',
+            'timeout': 20,  # busy timeout in seconds
+        },
+    })
+
+# Read replicas: DJANGO_DB_REPLICAS is a comma-separated list of SQLite files
+# (relative to backend/) holding copies of the primary, e.g. one refreshed by
+# `manage.py sync_replicas --watch` as a local stand-in. Only the endpoints
+# listed in a viewset's replica_actions read from them (config/routers.py).
+DATABASE_REPLICAS = []
+for number, name in enumerate(filter(None, os.environ.get('DJANGO_DB_REPLICAS', '').split(',')), start=1):
+    alias = f'replica{number}'
+    DATABASES[alias] = {
+        **DATABASES['default'],
+        'NAME': BASE_DIR / name.strip(),
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ['config.routers.ReplicaRouter']
+# How long a client reads from the primary after a write, covering replica lag
+REPLICA_PIN_SECONDS = 5
+# Where those pins live; must be a cache every worker shares while replicas are on
+REPLICA_PIN_CACHE = 'default'
+
+# Local memory is per process; point this at Redis/Memcached when running
+# several workers so menu version bumps are seen by all of them.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
 AUTH_PASSWORD_VALIDATORS = [
     { 'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator', },
     { 'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator', },
@@ -97,16 +173,46 @@ AUTH_USER_MODEL = 'users.CustomUser'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.ClaimsJWTAuthentication',
     )
 }
 
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=60),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
+    'TOKEN_USER_CLASS': 'users.authentication.ClaimsUser',
 }
 
+# How long request.user.db_user, and the revocation check, may use a stale CustomUser row
+JWT_USER_CACHE_SECONDS = 30
+
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:5173",
     "http://127.0.0.1:5173",
 ]
+
+# The kitchen queue treats delivery orders as placed this much earlier, so
+# they are cooked ahead of pickups that came in at about the same time
+KITCHEN_DELIVERY_HEAD_START_MINUTES = 5
+
+# Delivery ETAs (orders/eta.py). Starting guesses until the kitchen has
+# history, how many orders it cooks at once, how fast the moving averages
+# follow new timings, and how often they are written to PrepTimeStat
+ETA_DEFAULT_ITEM_MINUTES = 6
+ETA_DEFAULT_DELIVERY_MINUTES = 20
+ETA_KITCHEN_STATIONS = 3
+ETA_SMOOTHING = 0.2
+ETA_PERSIST_SECONDS = 60
+
+# Bookings are grouped into slots of this many minutes for availability
+BOOKING_SLOT_MINUTES = 30
+
+# How long a party holds its seats, in availability (bookings/availability.py)
+# and table assignment (bookings/seating.py), and how many tables of one
+# group may be pushed together for a party
+BOOKING_DINING_MINUTES = 120
+BOOKING_MAX_COMBINED_TABLES = 3
+
+# How long GET /api/dashboard/summary/ may be served from the cache; saves
+# to orders, bookings, stock and messages drop it sooner
+DASHBOARD_SUMMARY_TTL_SECONDS = 5
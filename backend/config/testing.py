@@ -0,0 +1,79 @@
+"""Helpers for tests that race threads against the database.
+
+Each thread gets its own connection. As in the production profile, these
+connections use IMMEDIATE transactions and a busy timeout, so SQLite
+queues the writers instead of failing one with "database is locked"; on
+other databases the options are left alone.
+
+SQLite's shared in-memory test database fails a lock conflict at once
+instead of waiting on the busy timeout, so tests that race threads live in
+a ``ConcurrentTestCase``. For the length of the class it points the
+connection at a copy of the test database in a temporary file of its own,
+which concurrent test runs never share.
+"""
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+
+from django.db import connection, connections
+from django.test import TransactionTestCase
+
+
+class ConcurrentTestCase(TransactionTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._memory_database = None
+        if connection.vendor == 'sqlite' and connection.is_in_memory_db():
+            cls._directory = tempfile.mkdtemp()
+            path = os.path.join(cls._directory, 'test.sqlite3')
+            connection.ensure_connection()
+            copy = sqlite3.connect(path)
+            connection.connection.backup(copy)
+            copy.close()
+            # The in-memory database lives as long as its connection; keep it aside
+            cls._memory_database = connection.settings_dict['NAME'], connection.connection
+            connection.connection = None
+            connection.settings_dict['NAME'] = path
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls._memory_database:
+            connection.close()
+            connection.settings_dict['NAME'], connection.connection = cls._memory_database
+            shutil.rmtree(cls._directory)
+        super().tearDownClass()
+
+
+def run_concurrently(*functions):
+    """Run each function in its own thread, all released at once; returns their results in order."""
+    if connection.vendor == 'sqlite' and connection.is_in_memory_db():
+        raise RuntimeError('run_concurrently() needs the file database of a ConcurrentTestCase')
+    barrier = threading.Barrier(len(functions))
+    results, errors = [None] * len(functions), []
+
+    def run(index, function):
+        try:
+            barrier.wait()
+            results[index] = function()
+        except Exception as e:
+            errors.append(e)
+        finally:
+            connections.close_all()
+
+    options = connection.settings_dict['OPTIONS']
+    if connection.vendor == 'sqlite':
+        connection.settings_dict['OPTIONS'] = {**options, 'transaction_mode': 'IMMEDIATE', 'timeout': 30}
+    try:
+        threads = [threading.Thread(target=run, args=item) for item in enumerate(functions)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        connection.settings_dict['OPTIONS'] = options
+    if errors:
+        raise errors[0]
+    return results
@@ -0,0 +1,279 @@
+import statistics
+import timeit
+import tracemalloc
+from datetime import date, time as dt_time, timedelta
+from decimal import Decimal
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.db.models import F
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import resolve
+from django.utils import timezone
+from rest_framework import viewsets
+from rest_framework.renderers import JSONRenderer
+from rest_framework.serializers import BaseSerializer
+
+from bookings.models import Booking
+from bookings.views import BookingViewSet
+from contact.models import ContactMessage
+from contact.views import ContactMessageViewSet
+from orders.models import Order, OrderItem
+from orders.views import OrderViewSet
+from stock.models import LowStockAlert, StockCategory, StockItem
+from stock.views import LowStockAlertViewSet, StockCategoryViewSet, StockItemViewSet
+from .bulk import bulk_create_backdated
+from .metrics import MetricsMiddleware, RequestStats, _current, _time_queries, install_serializer_timer, registry
+from .routers import ReplicaMiddleware
+
+
+def interleaved_medians(first, second, number=50, rounds=41):
+    """Median per-call time of two callables, measured in alternating rounds."""
+    times = ([], [])
+    for _ in range(rounds):
+        for samples, call in zip(times, (first, second)):
+            samples.append(timeit.timeit(call, number=number))
+    return statistics.median(times[0]) / number, statistics.median(times[1]) / number
+
+
+def render(view, request):
+    response = view(request)
+    response.accepted_renderer = JSONRenderer()
+    return response.render().content
+
+
+class ValuesListParityTestCase(TestCase):
+    """Every ``ValuesListMixin`` list renders byte for byte what its ModelSerializer did."""
+
+    VIEWSETS = {
+        '/api/orders/?page_size=2': OrderViewSet,
+        '/api/bookings/': BookingViewSet,
+        '/api/contact/messages/': ContactMessageViewSet,
+        '/api/stock/items/': StockItemViewSet,
+        '/api/stock/categories/': StockCategoryViewSet,
+        '/api/stock/alerts/': LowStockAlertViewSet,
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        # Nullable columns left empty in every other row, odd decimals and microsecond timestamps
+        now = timezone.now().replace(microsecond=123456)
+        for i in range(5):
+            order = Order.objects.create(
+                customer_name=f'Customer {i} é', phone='0', address=None if i % 2 else f'{i} Main St',
+                delivery_method=('delivery', 'pickup')[i % 2], payment_method='card',
+                subtotal=Decimal('12.05') * i, delivery_fee=Decimal('5.00') if i % 2 else 0,
+                total=Decimal('1234.5'), estimated_arrival=now + timedelta(minutes=i) if i % 2 else None,
+            )
+            OrderItem.objects.bulk_create(
+                OrderItem(order=order, name=f'Dish {n}', price=Decimal('9.99'), quantity=n + 1,
+                          image=None if n % 2 else f'https://images.example.com/{n}.jpg')
+                for n in range(i % 3)
+            )
+            Booking.objects.create(customer_name=f'Guest {i}', phone='0', email=f'g{i}@example.com',
+                                   date=date(2026, 12, 20 + i), time=dt_time(18 + i, 30 * (i % 2)), guests=i + 1,
+                                   special_request=None if i % 2 else 'Window seat')
+            ContactMessage.objects.create(name=f'Visitor {i}', email=f'v{i}@example.com',
+                                          phone=None if i % 2 else '0', subject=None if i % 3 else 'Hello',
+                                          message='Lovely dinner!')
+        category = StockCategory.objects.create(name='Pantry')
+        for i in range(4):
+            StockItem.objects.create(name=f'Ingredient {i}', quantity=Decimal('2.5') * i, unit='kg', threshold=5,
+                                     category=category)
+
+    def serializer_view(self, viewset, action='list'):
+        # The same viewset without ValuesListMixin, i.e. list() through the serializer
+        plain = type(f'Serializer{viewset.__name__}', (viewsets.ModelViewSet,), {
+            'queryset': viewset.queryset, 'serializer_class': viewset.serializer_class,
+            'pagination_class': viewset.pagination_class,
+        })
+        return plain.as_view({'get': action})
+
+    def test_lists_match_serializer_output(self):
+        factory = RequestFactory()
+        for tz in ('UTC', 'Asia/Colombo'):
+            for path, viewset in self.VIEWSETS.items():
+                with self.subTest(tz=tz, path=path), timezone.override(tz):
+                    before, after = self.serializer_view(viewset), viewset.as_view({'get': 'list'})
+                    self.assertEqual(render(after, factory.get(path)), render(before, factory.get(path)))
+
+    def test_every_order_page_matches(self):
+        factory = RequestFactory()
+        before, after = self.serializer_view(OrderViewSet), OrderViewSet.as_view({'get': 'list'})
+        path, pages = '/api/orders/?page_size=2', 0
+        while path:
+            content = render(after, factory.get(path))
+            self.assertEqual(content, render(before, factory.get(path)))
+            path = (after(factory.get(path)).data['next'] or '').replace('http://testserver', '')
+            pages += 1
+        self.assertEqual(pages, 3)
+
+    def test_low_stock_matches_serializer_output(self):
+        low = StockItemViewSet.queryset.filter(quantity__lte=F('threshold'))
+        content = render(StockItemViewSet.as_view({'get': 'low'}), RequestFactory().get('/api/stock/items/low/'))
+        self.assertEqual(content, JSONRenderer().render(StockItemViewSet.serializer_class(low, many=True).data))
+        self.assertEqual(low.count(), 3)
+        self.assertEqual(LowStockAlert.objects.count(), 3)
+
+
+class MetricsTestCase(TestCase):
+    def setUp(self):
+        registry.reset()
+        self.order = Order.objects.create(customer_name='Test', phone='0', delivery_method='pickup', payment_method='cash',
+                             subtotal='10.00', total='10.00')
+
+    def test_queries_are_counted(self):
+        self.client.get('/api/orders/')
+        self.assertIn('http_request_db_queries_sum{route="order-list",method="GET"} 2', registry.render())
+
+    def test_streamed_export_is_recorded_when_it_ends(self):
+        response = self.client.get('/api/orders/export/?format=ndjson')
+        # The export's query runs while the body is read
+        self.assertNotIn('route="order-export"', registry.render())
+        self.assertEqual(len(b''.join(response.streaming_content).splitlines()), 1)
+        metrics = registry.render()
+        self.assertIn('http_request_db_queries_sum{route="order-export",method="GET"} 1', metrics)
+        self.assertIn('http_requests_total{route="order-export",method="GET",status="200"} 1', metrics)
+
+    def test_serializer_timer_is_installed_once(self):
+        timed = BaseSerializer.data
+        install_serializer_timer()
+        self.assertIs(BaseSerializer.data, timed)
+        self.client.get(f'/api/orders/{self.order.id}/')
+        self.assertGreater(registry.serializer_seconds['order-detail'], 0)
+
+
+class MetricsOverheadTestCase(TestCase):
+    """The middleware's cost relative to the cheapest real work it wraps.
+
+    Rounds with and without it alternate and the medians are compared, so a
+    busy machine slows both sides alike instead of failing the test.
+    """
+    # Measured at about 15% on the cheapest list and 7% on a query, also with the CPU
+    # busy; the bounds leave room for noise but not for the cost to double
+    MAX_REQUEST_RATIO = 1.5
+    MAX_QUERY_RATIO = 1.3
+
+    def setUp(self):
+        StockCategory.objects.bulk_create(StockCategory(name=f'Category {i}') for i in range(5))
+
+    def test_cost_per_request(self):
+        request = RequestFactory().get('/api/stock/categories/')
+        request.resolver_match = resolve('/api/stock/categories/')
+        view = request.resolver_match.func
+        bare, measured = interleaved_medians(lambda: view(request).render(),
+                                             lambda: MetricsMiddleware(view)(request).render())
+        self.assertLess(measured / bare, self.MAX_REQUEST_RATIO)
+
+    def test_cost_per_query(self):
+        def select():
+            return StockCategory.objects.filter(name='Category 3').exists()
+
+        def timed_select():
+            token = _current.set(RequestStats())
+            try:
+                with connection.execute_wrapper(_time_queries):
+                    return select()
+            finally:
+                _current.reset(token)
+
+        bare, measured = interleaved_medians(select, timed_select)
+        self.assertLess(measured / bare, self.MAX_QUERY_RATIO)
+
+
+class BulkCreateBackdatedTestCase(TestCase):
+    def test_keeps_the_given_timestamps(self):
+        when = timezone.now() - timedelta(days=30)
+        messages = bulk_create_backdated(
+            ContactMessage(name='Visitor', email='v@example.com', message='Hello', created_at=when - timedelta(hours=i))
+            for i in range(3)
+        )
+        self.assertEqual(
+            list(ContactMessage.objects.order_by('-created_at').values_list('created_at', flat=True)),
+            [when - timedelta(hours=i) for i in range(3)],
+        )
+        self.assertEqual([message.created_at for message in messages], [when - timedelta(hours=i) for i in range(3)])
+
+    def test_leaves_auto_now_add_alone(self):
+        bulk_create_backdated([ContactMessage(name='Old', email='o@example.com', message='Hi',
+                                              created_at=timezone.now() - timedelta(days=1))])
+        self.assertTrue(ContactMessage._meta.get_field('created_at').auto_now_add)
+        fresh = ContactMessage.objects.create(name='New', email='n@example.com', message='Hi')
+        self.assertIsNotNone(fresh.created_at)
+
+    def test_nothing_to_insert(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(bulk_create_backdated([]), [])
+
+
+class ExportMemoryTestCase(TestCase):
+    """The heap peak while a streamed export is read must not grow with its row count."""
+
+    def add_messages(self, count):
+        start, now = ContactMessage.objects.count(), timezone.now()
+        bulk_create_backdated(
+            ContactMessage(name=f'Visitor {start + i}', email=f'v{start + i}@example.com', subject='Feedback',
+                           message='Lovely dinner, thank you!', created_at=now - timedelta(seconds=start + i))
+            for i in range(count)
+        )
+
+    def add_orders(self, count):
+        orders = Order.objects.bulk_create(
+            Order(customer_name='Test', phone='0', delivery_method='pickup', payment_method='card',
+                  subtotal='20.00', total='20.00')
+            for _ in range(count)
+        )
+        OrderItem.objects.bulk_create(
+            OrderItem(order=order, name=name, price='10.00', quantity=1)
+            for order in orders for name in ('Dish', 'Dessert')
+        )
+
+    def peak(self, path):
+        tracemalloc.start()
+        try:
+            response = self.client.get(path)
+            lines = sum(chunk.count(b'\n') for chunk in response.streaming_content)
+            return lines, tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    def assertFlat(self, small, large):
+        # Three to five times the rows may not cost a quarter more heap
+        self.assertLess(large[1], small[1] * 1.25, f'peak {small[1]:,} B for {small[0]:,} lines, '
+                                                  f'{large[1]:,} B for {large[0]:,}')
+
+    def test_contact_export(self):
+        for path in ('/api/contact/messages/export/', '/api/contact/messages/export/?format=ndjson'):
+            with self.subTest(path=path):
+                ContactMessage.objects.all().delete()
+                self.add_messages(4_000)
+                self.peak(path)  # first-use allocations are not the export's
+                small = self.peak(path)
+                self.add_messages(16_000)
+                large = self.peak(path)
+                self.assertGreaterEqual(large[0], 20_000)
+                self.assertFlat(small, large)
+
+    def test_orders_export(self):
+        # Below a few thousand orders the buffers are still filling up
+        self.add_orders(6_000)
+        self.peak('/api/orders/export/?format=ndjson')
+        small = self.peak('/api/orders/export/?format=ndjson')
+        self.add_orders(12_000)
+        large = self.peak('/api/orders/export/?format=ndjson')
+        self.assertEqual(large[0], 18_000)
+        self.assertFlat(small, large)
+
+
+class ReplicaPinCacheTestCase(SimpleTestCase):
+    @override_settings(DATABASE_REPLICAS=['replica1'])
+    def test_per_process_pin_cache_is_refused(self):
+        with self.assertRaises(ImproperlyConfigured):
+            ReplicaMiddleware(lambda request: None)
+
+    @override_settings(DATABASE_REPLICAS=['replica1'], CACHES={
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+        'shared': {'BACKEND': 'django.core.cache.backends.db.DatabaseCache', 'LOCATION': 'replica_pins'},
+    }, REPLICA_PIN_CACHE='shared')
+    def test_shared_pin_cache_is_accepted(self):
+        ReplicaMiddleware(lambda request: None)
@@ -1,5 +1,6 @@
 from django.contrib import admin
 from django.urls import path, include
+from .metrics import metrics_view
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -10,4 +11,7 @@ urlpatterns = [
     path('api/contact/', include('contact.urls')),
     path('api/orders/', include('orders.urls')),
     path('api/payments/', include('payments.urls')),
+    path('api/analytics/', include('analytics.urls')),
+    path('api/dashboard/', include('dashboard.urls')),
+    path('api/_metrics', metrics_view, name='metrics'),
 ]
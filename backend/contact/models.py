@@ -6,7 +6,14 @@ class ContactMessage(models.Model):
     phone = models.CharField(max_length=20, blank=True, null=True)
     subject = models.CharField(max_length=255, blank=True, null=True)
     message = models.TextField()
+    is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Partial index holding only unread messages, for the dashboard count
+            models.Index(fields=['created_at'], name='contact_unread_idx', condition=models.Q(is_read=False)),
+        ]
+
     def __str__(self):
         return f"Message from {self.name} - {self.subject or 'No Subject'}"
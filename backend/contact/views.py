@@ -1,7 +1,26 @@
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from config.exports import EXPORT_CHUNK_SIZE, EXPORT_RENDERERS, ExportQuerySerializer, date_range_filter, stream_export
+from config.fastread import ValuesListMixin, ValuesSerializer
 from .models import ContactMessage
 from .serializers import ContactMessageSerializer
 
-class ContactMessageViewSet(viewsets.ModelViewSet):
+EXPORT_FIELDS = ['id', 'created_at', 'name', 'email', 'phone', 'subject', 'message']
+
+class ContactMessageViewSet(ValuesListMixin, viewsets.ModelViewSet):
     queryset = ContactMessage.objects.all()
     serializer_class = ContactMessageSerializer
+    values_serializer = ValuesSerializer(ContactMessageSerializer)
+
+    @action(detail=False, methods=['get'], renderer_classes=EXPORT_RENDERERS)
+    def export(self, request):
+        """Stream messages received in ``start``..``end`` as CSV or NDJSON."""
+        query = ExportQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        rows = (
+            ContactMessage.objects.filter(**date_range_filter('created_at', **query.validated_data))
+            .order_by('created_at', 'id')
+            .values(*EXPORT_FIELDS)
+            .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        )
+        return stream_export(request, 'contact-messages', EXPORT_FIELDS, rows)
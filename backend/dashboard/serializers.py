@@ -0,0 +1,11 @@
+from rest_framework import serializers
+
+class DashboardSummarySerializer(serializers.Serializer):
+    date = serializers.DateField()
+    orders_today = serializers.IntegerField()
+    orders_by_status = serializers.DictField(child=serializers.IntegerField())
+    revenue_today = serializers.DecimalField(max_digits=14, decimal_places=2)
+    upcoming_bookings = serializers.IntegerField()
+    pending_bookings = serializers.IntegerField()
+    low_stock = serializers.IntegerField()
+    unread_messages = serializers.IntegerField()
@@ -0,0 +1,22 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from bookings.models import Booking
+from contact.models import ContactMessage
+from orders.models import Order
+from orders.signals import order_status_changed, orders_placed
+from stock.models import LowStockAlert, StockItem
+
+from .summary import invalidate_summary
+
+
+# Status changes and stock consumption bypass post_save, hence the order signals
+@receiver([post_save, post_delete], sender=Order)
+@receiver([post_save, post_delete], sender=Booking)
+@receiver([post_save, post_delete], sender=StockItem)
+@receiver([post_save, post_delete], sender=LowStockAlert)
+@receiver([post_save, post_delete], sender=ContactMessage)
+@receiver([orders_placed, order_status_changed])
+def drop_dashboard_summary(sender, **kwargs):
+    transaction.on_commit(invalidate_summary)
@@ -0,0 +1,75 @@
+"""Counts and totals for the admin dashboard, from four aggregate queries.
+
+Each query is bounded by today or by what is still open: today's orders,
+bookings from today on, current low-stock alerts, unread messages. Each
+reads through an index, so the cost does not grow with history.
+
+The result is cached for ``DASHBOARD_SUMMARY_TTL_SECONDS``. It is also
+dropped when a change to any of its sources commits (see ``signals.py``).
+A summary built while such a transaction was still open can outlive that
+drop, but only until the TTL runs out.
+"""
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from bookings.models import Booking
+from contact.models import ContactMessage
+from orders.models import Order
+from stock.models import LowStockAlert
+
+from .serializers import DashboardSummarySerializer
+
+SUMMARY_KEY = 'dashboard:summary'
+
+
+def _midnight(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def build_summary():
+    now = timezone.localtime()
+    today = now.date()
+
+    by_status = {status: 0 for status, _ in Order.STATUS_CHOICES}
+    revenue = Decimal('0')
+    orders = (
+        Order.objects.filter(created_at__gte=_midnight(today), created_at__lt=_midnight(today + timedelta(days=1)))
+        .values('status').order_by().annotate(count=Count('id'), total=Sum('total'))
+        .values_list('status', 'count', 'total')
+    )
+    for status, count, total in orders:
+        by_status[status] = count
+        if status != 'cancelled':
+            revenue += total
+
+    bookings = Booking.objects.filter(date__gte=today).aggregate(
+        upcoming=Count('id', filter=Q(status='confirmed') & (Q(date__gt=today) | Q(time__gte=now.time()))),
+        pending=Count('id', filter=Q(status='pending')),
+    )
+    return {
+        'date': today,
+        'orders_today': sum(by_status.values()),
+        'orders_by_status': by_status,
+        'revenue_today': revenue,
+        'upcoming_bookings': bookings['upcoming'],
+        'pending_bookings': bookings['pending'],
+        'low_stock': LowStockAlert.objects.count(),
+        'unread_messages': ContactMessage.objects.filter(is_read=False).count(),
+    }
+
+
+def get_summary():
+    summary = cache.get(SUMMARY_KEY)
+    if summary is None:
+        summary = dict(DashboardSummarySerializer(build_summary()).data)
+        cache.set(SUMMARY_KEY, summary, timeout=settings.DASHBOARD_SUMMARY_TTL_SECONDS)
+    return summary
+
+
+def invalidate_summary():
+    cache.delete(SUMMARY_KEY)
@@ -0,0 +1,101 @@
+from datetime import datetime, time, timedelta
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from bookings.models import Booking
+from config.bulk import bulk_create_backdated
+from contact.models import ContactMessage
+from orders.models import Order
+from orders.transitions import transition_orders
+from stock.models import StockCategory, StockItem
+
+
+def make_order(total='10.00', **fields):
+    return Order.objects.create(customer_name='Test', phone='0', delivery_method='pickup', payment_method='cash',
+                                subtotal=total, total=total, **fields)
+
+
+def make_booking(day, status):
+    return Booking.objects.create(customer_name='Guest', phone='0', email='guest@example.com', date=day,
+                                  time=time(19), guests=2, status=status)
+
+
+def make_message(is_read=False):
+    return ContactMessage.objects.create(name='Visitor', email='v@example.com', message='Hello', is_read=is_read)
+
+
+class DashboardSummaryTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        today = timezone.localdate()
+        self.orders = [make_order('10.00'), make_order('15.50'), make_order('7.25')]
+        transition_orders([self.orders[1].id], 'confirmed')
+        transition_orders([self.orders[2].id], 'cancelled')
+        yesterday = timezone.make_aware(datetime.combine(today - timedelta(days=1), time(12)))
+        bulk_create_backdated([Order(customer_name='Old', phone='0', delivery_method='pickup', payment_method='cash',
+                                     subtotal='99.00', total='99.00', created_at=yesterday)])
+
+        make_booking(today + timedelta(days=1), 'confirmed')
+        make_booking(today + timedelta(days=3), 'confirmed')
+        make_booking(today + timedelta(days=2), 'pending')
+        make_booking(today + timedelta(days=2), 'cancelled')
+        make_booking(today - timedelta(days=1), 'confirmed')
+
+        category = StockCategory.objects.create(name='Dairy')
+        StockItem.objects.create(name='Milk', quantity=2, unit='l', threshold=10, category=category)
+        StockItem.objects.create(name='Butter', quantity=50, unit='kg', threshold=10, category=category)
+
+        make_message()
+        make_message()
+        make_message(is_read=True)
+
+    def summary(self):
+        response = self.client.get('/api/dashboard/summary/')
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_counts_match_the_data(self):
+        summary = self.summary()
+        self.assertEqual(summary['date'], timezone.localdate().isoformat())
+        self.assertEqual(summary['orders_today'], 3)
+        self.assertEqual(
+            {status: count for status, count in summary['orders_by_status'].items() if count},
+            {'pending': 1, 'confirmed': 1, 'cancelled': 1},
+        )
+        self.assertEqual(summary['revenue_today'], '25.50')
+        self.assertEqual(summary['upcoming_bookings'], 2)
+        self.assertEqual(summary['pending_bookings'], 1)
+        self.assertEqual(summary['low_stock'], 1)
+        self.assertEqual(summary['unread_messages'], 2)
+
+    def test_repeat_requests_are_served_from_the_cache(self):
+        self.summary()
+        with self.assertNumQueries(0):
+            self.summary()
+
+    def test_new_order_shows_up_before_the_ttl(self):
+        self.summary()
+        with self.captureOnCommitCallbacks(execute=True):
+            make_order('4.50')
+        summary = self.summary()
+        self.assertEqual((summary['orders_today'], summary['revenue_today']), (4, '30.00'))
+
+    def test_status_change_shows_up_before_the_ttl(self):
+        self.summary()
+        with self.captureOnCommitCallbacks(execute=True):
+            transition_orders([self.orders[0].id], 'cancelled')
+        summary = self.summary()
+        self.assertEqual((summary['orders_by_status']['cancelled'], summary['revenue_today']), (2, '15.50'))
+
+    def test_contact_messages_show_up_before_the_ttl(self):
+        self.summary()
+        with self.captureOnCommitCallbacks(execute=True):
+            make_message()
+        self.assertEqual(self.summary()['unread_messages'], 3)
+        message = ContactMessage.objects.filter(is_read=False).first()
+        message.is_read = True
+        with self.captureOnCommitCallbacks(execute=True):
+            message.save()
+        self.assertEqual(self.summary()['unread_messages'], 2)
@@ -0,0 +1,10 @@
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from .summary import get_summary
+
+
+class DashboardSummaryView(APIView):
+    """Today's orders and revenue, upcoming and pending bookings, low stock and unread messages."""
+
+    def get(self, request, *args, **kwargs):
+        return Response(get_summary())
@@ -0,0 +1,100 @@
+import gzip
+import hashlib
+import json
+import time
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework.utils.encoders import JSONEncoder
+
+from .models import MenuItem
+from .serializers import MenuItemSerializer
+
+# Optional encoders; without them only gzip is offered
+try:
+    import brotli
+except ImportError:
+    brotli = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+MENU_VERSION_KEY = 'menu:version'
+MENU_SNAPSHOT_KEY = 'menu:snapshot:{version}'
+MENU_SNAPSHOT_TIMEOUT = 60 * 60 * 24
+
+# Last snapshot seen by this process, so the hot path only asks the shared
+# cache for the version instead of unpickling the whole menu every request.
+_local_snapshot = (None, None)
+
+
+def get_menu_version():
+    version = cache.get(MENU_VERSION_KEY)
+    if version is None:
+        # add() so concurrent workers agree on a single starting version
+        cache.add(MENU_VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(MENU_VERSION_KEY)
+    return version
+
+
+def bump_menu_version():
+    # A fresh timestamp rather than incr() so an evicted key can never
+    # come back as a version that still has a stale snapshot cached.
+    version = time.time_ns()
+    cache.set(MENU_VERSION_KEY, version, timeout=None)
+    return version
+
+
+# Levels past these cost tens to hundreds of times more CPU for a few
+# percent on menu JSON, and the build runs inside the first GET after a change
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9
+ZSTD_LEVEL = 12
+
+
+def compress(payload):
+    """The payload in every content coding we can produce."""
+    bodies = {'identity': payload, 'gzip': gzip.compress(payload, compresslevel=GZIP_LEVEL, mtime=0)}
+    if brotli is not None:
+        bodies['br'] = brotli.compress(payload, quality=BROTLI_QUALITY)
+    if zstandard is not None:
+        bodies['zstd'] = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(payload)
+    return bodies
+
+
+def build_menu_snapshot():
+    # Always from the primary: a lagging replica would cache an old menu under the new version
+    data = MenuItemSerializer(MenuItem.objects.using(DEFAULT_DB_ALIAS), many=True).data
+    payload = json.dumps(data, cls=JSONEncoder, separators=(',', ':')).encode('utf-8')
+    return {
+        'etag': hashlib.sha1(payload).hexdigest(),
+        'bodies': compress(payload),
+    }
+
+
+def refresh_menu_snapshot():
+    """Start a new menu version and build its snapshot now rather than on the next read."""
+    bump_menu_version()
+    return get_menu_snapshot()
+
+
+def get_menu_snapshot():
+    """Return the cached ``{'etag', 'bodies'}`` snapshot for the current menu version.
+
+    ``bodies`` maps each content coding (``identity``, ``gzip`` and, when
+    installed, ``br`` and ``zstd``) to the JSON list of all menu items.
+    """
+    global _local_snapshot
+    version = get_menu_version()
+    local_version, local = _local_snapshot
+    if local_version == version:
+        return local
+
+    key = MENU_SNAPSHOT_KEY.format(version=version)
+    snapshot = cache.get(key)
+    if snapshot is None:
+        snapshot = build_menu_snapshot()
+        cache.set(key, snapshot, timeout=MENU_SNAPSHOT_TIMEOUT)
+    _local_snapshot = (version, snapshot)
+    return snapshot
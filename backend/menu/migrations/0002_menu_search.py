@@ -0,0 +1,66 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:06
+
+import logging
+
+from django.db import OperationalError, migrations, transaction
+
+logger = logging.getLogger(__name__)
+
+# External-content FTS5 index over the menu; the triggers keep it in step with
+# every write, including bulk_create and queryset.update().
+CREATE_SQL = [
+    """CREATE VIRTUAL TABLE menu_menuitem_fts USING fts5(
+        name, description, category,
+        content='menu_menuitem', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )""",
+    """CREATE TRIGGER menu_menuitem_fts_ai AFTER INSERT ON menu_menuitem BEGIN
+        INSERT INTO menu_menuitem_fts(rowid, name, description, category)
+        VALUES (new.id, new.name, new.description, new.category);
+    END""",
+    """CREATE TRIGGER menu_menuitem_fts_ad AFTER DELETE ON menu_menuitem BEGIN
+        INSERT INTO menu_menuitem_fts(menu_menuitem_fts, rowid, name, description, category)
+        VALUES ('delete', old.id, old.name, old.description, old.category);
+    END""",
+    """CREATE TRIGGER menu_menuitem_fts_au AFTER UPDATE OF name, description, category ON menu_menuitem BEGIN
+        INSERT INTO menu_menuitem_fts(menu_menuitem_fts, rowid, name, description, category)
+        VALUES ('delete', old.id, old.name, old.description, old.category);
+        INSERT INTO menu_menuitem_fts(rowid, name, description, category)
+        VALUES (new.id, new.name, new.description, new.category);
+    END""",
+    "INSERT INTO menu_menuitem_fts(menu_menuitem_fts) VALUES ('rebuild')",
+]
+DROP_SQL = [
+    'DROP TRIGGER IF EXISTS menu_menuitem_fts_ai',
+    'DROP TRIGGER IF EXISTS menu_menuitem_fts_ad',
+    'DROP TRIGGER IF EXISTS menu_menuitem_fts_au',
+    'DROP TABLE IF EXISTS menu_menuitem_fts',
+]
+
+def create_search_index(apps, schema_editor):
+    # Other databases, and SQLite builds without FTS5, use the portable search
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    try:
+        with transaction.atomic(using=schema_editor.connection.alias):
+            for sql in CREATE_SQL:
+                schema_editor.execute(sql)
+    except OperationalError as error:
+        # No table means menu/search.py falls back to the scan; say why it is missing
+        logger.warning('Menu search index not created, using the slower portable search instead: %s', error)
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for sql in DROP_SQL:
+        schema_editor.execute(sql)
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
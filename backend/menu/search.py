@@ -0,0 +1,112 @@
+"""Server-side menu search over name, description and category.
+
+On SQLite the ``menu_menuitem_fts`` FTS5 table (migration 0002, kept in
+sync by triggers) answers with bm25 ranking and prefix matching. On other
+databases, or a SQLite build without FTS5, an ``icontains`` scan with a
+field-weighted score stands in. Both paths return ``MenuItem`` instances
+carrying a ``highlight`` dict whose HTML-escaped text wraps matches in
+``<mark>``.
+"""
+import html
+import logging
+import re
+
+from django.db import connection
+from django.db.models import Case, IntegerField, Q, Value, When
+
+from .models import MenuItem
+
+FTS_TABLE = 'menu_menuitem_fts'
+# Name matches outrank category matches, which outrank description matches
+NAME_WEIGHT, DESCRIPTION_WEIGHT, CATEGORY_WEIGHT = 10, 1, 4
+SNIPPET_WORDS = 16
+# Control characters can't appear in menu text, so they survive html.escape
+MARK_START, MARK_END = '\x02', '\x03'
+
+logger = logging.getLogger(__name__)
+
+_fts_tables = {}
+
+
+def search_terms(query):
+    return re.findall(r'\w+', query.lower())
+
+
+def fts_available():
+    name = connection.settings_dict['NAME']
+    if name not in _fts_tables:
+        _fts_tables[name] = connection.vendor == 'sqlite' and FTS_TABLE in connection.introspection.table_names()
+        if connection.vendor == 'sqlite' and not _fts_tables[name]:
+            # Migration 0002 could not create it, e.g. SQLite without FTS5; it logged why
+            logger.warning('%s is missing, menu search falls back to a full scan', FTS_TABLE)
+    return _fts_tables[name]
+
+
+def search_menu(q, limit=20):
+    terms = search_terms(q)
+    if not terms:
+        return []
+    items = _fts_search(terms, limit) if fts_available() else _scan_search(terms, limit)
+    for item in items:
+        item.highlight = {'name': _render(item.name_marked), 'description': _render(item.description_marked)}
+    return items
+
+
+def _render(marked):
+    return html.escape(marked).replace(MARK_START, '<mark>').replace(MARK_END, '</mark>')
+
+
+def _fts_search(terms, limit):
+    match = ' '.join(f'"{term}"*' for term in terms)
+    # Rank first and only highlight the page: SQLite evaluates the select
+    # list for every match before ORDER BY ... LIMIT otherwise.
+    return list(MenuItem.objects.raw(
+        f"""
+        SELECT m.*,
+               highlight({FTS_TABLE}, 0, %s, %s) AS name_marked,
+               snippet({FTS_TABLE}, 1, %s, %s, '…', {SNIPPET_WORDS}) AS description_marked
+        FROM (
+            SELECT rowid AS id, bm25({FTS_TABLE}, {NAME_WEIGHT}, {DESCRIPTION_WEIGHT}, {CATEGORY_WEIGHT}) AS score
+            FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s
+            ORDER BY score, rowid LIMIT %s
+        ) top
+        JOIN {FTS_TABLE} ON {FTS_TABLE}.rowid = top.id
+        JOIN menu_menuitem m ON m.id = top.id
+        WHERE {FTS_TABLE} MATCH %s
+        ORDER BY top.score, top.id
+        """,
+        [MARK_START, MARK_END, MARK_START, MARK_END, match, limit, match],
+    ))
+
+
+def _scan_search(terms, limit):
+    matches = Q()
+    score = Value(0)
+    for term in terms:
+        matches &= Q(name__icontains=term) | Q(description__icontains=term) | Q(category__icontains=term)
+        for field, weight in (('name', NAME_WEIGHT), ('category', CATEGORY_WEIGHT),
+                              ('description', DESCRIPTION_WEIGHT)):
+            score += Case(When(**{f'{field}__icontains': term}, then=Value(weight)),
+                          default=Value(0), output_field=IntegerField())
+    items = list(MenuItem.objects.filter(matches).annotate(score=score).order_by('-score', 'id')[:limit])
+
+    pattern = re.compile(r'(?<!\w)(?:%s)\w*' % '|'.join(map(re.escape, terms)), re.IGNORECASE)
+    for item in items:
+        item.name_marked = _mark(pattern, item.name)
+        item.description_marked = _mark(pattern, _snippet(pattern, item.description))
+    return items
+
+
+def _mark(pattern, text):
+    return pattern.sub(lambda m: f'{MARK_START}{m.group(0)}{MARK_END}', text)
+
+
+def _snippet(pattern, text):
+    """Up to ``SNIPPET_WORDS`` words around the first match, like FTS5's snippet()."""
+    words = text.split()
+    if len(words) <= SNIPPET_WORDS:
+        return text
+    first = next((i for i, word in enumerate(words) if pattern.search(word)), 0)
+    start = max(0, min(first - SNIPPET_WORDS // 4, len(words) - SNIPPET_WORDS))
+    end = start + SNIPPET_WORDS
+    return ('…' if start else '') + ' '.join(words[start:end]) + ('…' if end < len(words) else '')
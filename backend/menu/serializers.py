@@ -5,3 +5,10 @@ class MenuItemSerializer(serializers.ModelSerializer):
     class Meta:
         model = MenuItem
         fields = '__all__'
+
+class MenuSearchQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=200)
+    limit = serializers.IntegerField(min_value=1, max_value=100, default=20)
+
+class MenuSearchResultSerializer(MenuItemSerializer):
+    highlight = serializers.DictField(child=serializers.CharField(), read_only=True)
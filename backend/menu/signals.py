@@ -0,0 +1,25 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import bump_menu_version
+from .models import MenuItem
+
+
+@receiver(post_save, sender=MenuItem)
+@receiver(post_delete, sender=MenuItem)
+def invalidate_menu_cache(sender, **kwargs):
+    # After commit so readers never cache a snapshot of uncommitted rows
+    transaction.get_connection().menu_snapshot_stale = True
+    transaction.on_commit(expire_stale_menu_snapshot)
+
+
+def expire_stale_menu_snapshot():
+    # Every change queues this; the first to run after a commit bumps the version and
+    # the rest find the flag cleared. A rolled-back change leaves the flag set but drops
+    # its callbacks with it. The snapshot itself is built by the next GET for the new
+    # version, so the saving request never pays for the encodings.
+    connection = transaction.get_connection()
+    if getattr(connection, 'menu_snapshot_stale', False):
+        connection.menu_snapshot_stale = False
+        bump_menu_version()
@@ -1,3 +1,69 @@
+from importlib import import_module
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import OperationalError, connection, transaction
 from django.test import TestCase
 
-# Create your tests here.
+from . import cache as menu_cache, search
+from .models import MenuItem
+
+
+def make_item(name):
+    return MenuItem.objects.create(name=name, description='House special.', price='12.50', category='Mains')
+
+
+class MenuInvalidationTestCase(TestCase):
+    def test_one_rebuild_per_transaction(self):
+        with mock.patch('menu.signals.bump_menu_version') as bump:
+            with self.captureOnCommitCallbacks(execute=True):
+                with transaction.atomic():
+                    for i in range(5):
+                        make_item(f'Dish {i}')
+        self.assertEqual(bump.call_count, 1)
+
+    def test_rolled_back_change_does_not_block_the_next(self):
+        with mock.patch('menu.signals.bump_menu_version') as bump:
+            with self.captureOnCommitCallbacks(execute=True):
+                try:
+                    with transaction.atomic():
+                        make_item('Dropped')
+                        raise RuntimeError
+                except RuntimeError:
+                    pass
+            self.assertEqual(bump.call_count, 0)
+            with self.captureOnCommitCallbacks(execute=True):
+                make_item('Kept')
+        self.assertEqual(bump.call_count, 1)
+
+    def test_snapshot_is_built_by_the_next_read(self):
+        cache.clear()
+        make_item('Starter')
+        self.assertEqual([item['name'] for item in self.client.get('/api/menu/items/').json()], ['Starter'])
+        with mock.patch.object(menu_cache, 'build_menu_snapshot', wraps=menu_cache.build_menu_snapshot) as build:
+            with self.captureOnCommitCallbacks(execute=True):
+                make_item('Dessert')
+            self.assertEqual(build.call_count, 0)
+            names = [item['name'] for item in self.client.get('/api/menu/items/').json()]
+            self.assertEqual(build.call_count, 1)
+        self.assertEqual(sorted(names), ['Dessert', 'Starter'])
+
+
+class SearchFallbackTestCase(TestCase):
+    def test_migration_logs_a_missing_fts5(self):
+        migration = import_module('menu.migrations.0002_menu_search')
+        schema_editor = mock.Mock(connection=connection)
+        schema_editor.execute.side_effect = OperationalError('no such module: fts5')
+        with self.assertLogs(migration.__name__, 'WARNING') as logs:
+            migration.create_search_index(None, schema_editor)
+        self.assertIn('no such module: fts5', logs.output[0])
+
+    def test_search_without_the_index_scans_and_warns(self):
+        make_item('Truffle Risotto')
+        with mock.patch.dict(search._fts_tables, clear=True), \
+                mock.patch.object(connection.introspection, 'table_names', return_value=[]):
+            with self.assertLogs('menu.search', 'WARNING'):
+                self.assertFalse(search.fts_available())
+            items = search.search_menu('truf')
+        self.assertEqual([item.name for item in items], ['Truffle Risotto'])
+        self.assertEqual(items[0].highlight['name'], '<mark>Truffle</mark> Risotto')
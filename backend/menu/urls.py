@@ -1,10 +1,12 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import MenuItemViewSet
+from .views import MenuItemViewSet, menu_items
 
 router = DefaultRouter()
 router.register(r'items', MenuItemViewSet)
 
 urlpatterns = [
+    # The menu list is served from the prebuilt snapshot, ahead of the router's list route
+    path('items/', menu_items, name='menuitem-list'),
     path('', include(router.urls)),
 ]
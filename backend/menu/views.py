@@ -1,7 +1,90 @@
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+from django.views.decorators.csrf import csrf_exempt
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from .cache import get_menu_snapshot
 from .models import MenuItem
-from .serializers import MenuItemSerializer
+from .search import search_menu
+from .serializers import MenuItemSerializer, MenuSearchQuerySerializer, MenuSearchResultSerializer
 
 class MenuItemViewSet(viewsets.ModelViewSet):
     queryset = MenuItem.objects.all()
     serializer_class = MenuItemSerializer
+    replica_actions = ('retrieve', 'search')
+
+    @action(detail=False, methods=['get'])
+    def search(self, request):
+        query = MenuSearchQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        items = search_menu(**query.validated_data)
+        return Response(MenuSearchResultSerializer(items, many=True).data)
+
+
+menu_item_list = MenuItemViewSet.as_view({'get': 'list', 'post': 'create'})
+
+
+def accepted_encodings(header):
+    """Map each coding in an Accept-Encoding header to its q-value."""
+    accepted = {}
+    for part in header.split(','):
+        coding, _, params = part.partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def choose_encoding(header, bodies):
+    """The smallest body the client accepts, falling back to identity."""
+    accepted = accepted_encodings(header)
+    codings = [
+        coding for coding in bodies
+        if coding != 'identity' and accepted.get(coding, accepted.get('*', 0)) > 0
+    ]
+    return min(codings, key=lambda coding: len(bodies[coding]), default='identity')
+
+
+def variant_etag(etag, coding):
+    return f'"{etag}"' if coding == 'identity' else f'"{etag}-{coding}"'
+
+
+@csrf_exempt
+def menu_items(request):
+    """GET the whole menu from the prebuilt snapshot, with no serializer or renderer.
+
+    The snapshot holds the JSON already compressed in each coding; the
+    smallest one the client accepts is sent as is. Writes go to the viewset.
+    """
+    if request.method not in ('GET', 'HEAD'):
+        return menu_item_list(request)
+
+    snapshot = get_menu_snapshot()
+    bodies = snapshot['bodies']
+    coding = choose_encoding(request.headers.get('Accept-Encoding', ''), bodies)
+    etag = variant_etag(snapshot['etag'], coding)
+
+    etags = parse_etags(request.headers.get('If-None-Match', ''))
+    if '*' in etags or any(variant_etag(snapshot['etag'], known) in etags for known in bodies):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(bodies[coding], content_type='application/json')
+        response['Content-Length'] = len(bodies[coding])
+        if coding != 'identity':
+            response['Content-Encoding'] = coding
+
+    response['ETag'] = etag
+    response['Cache-Control'] = 'no-cache'
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return response
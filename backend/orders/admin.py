@@ -1,3 +1,52 @@
-from django.contrib import admin
+from django import forms
+from django.contrib import admin, messages
+from django.db import transaction
+from .models import Order, OrderItem
+from .transitions import TransitionError, can_transition, transition_order
 
-# Register your models here.
+class OrderAdminForm(forms.ModelForm):
+    class Meta:
+        model = Order
+        fields = '__all__'
+
+    def clean_status(self):
+        status = self.cleaned_data['status']
+        previous = self.initial.get('status', status)
+        if status != previous and not can_transition(previous, status):
+            raise forms.ValidationError(f'Cannot move a {previous} order to {status}')
+        return status
+
+class OrderItemInline(admin.TabularInline):
+    model = OrderItem
+    extra = 0
+
+@admin.register(Order)
+class OrderAdmin(admin.ModelAdmin):
+    form = OrderAdminForm
+    list_display = ('id', 'customer_name', 'delivery_method', 'status', 'total', 'created_at')
+    list_filter = ('status', 'delivery_method')
+    search_fields = ('customer_name', 'phone')
+    inlines = [OrderItemInline]
+
+    def get_readonly_fields(self, request, obj=None):
+        # New orders start pending; later changes go through transition_order
+        readonly = ('created_at', 'status_changed_at', 'estimated_arrival')
+        return readonly if obj else readonly + ('status',)
+
+    def save_model(self, request, obj, form, change):
+        if not change:
+            return super().save_model(request, obj, form, change)
+        # Only the edited fields are written: a full save would put back the status
+        # the form was loaded with, and a plain status save would skip the history,
+        # restocking, alerts and events that transition_order sends
+        status = obj.status
+        fields = [name for name in form.changed_data if name != 'status']
+        try:
+            with transaction.atomic():
+                if fields:
+                    obj.save(update_fields=fields)
+                if 'status' in form.changed_data:
+                    obj.status = form.initial['status']
+                    transition_order(obj, status)
+        except TransitionError as e:
+            messages.error(request, f'Order not saved: {e}')
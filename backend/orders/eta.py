@@ -0,0 +1,152 @@
+"""Delivery ETAs from the current kitchen load and learned prep times.
+
+An order's ``estimated_arrival`` is set when it is confirmed:
+
+    now + work queued ahead / ETA_KITCHEN_STATIONS + its own prep time
+        (+ the ride, for delivery orders)
+
+Work is predicted prep time: quantity times the per-portion estimate of
+each item. Pending and confirmed orders ahead of this one in the kitchen
+queue count in full, and orders already preparing count only the part
+their prediction says is left. Both the queue (``kitchen_queue``) and the
+estimates live in memory, so estimating never reads order history.
+
+The estimates are exponential moving averages learned from transition
+timings. When an order leaves ``preparing``, its time there is split
+across its items by their predicted share, and every ``out-for-delivery``
+to ``delivered`` transition gives a ride time. They are loaded from
+``PrepTimeStat`` on first use and written back at most every
+``ETA_PERSIST_SECONDS``. Each worker learns on its own; the last to write
+wins.
+"""
+import bisect
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from .kitchen import entry_priority, item_entries, kitchen_queue, priority
+from .models import Order, OrderItem, PrepTimeStat
+
+ETA_DELIVERY_KEY = '__delivery__'
+
+
+class EtaEstimator:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = None  # key -> [seconds, samples]
+        self._dirty = set()
+        self._flushed_at = time.monotonic()
+
+    def _load(self):
+        if self._stats is None:
+            stats = {
+                key: [seconds, samples]
+                for key, seconds, samples in PrepTimeStat.objects.values_list('key', 'seconds', 'samples')
+            }
+            with self._lock:
+                if self._stats is None:
+                    self._stats = stats
+        return self._stats
+
+    def item_seconds(self, name):
+        stat = self._load().get(name)
+        return stat[0] if stat else settings.ETA_DEFAULT_ITEM_MINUTES * 60
+
+    def delivery_seconds(self):
+        stat = self._load().get(ETA_DELIVERY_KEY)
+        return stat[0] if stat else settings.ETA_DEFAULT_DELIVERY_MINUTES * 60
+
+    def prep_seconds(self, items):
+        stats, default = self._load(), (settings.ETA_DEFAULT_ITEM_MINUTES * 60,)
+        return sum(item['quantity'] * stats.get(item['name'], default)[0] for item in items or ())
+
+    def estimate(self, order, items, queue, now):
+        """When ``order`` (with ``items``) should arrive, or be ready for pickup, given the kitchen ``queue``."""
+        # The queue is sorted by priority, so the orders ahead of this one are a prefix of it
+        position = bisect.bisect_left(queue, priority(order), key=entry_priority)
+        ahead = 0.0
+        for index, entry in enumerate(queue):
+            if entry['id'] == order.id:
+                continue
+            if entry['status'] == 'preparing':
+                started = datetime.fromisoformat(entry['status_changed_at'])
+                ahead += max(self.prep_seconds(entry['items']) - (now - started).total_seconds(), 0.0)
+            elif entry['status'] in ('pending', 'confirmed') and index < position:
+                ahead += self.prep_seconds(entry['items'])
+
+        seconds = ahead / settings.ETA_KITCHEN_STATIONS + self.prep_seconds(items)
+        if order.delivery_method == 'delivery':
+            seconds += self.delivery_seconds()
+        return now + timedelta(seconds=seconds)
+
+    def _update(self, key, sample):
+        stat = self._stats.get(key)
+        if stat is None:
+            self._stats[key] = [sample, 1]
+        else:
+            # A plain mean over the first samples, so a new item settles quickly
+            stat[1] += 1
+            stat[0] += max(settings.ETA_SMOOTHING, 1 / stat[1]) * (sample - stat[0])
+        self._dirty.add(key)
+
+    def observe_prep(self, items, seconds):
+        """Learn from an order that spent ``seconds`` preparing ``items``."""
+        quantities = Counter()
+        for item in items:
+            quantities[item['name']] += item['quantity']
+        predicted = {name: quantity * self.item_seconds(name) for name, quantity in quantities.items()}
+        total = sum(predicted.values())
+        if seconds <= 0 or total <= 0:
+            return
+        with self._lock:
+            for name, quantity in quantities.items():
+                if quantity > 0:
+                    self._update(name, seconds * predicted[name] / total / quantity)
+
+    def observe_delivery(self, seconds):
+        self._load()
+        with self._lock:
+            self._update(ETA_DELIVERY_KEY, seconds)
+
+    def flush(self, force=False):
+        """Write changed estimates to ``PrepTimeStat`` if ``ETA_PERSIST_SECONDS`` have passed."""
+        if not force and time.monotonic() - self._flushed_at < settings.ETA_PERSIST_SECONDS:
+            return
+        with self._lock:
+            rows = [PrepTimeStat(key=key, seconds=self._stats[key][0], samples=self._stats[key][1])
+                    for key in self._dirty]
+            self._dirty.clear()
+            self._flushed_at = time.monotonic()
+        if rows:
+            PrepTimeStat.objects.bulk_create(
+                rows, update_conflicts=True, unique_fields=['key'], update_fields=['seconds', 'samples', 'updated_at'],
+            )
+
+
+eta_estimator = EtaEstimator()
+
+
+def order_items(order):
+    items = kitchen_queue.items(order.id)
+    if items is None:
+        items = item_entries(OrderItem.objects.filter(order=order))
+    return items
+
+
+def set_estimated_arrival(order, now=None):
+    """Estimate ``order``'s arrival from the current kitchen and store it."""
+    now = now or timezone.now()
+    order.estimated_arrival = eta_estimator.estimate(order, order_items(order), kitchen_queue.snapshot(), now)
+    Order.objects.filter(pk=order.pk).update(estimated_arrival=order.estimated_arrival)
+    return order.estimated_arrival
+
+
+def learn_from_transition(order, previous, status, duration):
+    if previous == 'preparing' and status != 'cancelled':
+        eta_estimator.observe_prep(order_items(order), duration.total_seconds())
+    elif previous == 'out-for-delivery' and status == 'delivered':
+        eta_estimator.observe_delivery(duration.total_seconds())
@@ -0,0 +1,69 @@
+import asyncio
+import threading
+
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+class Subscription:
+    def __init__(self, loop, order_id=None):
+        self.loop = loop
+        self.order_id = order_id
+        self.queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+    def wants(self, event):
+        return self.order_id is None or self.order_id == event['id']
+
+    def put(self, event):
+        # Runs on the subscriber's loop. A client that stops reading loses its
+        # oldest events rather than growing the queue without bound.
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(event)
+
+
+class OrderEventHub:
+    """In-process fan-out of order status events to streaming subscribers.
+
+    ``publish`` may be called from any thread (signal handlers run in WSGI
+    threads or ``sync_to_async`` workers); each event is handed to the
+    subscriber's own event loop with ``call_soon_threadsafe``.
+    """
+
+    def __init__(self):
+        self._subscriptions = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self, order_id=None):
+        subscription = Subscription(asyncio.get_running_loop(), order_id)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def publish(self, event):
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            if subscription.wants(event):
+                try:
+                    subscription.loop.call_soon_threadsafe(subscription.put, event)
+                except RuntimeError:
+                    # The subscriber's loop has already closed
+                    self.unsubscribe(subscription)
+
+    def __len__(self):
+        return len(self._subscriptions)
+
+
+hub = OrderEventHub()
+
+
+def order_event(order):
+    return {
+        'id': order.id,
+        'status': order.status,
+        'estimated_arrival': order.estimated_arrival.isoformat() if order.estimated_arrival else None,
+    }
@@ -0,0 +1,36 @@
+from itertools import groupby
+
+from config.exports import EXPORT_CHUNK_SIZE, date_range_filter
+from .models import Order
+
+ORDER_FIELDS = ['id', 'created_at', 'status', 'customer_name', 'phone', 'address', 'delivery_method',
+                'payment_method', 'subtotal', 'delivery_fee', 'total', 'estimated_arrival']
+ITEM_FIELDS = ['name', 'price', 'quantity']
+# CSV has one line per order item, with the order's columns repeated
+CSV_FIELDS = ORDER_FIELDS + [f'item_{field}' for field in ITEM_FIELDS]
+
+
+def order_rows(start=None, end=None):
+    """One row per order item (a single row with empty item columns for an order without items)."""
+    rows = (
+        Order.objects.filter(**date_range_filter('created_at', start, end))
+        .order_by('created_at', 'id', 'items__id')
+        .values(*ORDER_FIELDS, *(f'items__{field}' for field in ITEM_FIELDS))
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+    for row in rows:
+        for field in ITEM_FIELDS:
+            row[f'item_{field}'] = row.pop(f'items__{field}')
+        yield row
+
+
+def nested_order_rows(start=None, end=None):
+    """One row per order with its ``items`` list, regrouped from the flat rows."""
+    for _, lines in groupby(order_rows(start, end), key=lambda row: row['id']):
+        lines = list(lines)
+        order = {field: lines[0][field] for field in ORDER_FIELDS}
+        order['items'] = [
+            {field: line[f'item_{field}'] for field in ITEM_FIELDS}
+            for line in lines if line['item_name'] is not None
+        ]
+        yield order
@@ -0,0 +1,178 @@
+"""In-process priority index of the orders the kitchen still has to act on.
+
+``kitchen_queue`` keeps every order in ``Order.KITCHEN_STATUSES`` in a list
+sorted by urgency: creation time, with delivery orders moved up by
+``KITCHEN_DELIVERY_HEAD_START_MINUTES``. Reads copy the list without
+touching the database. The order signals apply each committed change in
+place (see ``orders/signals.py``), and the first read in a process builds
+the index through ``order_status_created_idx``.
+
+Writes made by other workers are noticed through a version number in the
+shared cache. Every write bumps it with an atomic ``incr``; a process whose
+bump did not land exactly one past the version it last synced with missed
+someone else's write, and like one that reads a version it did not
+produce, it rebuilds on its next read. The counter is seeded from the
+clock, so an evicted key never comes back as a version seen before.
+"""
+import bisect
+import threading
+import time
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import Order, OrderItem
+
+KITCHEN_VERSION_KEY = 'kitchen:version'
+
+# The next status when the kitchen bumps an order
+BUMP_STATUS = {
+    'pending': 'confirmed',
+    'confirmed': 'preparing',
+    'ready-for-pickup': 'picked-up',
+}
+
+
+def next_kitchen_status(order):
+    if order.status == 'preparing':
+        return 'out-for-delivery' if order.delivery_method == 'delivery' else 'ready-for-pickup'
+    return BUMP_STATUS.get(order.status)
+
+
+def due_at(created_at, delivery_method):
+    head_start = timedelta(minutes=settings.KITCHEN_DELIVERY_HEAD_START_MINUTES)
+    return created_at - head_start if delivery_method == 'delivery' else created_at
+
+
+def priority(order):
+    return due_at(order.created_at, order.delivery_method), order.id
+
+
+def entry_priority(entry):
+    return due_at(datetime.fromisoformat(entry['created_at']), entry['delivery_method']), entry['id']
+
+
+def entry(order, items=None):
+    return {
+        'id': order.id,
+        'status': order.status,
+        'delivery_method': order.delivery_method,
+        'customer_name': order.customer_name,
+        'created_at': order.created_at.isoformat(),
+        'status_changed_at': order.status_changed_at.isoformat(),
+        'estimated_arrival': order.estimated_arrival.isoformat() if order.estimated_arrival else None,
+        'items': items,
+    }
+
+
+def item_entries(items):
+    return [{'name': item.name, 'quantity': item.quantity} for item in items]
+
+
+class KitchenQueue:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._keys = []  # sorted priority keys
+        self._entries = {}  # order id -> (key, entry)
+        self.version = None
+
+    def _insert(self, key, data):
+        self._remove(data['id'])
+        bisect.insort(self._keys, key)
+        self._entries[data['id']] = (key, data)
+
+    def _remove(self, order_id):
+        current = self._entries.pop(order_id, None)
+        if current is not None:
+            del self._keys[bisect.bisect_left(self._keys, current[0])]
+
+    def rebuild(self):
+        orders = (
+            Order.objects.filter(status__in=Order.KITCHEN_STATUSES)
+            .prefetch_related('items')
+            .order_by('created_at', 'id')
+        )
+        version = self._shared_version()
+        with self._lock:
+            self._keys, self._entries = [], {}
+            for order in orders:
+                self._insert(priority(order), entry(order, item_entries(order.items.all())))
+            self.version = version
+
+    def snapshot(self):
+        """Active kitchen orders, most urgent first."""
+        if self.version is None or self._shared_version() != self.version:
+            self.rebuild()
+        with self._lock:
+            orders = [self._entries[key[1]][1] for key in self._keys]
+        missing = [order['id'] for order in orders if order['items'] is None]
+        if missing:
+            self._fill_items(missing)
+        return orders
+
+    def items(self, order_id):
+        """The queued items of ``order_id``, or ``None`` if unknown here."""
+        with self._lock:
+            known = self._entries.get(order_id)
+        return known[1]['items'] if known else None
+
+    def _fill_items(self, order_ids):
+        # Orders saved without going through orders_placed (admin, shell) arrive without their items
+        items = {}
+        for item in OrderItem.objects.filter(order_id__in=order_ids).order_by('id'):
+            items.setdefault(item.order_id, []).append(item)
+        with self._lock:
+            for order_id in order_ids:
+                if order_id in self._entries:
+                    self._entries[order_id][1]['items'] = item_entries(items.get(order_id, []))
+
+    def apply(self, orders, items=None):
+        """Apply committed saves: add or update kitchen orders, drop the rest."""
+        items_by_order = {}
+        for item in items or ():
+            items_by_order.setdefault(item.order_id, []).append(item)
+        with self._lock:
+            for order in orders:
+                if order.status not in Order.KITCHEN_STATUSES:
+                    self._remove(order.id)
+                    continue
+                known = self._entries.get(order.id)
+                if order.id in items_by_order:
+                    order_items = item_entries(items_by_order[order.id])
+                else:
+                    order_items = known[1]['items'] if known else None
+                self._insert(priority(order), entry(order, order_items))
+            self._adopt_new_version()
+
+    def discard(self, order_ids):
+        with self._lock:
+            for order_id in order_ids:
+                self._remove(order_id)
+            self._adopt_new_version()
+
+    def _shared_version(self):
+        version = cache.get(KITCHEN_VERSION_KEY)
+        if version is None:
+            cache.add(KITCHEN_VERSION_KEY, time.time_ns(), timeout=None)
+            version = cache.get(KITCHEN_VERSION_KEY)
+        return version
+
+    def _bump_version(self):
+        cache.add(KITCHEN_VERSION_KEY, time.time_ns(), timeout=None)
+        try:
+            return cache.incr(KITCHEN_VERSION_KEY)
+        except ValueError:
+            return None  # evicted between add() and incr()
+
+    def _adopt_new_version(self):
+        # If nobody else wrote since our last sync we are still exact; otherwise
+        # leave the version unset so the next read rebuilds.
+        new = self._bump_version()
+        self.version = new if None not in (new, self.version) and new == self.version + 1 else None
+
+    def __len__(self):
+        return len(self._keys)
+
+
+kitchen_queue = KitchenQueue()
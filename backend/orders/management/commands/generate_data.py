@@ -0,0 +1,246 @@
+import random
+import time
+from datetime import datetime, time as dt_time, timedelta
+from decimal import Decimal
+from itertools import accumulate
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from bookings.availability import rebuild_occupancy
+from bookings.models import Booking, ServiceSlot
+from config.bulk import bulk_create_backdated
+from contact.models import ContactMessage
+from menu.cache import bump_menu_version
+from menu.models import MenuItem
+from orders.models import Order, OrderItem
+from stock.alerts import refresh_low_stock_alerts
+from stock.models import RecipeIngredient, StockCategory, StockItem
+from users.models import CustomUser
+
+CATEGORIES = {
+    'Burgers': ('Burger', (12, 26)),
+    'Pizza': ('Pizza', (14, 34)),
+    'Main Course': ('Risotto', (18, 36)),
+    'Steaks': ('Steak', (32, 90)),
+    'Salads': ('Salad', (9, 19)),
+    'Desserts': ('Cake', (7, 14)),
+    'Sides': ('Fries', (4, 9)),
+    'Drinks': ('Lemonade', (3, 8)),
+}
+ADJECTIVES = (
+    'Classic', 'Smoky', 'Truffle', 'Spicy', 'Golden', 'Garden', 'Royal', 'Rustic',
+    'Crispy', 'Double', 'Heirloom', 'Saffron', 'Charred', 'Wild', 'Signature',
+)
+STOCK_CATEGORIES = ('Bakery', 'Meat', 'Seafood', 'Dairy', 'Produce', 'Dry Goods', 'Beverages')
+UNITS = ('pcs', 'kg', 'l')
+SERVICE_SLOTS = [dt_time(hour, minute) for hour in range(12, 23) for minute in (0, 30)]
+# Share of orders per hour of day: a lunch peak and a bigger dinner peak
+HOUR_WEIGHTS = [0] * 11 + [4, 9, 9, 5, 3, 3, 6, 12, 14, 12, 8, 4, 2]
+ACTIVE_WINDOW = timedelta(hours=2)
+
+
+class Command(BaseCommand):
+    help = 'Generate a deterministic, production-sized dataset for load testing'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seed', type=int, default=1)
+        parser.add_argument('--orders', type=int, default=100_000)
+        parser.add_argument('--days', type=int, default=365, help='Spread orders over this many past days')
+        parser.add_argument('--menu-items', type=int, default=120)
+        parser.add_argument('--stock-items', type=int, default=300)
+        parser.add_argument('--bookings', type=int, default=20_000)
+        parser.add_argument('--users', type=int, default=5_000)
+        parser.add_argument('--messages', type=int, default=5_000)
+        parser.add_argument('--chunk-size', type=int, default=5_000, help='Rows per bulk_create transaction')
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options['seed'])
+        self.chunk_size = options['chunk_size']
+        self.now = timezone.now()
+        started = time.perf_counter()
+
+        menu = self.generate_menu(options['menu_items'])
+        self.generate_stock(options['stock_items'], menu)
+        self.generate_orders(options['orders'], options['days'], menu)
+        self.generate_bookings(options['bookings'], options['days'])
+        self.generate_users(options['users'])
+        self.generate_messages(options['messages'], options['days'])
+
+        self.stdout.write(self.style.SUCCESS(f'Done in {time.perf_counter() - started:.1f} s'))
+
+    # --- helpers -------------------------------------------------------------
+
+    def chunks(self, total):
+        for offset in range(0, total, self.chunk_size):
+            yield min(self.chunk_size, total - offset)
+
+    def progress(self, label, done, total, rows, started):
+        elapsed = max(time.perf_counter() - started, 1e-9)
+        self.stdout.write(f'  {label}: {done:,}/{total:,} ({rows / elapsed:,.0f} rows/s)')
+
+    def past_moment(self, days):
+        # HOUR_WEIGHTS are restaurant hours, so pick the day and time on the local clock
+        day = timezone.localdate(self.now) - timedelta(days=self.rng.randrange(days))
+        hour = self.rng.choices(range(24), weights=HOUR_WEIGHTS)[0]
+        moment = timezone.make_aware(datetime.combine(
+            day, dt_time(hour, self.rng.randrange(60), self.rng.randrange(60)),
+        ))
+        return moment if moment <= self.now else moment - timedelta(days=1)
+
+    # --- generators ----------------------------------------------------------
+
+    def generate_menu(self, count):
+        rng = self.rng
+        items = []
+        for i in range(count):
+            category = rng.choice(list(CATEGORIES))
+            dish, (low, high) = CATEGORIES[category]
+            items.append(MenuItem(
+                name=f'{ADJECTIVES[i % len(ADJECTIVES)]} {dish} {i // len(ADJECTIVES) + 1}',
+                description=f'{ADJECTIVES[i % len(ADJECTIVES)]} {dish.lower()} made fresh to order.',
+                price=Decimal(rng.randint(low * 100, high * 100)) / 100,
+                category=category,
+                image=f'https://images.example.com/menu/{i}.jpg',
+                available=rng.random() > 0.05,
+            ))
+        with transaction.atomic():
+            items = MenuItem.objects.bulk_create(items)
+        # bulk_create sends no post_save, so invalidate the cached menu here
+        bump_menu_version()
+        self.stdout.write(f'  menu items: {len(items):,}')
+        return items
+
+    def generate_stock(self, count, menu):
+        rng = self.rng
+        with transaction.atomic():
+            categories = StockCategory.objects.bulk_create(StockCategory(name=name) for name in STOCK_CATEGORIES)
+            stock = StockItem.objects.bulk_create(
+                StockItem(name=f'Ingredient {i}', quantity=Decimal(rng.randint(0, 2000)), unit=rng.choice(UNITS),
+                          threshold=rng.choice((20, 50, 100)), category=rng.choice(categories))
+                for i in range(count)
+            )
+            if stock:
+                RecipeIngredient.objects.bulk_create(
+                    RecipeIngredient(menu_item=item, stock_item=ingredient,
+                                     quantity=Decimal(rng.randint(1, 30)) / 10)
+                    for item in menu
+                    for ingredient in rng.sample(stock, min(len(stock), rng.randint(2, 5)))
+                )
+        refresh_low_stock_alerts()
+        self.stdout.write(f'  stock items: {len(stock):,}')
+
+    def generate_orders(self, total, days, menu):
+        rng = self.rng
+        if not menu or not total:
+            return
+        # Zipf-like popularity: a few dishes take most of the orders
+        cum_weights = list(accumulate(1 / (rank + 1) ** 1.1 for rank in range(len(menu))))
+        started, done, rows = time.perf_counter(), 0, 0
+
+        for size in self.chunks(total):
+            orders, lines = [], []
+            for _ in range(size):
+                method = 'delivery' if rng.random() < 0.6 else 'pickup'
+                created_at = self.past_moment(days)
+                picks = rng.choices(menu, cum_weights=cum_weights, k=rng.choices((1, 2, 3, 4, 5),
+                                                                                 weights=(30, 35, 20, 10, 5))[0])
+                portions = {}
+                for item in picks:
+                    portions[item] = portions.get(item, 0) + rng.choices((1, 2, 3), weights=(75, 20, 5))[0]
+                subtotal = sum((item.price * quantity for item, quantity in portions.items()), Decimal('0'))
+                fee = Decimal('5.00') if method == 'delivery' else Decimal('0.00')
+                orders.append(Order(
+                    customer_name=f'Customer {rng.randrange(1_000_000)}',
+                    phone=f'07{rng.randrange(10 ** 8):08d}',
+                    address=f'{rng.randint(1, 999)} Main Street' if method == 'delivery' else None,
+                    delivery_method=method,
+                    payment_method='card' if rng.random() < 0.7 else 'cash',
+                    subtotal=subtotal, delivery_fee=fee, total=subtotal + fee,
+                    status=self.order_status(method, created_at),
+                    created_at=created_at,
+                    status_changed_at=created_at,
+                ))
+                lines.append(portions)
+
+            with transaction.atomic():
+                bulk_create_backdated(orders)
+                items = [
+                    OrderItem(order=order, name=item.name, price=item.price, quantity=quantity, image=item.image)
+                    for order, portions in zip(orders, lines)
+                    for item, quantity in portions.items()
+                ]
+                OrderItem.objects.bulk_create(items)
+            done += size
+            rows += size + len(items)
+            self.progress('orders', done, total, rows, started)
+
+    def order_status(self, method, created_at):
+        rng = self.rng
+        if self.now - created_at < ACTIVE_WINDOW:
+            active = ('pending', 'confirmed', 'preparing',
+                      'out-for-delivery' if method == 'delivery' else 'ready-for-pickup')
+            return rng.choice(active)
+        if rng.random() < 0.04:
+            return 'cancelled'
+        return 'delivered' if method == 'delivery' else 'picked-up'
+
+    def generate_bookings(self, total, days):
+        rng = self.rng
+        if not ServiceSlot.objects.exists():
+            ServiceSlot.objects.bulk_create(ServiceSlot(time=slot, capacity=80) for slot in SERVICE_SLOTS)
+        today = timezone.localdate()
+        started, done = time.perf_counter(), 0
+        for size in self.chunks(total):
+            bookings = []
+            for _ in range(size):
+                day = today + timedelta(days=rng.randint(-days, 30))
+                if day < today:
+                    status = rng.choices(('confirmed', 'cancelled', 'rejected', 'pending'), weights=(80, 10, 5, 5))[0]
+                else:
+                    status = rng.choices(('pending', 'confirmed', 'cancelled'), weights=(40, 55, 5))[0]
+                n = rng.randrange(1_000_000)
+                bookings.append(Booking(
+                    customer_name=f'Guest {n}', phone=f'07{rng.randrange(10 ** 8):08d}',
+                    email=f'guest{n}@example.com', date=day, time=rng.choice(SERVICE_SLOTS),
+                    guests=rng.choices(range(1, 11), weights=(5, 35, 15, 25, 6, 7, 2, 3, 1, 1))[0],
+                    status=status,
+                    special_request='Window seat, please.' if rng.random() < 0.1 else None,
+                ))
+            with transaction.atomic():
+                Booking.objects.bulk_create(bookings)
+            done += size
+            self.progress('bookings', done, total, done, started)
+        # bulk_create skips the signals that maintain the occupancy index
+        rebuild_occupancy()
+
+    def generate_users(self, total):
+        # One hash for everyone: hashing per user would dominate the run
+        password = make_password('password')
+        started, done = time.perf_counter(), 0
+        offset = CustomUser.objects.count()
+        for size in self.chunks(total):
+            with transaction.atomic():
+                CustomUser.objects.bulk_create(
+                    CustomUser(email=f'user{offset + done + i}@example.com', name=f'User {offset + done + i}',
+                               password=password, is_customer=True)
+                    for i in range(size)
+                )
+            done += size
+            self.progress('users', done, total, done, started)
+
+    def generate_messages(self, total, days):
+        rng = self.rng
+        subjects = ('Catering enquiry', 'Allergy question', 'Feedback', 'Private dining', None)
+        started, done = time.perf_counter(), 0
+        for size in self.chunks(total):
+            bulk_create_backdated(
+                ContactMessage(name=f'Visitor {n}', email=f'visitor{n}@example.com',
+                               subject=rng.choice(subjects), message='Could you get back to me?',
+                               created_at=self.past_moment(days))
+                for n in (rng.randrange(1_000_000) for _ in range(size))
+            )
+            done += size
+            self.progress('contact messages', done, total, done, started)
@@ -0,0 +1,44 @@
+import sqlite3
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+def sync_sqlite_replicas():
+    """Copy the primary SQLite file over every replica with the online backup API."""
+    source = sqlite3.connect(connections[DEFAULT_DB_ALIAS].settings_dict['NAME'])
+    try:
+        for alias in settings.DATABASE_REPLICAS:
+            target = sqlite3.connect(connections[alias].settings_dict['NAME'], timeout=20)
+            try:
+                source.backup(target)
+            finally:
+                target.close()
+    finally:
+        source.close()
+
+
+class Command(BaseCommand):
+    help = 'Refresh the local SQLite read replicas (DJANGO_DB_REPLICAS) from the primary database'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--watch', action='store_true', help='Keep refreshing instead of exiting')
+        parser.add_argument('--interval', type=float, default=1.0, help='Seconds between refreshes')
+
+    def handle(self, *args, **options):
+        if not settings.DATABASE_REPLICAS:
+            raise CommandError('No replicas configured; set DJANGO_DB_REPLICAS')
+        for alias in (DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS):
+            if connections[alias].vendor != 'sqlite':
+                raise CommandError(f'{alias} is not SQLite; use the database\'s own replication')
+
+        while True:
+            started = time.perf_counter()
+            sync_sqlite_replicas()
+            self.stdout.write(f'Synced {len(settings.DATABASE_REPLICAS)} replica(s) '
+                              f'in {(time.perf_counter() - started) * 1000:.0f} ms')
+            if not options['watch']:
+                break
+            time.sleep(options['interval'])
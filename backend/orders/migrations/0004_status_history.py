@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:31
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import F
+
+def backfill_status_changed_at(apps, schema_editor):
+    # Existing orders have no recorded transition; date their status from creation
+    Order = apps.get_model('orders', 'Order')
+    Order.objects.update(status_changed_at=F('created_at'))
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0003_status_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='status_changed_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.RunPython(backfill_status_changed_at, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name='OrderStatusHistory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('previous', models.CharField(choices=[('pending', 'Pending'), ('confirmed', 'Confirmed'), ('preparing', 'Preparing'), ('out-for-delivery', 'Out for Delivery'), ('delivered', 'Delivered'), ('cancelled', 'Cancelled'), ('ready-for-pickup', 'Ready for Pickup'), ('picked-up', 'Picked Up')], max_length=20)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('confirmed', 'Confirmed'), ('preparing', 'Preparing'), ('out-for-delivery', 'Out for Delivery'), ('delivered', 'Delivered'), ('cancelled', 'Cancelled'), ('ready-for-pickup', 'Ready for Pickup'), ('picked-up', 'Picked Up')], max_length=20)),
+                ('changed_at', models.DateTimeField()),
+                ('duration', models.DurationField()),
+                ('order', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='status_history', to='orders.order')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['order', 'changed_at'], name='order_history_idx')],
+            },
+        ),
+    ]
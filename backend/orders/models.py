@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 
 class Order(models.Model):
     STATUS_CHOICES = [
@@ -17,6 +18,22 @@ class Order(models.Model):
         ('pickup', 'Pickup'),
     ]
 
+    # Statuses an order can still move on from
+    ACTIVE_STATUSES = ('pending', 'confirmed', 'preparing', 'ready-for-pickup', 'out-for-delivery')
+    # Statuses the kitchen still has to act on
+    KITCHEN_STATUSES = ('pending', 'confirmed', 'preparing', 'ready-for-pickup')
+    # Allowed status changes; delivered and picked-up orders are final
+    TRANSITIONS = {
+        'pending': ('confirmed', 'cancelled'),
+        'confirmed': ('preparing', 'cancelled'),
+        'preparing': ('out-for-delivery', 'ready-for-pickup', 'cancelled'),
+        'out-for-delivery': ('delivered',),
+        'ready-for-pickup': ('picked-up',),
+        'delivered': (),
+        'picked-up': (),
+        'cancelled': ('pending',),
+    }
+
     PAYMENT = [
         ('cash', 'Cash'),
         ('card', 'Card'),
@@ -32,8 +49,16 @@ class Order(models.Model):
     total = models.DecimalField(max_digits=10, decimal_places=2)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     created_at = models.DateTimeField(auto_now_add=True)
+    status_changed_at = models.DateTimeField(default=timezone.now)
     estimated_arrival = models.DateTimeField(blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='order_created_id_idx'),
+            # Seeks straight to the orders in a given status, for rebuilding the kitchen queue
+            models.Index(fields=['status', 'created_at', 'id'], name='order_status_created_idx'),
+        ]
+
     def __str__(self):
         return f"Order #{self.id} - {self.customer_name}"
 
@@ -46,3 +71,27 @@ class OrderItem(models.Model):
 
     def __str__(self):
         return f"{self.quantity}x {self.name} (Order #{self.order.id})"
+
+class OrderStatusHistory(models.Model):
+    order = models.ForeignKey(Order, related_name='status_history', on_delete=models.CASCADE)
+    previous = models.CharField(max_length=20, choices=Order.STATUS_CHOICES)
+    status = models.CharField(max_length=20, choices=Order.STATUS_CHOICES)
+    changed_at = models.DateTimeField()
+    # How long the order spent in ``previous``
+    duration = models.DurationField()
+
+    class Meta:
+        indexes = [models.Index(fields=['order', 'changed_at'], name='order_history_idx')]
+
+    def __str__(self):
+        return f"Order #{self.order_id}: {self.previous} -> {self.status}"
+
+class PrepTimeStat(models.Model):
+    # A menu item name, or ``ETA_DELIVERY_KEY`` for the ride to the customer
+    key = models.CharField(max_length=255, unique=True)
+    seconds = models.FloatField()
+    samples = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.key}: {self.seconds:.0f}s over {self.samples} samples"
@@ -0,0 +1,13 @@
+from rest_framework.pagination import CursorPagination
+
+
+class OrderCursorPagination(CursorPagination):
+    """Keyset pagination over ``(created_at, id)``, backed by ``order_created_id_idx``.
+
+    Pages are fetched with ``WHERE created_at < <cursor>`` instead of an
+    OFFSET, so the cost of a page does not grow with order history.
+    """
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+    ordering = ('-created_at', '-id')
@@ -1,10 +1,13 @@
+from django.db import transaction
 from rest_framework import serializers
-from .models import Order, OrderItem
+from .models import Order, OrderItem, OrderStatusHistory
+from .signals import orders_placed
 
 class OrderItemSerializer(serializers.ModelSerializer):
     class Meta:
         model = OrderItem
         fields = '__all__'
+        read_only_fields = ('order',)
 
 class OrderSerializer(serializers.ModelSerializer):
     items = OrderItemSerializer(many=True, required=False)
@@ -12,10 +15,47 @@ class OrderSerializer(serializers.ModelSerializer):
     class Meta:
         model = Order
         fields = '__all__'
+        read_only_fields = ('status_changed_at',)
 
     def create(self, validated_data):
-        items_data = self.context.get('request').data.get('items', [])
-        order = Order.objects.create(**validated_data)
-        for item_data in items_data:
-            OrderItem.objects.create(order=order, **item_data)
-        return order
+        return create_orders([validated_data])[0]
+
+    def update(self, instance, validated_data):
+        # Only write the fields sent, so a stale instance cannot undo a concurrent status change
+        serializers.raise_errors_on_nested_writes('update', self, validated_data)
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=list(validated_data))
+        return instance
+
+class OrderStatusHistorySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = OrderStatusHistory
+        fields = ('previous', 'status', 'changed_at', 'duration')
+
+class OrderTransitionSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, max_length=500)
+    status = serializers.ChoiceField(choices=Order.STATUS_CHOICES)
+    expected = serializers.ChoiceField(choices=Order.STATUS_CHOICES, required=False)
+
+class KitchenBumpSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, max_length=500)
+
+
+def create_orders(orders_data):
+    """Create orders from validated ``OrderSerializer`` data in one transaction.
+
+    Line items for every order are written with a single ``bulk_create``, so a
+    batch costs one INSERT per order plus one for all of its items.
+    """
+    orders, items = [], []
+    with transaction.atomic():
+        for data in orders_data:
+            data = dict(data)
+            items_data = data.pop('items', [])
+            order = Order.objects.create(**data)
+            orders.append(order)
+            items.extend(OrderItem(order=order, **item) for item in items_data)
+        OrderItem.objects.bulk_create(items)
+        orders_placed.send(sender=Order, orders=orders, items=items)
+    return orders
@@ -0,0 +1,46 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+
+from . import eta
+from .events import hub, order_event
+from .kitchen import kitchen_queue
+from .models import Order
+
+# Sent inside the creating transaction with ``orders`` and their ``items``
+orders_placed = Signal()
+
+# Sent inside the updating transaction with ``order``, ``previous``, ``status``
+# and ``duration``, the time the order spent in ``previous``
+order_status_changed = Signal()
+
+
+@receiver(post_save, sender=Order)
+def publish_order_status(sender, instance, **kwargs):
+    event = order_event(instance)
+    transaction.on_commit(lambda: hub.publish(event))
+
+
+@receiver(post_save, sender=Order)
+def update_kitchen_queue(sender, instance, **kwargs):
+    transaction.on_commit(lambda: kitchen_queue.apply([instance]))
+
+
+@receiver(orders_placed)
+def queue_placed_orders(sender, orders, items, **kwargs):
+    transaction.on_commit(lambda: kitchen_queue.apply(orders, items))
+
+
+@receiver(post_delete, sender=Order)
+def drop_from_kitchen_queue(sender, instance, **kwargs):
+    order_id = instance.id
+    transaction.on_commit(lambda: kitchen_queue.discard([order_id]))
+
+
+@receiver(order_status_changed)
+def estimate_arrival(sender, order, previous, status, duration, **kwargs):
+    if status == 'confirmed':
+        eta.set_estimated_arrival(order)
+    else:
+        eta.learn_from_transition(order, previous, status, duration)
+    transaction.on_commit(eta.eta_estimator.flush)
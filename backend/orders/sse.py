@@ -0,0 +1,103 @@
+"""Server-Sent Events stream of order status changes.
+
+This is a bare ASGI application mounted in ``config/asgi.py`` rather than a
+Django view, so an idle connection costs one coroutine and a small queue
+instead of a request thread:
+
+    GET /api/orders/stream/          every status change (kitchen/admin)
+    GET /api/orders/<id>/stream/     one order (customer tracking page)
+
+Each stream starts with the current state (all active orders, or the one
+order) and then pushes ``status`` events from the in-process hub.
+"""
+import asyncio
+import json
+import re
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from .events import hub, order_event
+from .models import Order
+
+STREAM_PATH = re.compile(r'^/api/orders/(?:(?P<order_id>\d+)/)?stream/$')
+HEARTBEAT_SECONDS = 15
+
+
+def match_stream_path(path):
+    """Return the ``re.Match`` for a stream URL, or ``None``."""
+    return STREAM_PATH.match(path)
+
+
+def _initial_events(order_id):
+    if order_id is None:
+        orders = Order.objects.filter(status__in=Order.ACTIVE_STATUSES).order_by('created_at', 'id')
+        return [order_event(order) for order in orders]
+    order = Order.objects.filter(id=order_id).first()
+    return None if order is None else [order_event(order)]
+
+
+def _encode(event):
+    return f'event: status\ndata: {json.dumps(event)}\n\n'.encode()
+
+
+def _headers(scope, content_type):
+    headers = [(b'content-type', content_type), (b'cache-control', b'no-cache')]
+    origin = dict(scope['headers']).get(b'origin', b'').decode('latin-1')
+    if origin in settings.CORS_ALLOWED_ORIGINS:
+        headers += [(b'access-control-allow-origin', origin.encode('latin-1')), (b'vary', b'Origin')]
+    return headers
+
+
+async def _wait_for_disconnect(receive):
+    while (await receive())['type'] != 'http.disconnect':
+        pass
+
+
+async def _send_error(scope, send, status, message):
+    body = json.dumps({'error': message}).encode()
+    await send({'type': 'http.response.start', 'status': status,
+                'headers': _headers(scope, b'application/json')})
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def order_stream_app(scope, receive, send):
+    if scope['method'] != 'GET':
+        await _send_error(scope, send, 405, 'Method not allowed')
+        return
+
+    order_id = match_stream_path(scope['path'])['order_id']
+    order_id = int(order_id) if order_id else None
+
+    # Subscribe before reading the initial state so no change slips between them
+    subscription = hub.subscribe(order_id)
+    try:
+        initial = await sync_to_async(_initial_events)(order_id)
+        if initial is None:
+            await _send_error(scope, send, 404, 'Order not found')
+            return
+
+        await send({'type': 'http.response.start', 'status': 200,
+                    'headers': _headers(scope, b'text/event-stream')})
+        body = b''.join(_encode(event) for event in initial) or b': connected\n\n'
+        await send({'type': 'http.response.body', 'body': body, 'more_body': True})
+
+        disconnect = asyncio.ensure_future(_wait_for_disconnect(receive))
+        try:
+            while True:
+                next_event = asyncio.ensure_future(subscription.queue.get())
+                done, _ = await asyncio.wait({next_event, disconnect}, timeout=HEARTBEAT_SECONDS,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                if disconnect in done:
+                    next_event.cancel()
+                    return
+                if next_event in done:
+                    chunk = _encode(next_event.result())
+                else:
+                    next_event.cancel()
+                    chunk = b': keep-alive\n\n'
+                await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+        finally:
+            disconnect.cancel()
+    finally:
+        hub.unsubscribe(subscription)
@@ -1,3 +1,182 @@
-from django.test import TestCase
+import random
+from datetime import datetime, timezone as dt_timezone
 
-# Create your tests here.
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from config.testing import ConcurrentTestCase, run_concurrently
+from users.models import CustomUser
+from .kitchen import KITCHEN_VERSION_KEY, KitchenQueue
+from .management.commands.generate_data import HOUR_WEIGHTS, Command as GenerateDataCommand
+from .models import Order, OrderItem, OrderStatusHistory
+from .signals import order_status_changed
+from .transitions import transition_orders
+
+
+def make_order(**fields):
+    return Order.objects.create(**{
+        'customer_name': 'Test', 'phone': '0', 'delivery_method': 'pickup', 'payment_method': 'cash',
+        'subtotal': '10.00', 'total': '10.00', **fields,
+    })
+
+
+def add_orders(count, items_per_order=3):
+    orders = Order.objects.bulk_create(
+        Order(customer_name='Test', phone='0', delivery_method='pickup', payment_method='cash',
+              subtotal='15.00', total='15.00')
+        for _ in range(count)
+    )
+    OrderItem.objects.bulk_create(
+        OrderItem(order=order, name=f'Dish {n}', price='5.00', quantity=1)
+        for order in orders for n in range(items_per_order)
+    )
+    return orders
+
+
+class OrderListTestCase(TestCase):
+    def test_queries_per_page_do_not_grow(self):
+        # One query for the page of orders, one for all of their items
+        add_orders(5)
+        with self.assertNumQueries(2):
+            self.assertEqual(len(self.client.get('/api/orders/').json()['results']), 5)
+
+        add_orders(120, items_per_order=6)
+        with self.assertNumQueries(2):
+            first = self.client.get('/api/orders/').json()
+        with self.assertNumQueries(2):
+            second = self.client.get(first['next']).json()
+        self.assertEqual((len(first['results']), len(second['results'])), (50, 50))
+        self.assertFalse({order['id'] for order in first['results']} & {order['id'] for order in second['results']})
+
+
+class TransitionRaceTestCase(ConcurrentTestCase):
+    def test_conflicting_transitions_have_one_winner(self):
+        order = make_order()
+        targets = ['confirmed', 'cancelled'] * 4
+        results = run_concurrently(*(
+            lambda target=target: transition_orders([order.id], target, expected='pending')[0] for target in targets
+        ))
+        winners = [result for result in results if result['status'] == 'updated']
+        self.assertEqual(len(winners), 1)
+        self.assertEqual({result['code'] for result in results if result not in winners}, {'conflict'})
+        order.refresh_from_db()
+        self.assertEqual(order.status, winners[0]['order_status'])
+        self.assertEqual(OrderStatusHistory.objects.filter(order=order).count(), 1)
+
+    def test_change_between_read_and_update_is_a_conflict(self):
+        # What another writer committing under READ COMMITTED looks like from inside transition_orders
+        order = make_order()
+        raced = []
+
+        def cancel_first(execute, sql, params, many, context):
+            if sql.startswith('UPDATE "orders_order"') and not raced:
+                raced.append(True)
+                execute('UPDATE "orders_order" SET "status" = %s WHERE "id" = %s', ['cancelled', order.pk], False,
+                        context)
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(cancel_first):
+            result, = transition_orders([order.id], 'confirmed')
+        self.assertEqual(result['code'], 'conflict')
+        order.refresh_from_db()
+        self.assertEqual(order.status, 'cancelled')
+        self.assertFalse(OrderStatusHistory.objects.filter(order=order).exists())
+
+
+class KitchenVersionTestCase(TestCase):
+    def setUp(self):
+        cache.delete(KITCHEN_VERSION_KEY)
+
+    def test_interleaved_writers_rebuild(self):
+        # Two workers' queues, both synced with the same version
+        first, second = KitchenQueue(), KitchenQueue()
+        first.snapshot()
+        second.snapshot()
+        synced = first.version
+        self.assertEqual(second.version, synced)
+
+        first.apply([make_order()])
+        self.assertEqual(first.version, synced + 1)
+        # The second worker's bump lands one past the first's, not past its own version
+        second.apply([make_order()])
+        self.assertIsNone(second.version)
+        self.assertEqual(len(second.snapshot()), 2)
+        self.assertEqual(len(first.snapshot()), 2)
+        self.assertEqual(first.version, cache.get(KITCHEN_VERSION_KEY))
+
+    def test_evicted_version_forces_rebuild(self):
+        queue = KitchenQueue()
+        queue.snapshot()
+        cache.delete(KITCHEN_VERSION_KEY)
+        queue.apply([make_order()])
+        self.assertIsNone(queue.version)
+
+
+@override_settings(TIME_ZONE='America/New_York')
+class GeneratedMomentTestCase(SimpleTestCase):
+    def test_hours_follow_the_local_clock(self):
+        command = GenerateDataCommand()
+        command.rng = random.Random(1)
+        command.now = datetime(2026, 7, 1, 16, 30, tzinfo=dt_timezone.utc)
+        moments = [command.past_moment(30) for _ in range(500)]
+        self.assertTrue(all(moment <= command.now for moment in moments))
+        # Noon to 23:00 in New York spans 16:00 to 04:00 UTC, so weights read as UTC would miss most of it
+        self.assertTrue(all(HOUR_WEIGHTS[timezone.localtime(moment).hour] for moment in moments))
+
+
+class OrderAdminTestCase(TestCase):
+    def setUp(self):
+        self.client.force_login(CustomUser.objects.create_superuser('admin@example.com', name='Admin'))
+        self.order = make_order()
+        self.url = f'/admin/orders/order/{self.order.id}/change/'
+
+    def post(self, **fields):
+        data = {
+            'customer_name': self.order.customer_name, 'phone': self.order.phone, 'address': '',
+            'delivery_method': self.order.delivery_method, 'payment_method': self.order.payment_method,
+            'subtotal': self.order.subtotal, 'delivery_fee': '0', 'total': self.order.total,
+            'status': self.order.status,
+            'items-TOTAL_FORMS': '0', 'items-INITIAL_FORMS': '0', 'items-MIN_NUM_FORMS': '0',
+            'items-MAX_NUM_FORMS': '1000', **fields,
+        }
+        return self.client.post(self.url, data)
+
+    def test_status_change_goes_through_the_transition(self):
+        changes = []
+
+        def receiver(sender, status, **kwargs):
+            changes.append(status)
+
+        order_status_changed.connect(receiver)
+        self.addCleanup(order_status_changed.disconnect, receiver)
+        response = self.post(status='cancelled', customer_name='Renamed')
+        self.assertEqual(response.status_code, 302)
+        self.order.refresh_from_db()
+        self.assertEqual((self.order.status, self.order.customer_name), ('cancelled', 'Renamed'))
+        self.assertEqual(changes, ['cancelled'])
+        self.assertEqual(list(OrderStatusHistory.objects.values_list('previous', 'status')), [('pending', 'cancelled')])
+
+    def test_invalid_status_change_is_rejected(self):
+        response = self.post(status='delivered')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Cannot move a pending order to delivered', response.content.decode())
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.status, 'pending')
+
+    def test_stale_form_does_not_revert_the_status(self):
+        # The form still shows pending; a plain save would have put it back
+        transition_orders([self.order.id], 'confirmed')
+        response = self.post(customer_name='Renamed')
+        self.assertEqual(response.status_code, 200)
+        self.order.refresh_from_db()
+        self.assertEqual((self.order.status, self.order.customer_name), ('confirmed', 'Test'))
+
+    def test_other_edits_keep_the_status(self):
+        transition_orders([self.order.id], 'confirmed')
+        self.order.refresh_from_db()
+        self.post(customer_name='Renamed')
+        self.order.refresh_from_db()
+        self.assertEqual((self.order.status, self.order.customer_name), ('confirmed', 'Renamed'))
+        self.assertEqual(OrderStatusHistory.objects.count(), 1)
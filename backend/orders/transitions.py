@@ -0,0 +1,121 @@
+"""Race-safe order status changes.
+
+Every change follows ``Order.TRANSITIONS`` and is written as a conditional
+``UPDATE ... WHERE status = <status it was read in>``, so two staff actions
+racing on the same order cannot overwrite each other: the second UPDATE
+matches no row and is reported as a conflict. Orders moving from the same
+status share one statement, whatever their number.
+
+``QuerySet.update`` does not send ``post_save``, so ``announce`` does what
+the order receivers would: it sends ``order_status_changed`` and, once the
+transaction commits, feeds the event hub and the kitchen queue.
+"""
+from collections import defaultdict
+
+from django.db import transaction
+from django.utils import timezone
+
+from .events import hub, order_event
+from .kitchen import kitchen_queue
+from .models import Order, OrderStatusHistory
+from .signals import order_status_changed
+
+
+class TransitionError(Exception):
+    def __init__(self, result):
+        super().__init__(result['error'])
+        self.code = result['code']
+
+
+def can_transition(previous, status):
+    return status in Order.TRANSITIONS.get(previous, ())
+
+
+def error_result(order_id, code, message):
+    return {'id': order_id, 'status': 'error', 'code': code, 'error': message}
+
+
+def transition_orders(ids, status, expected=None):
+    """Move the orders in ``ids`` to ``status``; returns one result per id.
+
+    With ``expected``, only orders currently in that status are moved. A
+    result has ``'status': 'updated'``, or ``'error'`` with a ``code`` of
+    ``not_found``, ``invalid`` or ``conflict``. Ids are compared as integers,
+    so ``'12'`` and ``12`` name the same order.
+    """
+    ids = list(dict.fromkeys(int(order_id) for order_id in ids))
+    now = timezone.now()
+    results = {}
+    with transaction.atomic():
+        current = {
+            order_id: (previous, changed_at)
+            for order_id, previous, changed_at in
+            Order.objects.filter(id__in=ids).values_list('id', 'status', 'status_changed_at')
+        }
+        groups = defaultdict(list)
+        for order_id in ids:
+            if order_id not in current:
+                results[order_id] = error_result(order_id, 'not_found', 'Order not found')
+                continue
+            previous = current[order_id][0]
+            if expected is not None and previous != expected:
+                results[order_id] = error_result(order_id, 'conflict', f'Order is {previous}, not {expected}')
+            elif not can_transition(previous, status):
+                results[order_id] = error_result(order_id, 'invalid', f'Cannot move a {previous} order to {status}')
+            else:
+                groups[previous].append(order_id)
+
+        changed = []
+        for previous, group in groups.items():
+            count = Order.objects.filter(id__in=group, status=previous).update(status=status, status_changed_at=now)
+            if count < len(group):
+                # Lost some races; the rows we moved are the ones carrying our timestamp
+                won = set(
+                    Order.objects.filter(id__in=group, status=status, status_changed_at=now)
+                    .values_list('id', flat=True)
+                )
+            else:
+                won = group
+            for order_id in group:
+                if order_id in won:
+                    changed.append((order_id, previous))
+                else:
+                    results[order_id] = error_result(order_id, 'conflict', 'Order status was changed by someone else')
+
+        if changed:
+            durations = {order_id: now - current[order_id][1] for order_id, _ in changed}
+            OrderStatusHistory.objects.bulk_create(
+                OrderStatusHistory(order_id=order_id, previous=previous, status=status, changed_at=now,
+                                   duration=durations[order_id])
+                for order_id, previous in changed
+            )
+            orders = Order.objects.in_bulk([order_id for order_id, _ in changed])
+            announce([(orders[order_id], previous, durations[order_id]) for order_id, previous in changed])
+            for order_id, previous in changed:
+                results[order_id] = {'id': order_id, 'status': 'updated', 'previous': previous, 'order_status': status}
+    return [results[order_id] for order_id in ids]
+
+
+def transition_order(order, status):
+    """Move ``order`` on from the status it was read with; raises ``TransitionError``."""
+    result = transition_orders([order.pk], status, expected=order.status)[0]
+    if result['status'] == 'error':
+        raise TransitionError(result)
+    order.refresh_from_db(fields=['status', 'status_changed_at', 'estimated_arrival'])
+    return order
+
+
+def announce(changes):
+    """Send what ``post_save`` receivers would for ``(order, previous, duration)`` moved with ``update``."""
+    for order, previous, duration in changes:
+        order_status_changed.send(sender=Order, order=order, previous=previous, status=order.status,
+                                  duration=duration)
+    orders = [order for order, _, _ in changes]
+    events = [order_event(order) for order in orders]
+
+    def publish():
+        for event in events:
+            hub.publish(event)
+        kitchen_queue.apply(orders)
+
+    transaction.on_commit(publish)
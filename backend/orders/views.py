@@ -1,7 +1,123 @@
-from rest_framework import viewsets
+from django.db import transaction
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from config.exports import EXPORT_RENDERERS, ExportQuerySerializer, stream_export
+from config.fastread import ValuesListMixin, ValuesSerializer
+from .exports import CSV_FIELDS, nested_order_rows, order_rows
+from .kitchen import kitchen_queue, next_kitchen_status
 from .models import Order
-from .serializers import OrderSerializer
+from .pagination import OrderCursorPagination
+from .serializers import (
+    KitchenBumpSerializer, OrderSerializer, OrderStatusHistorySerializer, OrderTransitionSerializer, create_orders,
+)
+from .transitions import TransitionError, error_result, transition_order, transition_orders
 
-class OrderViewSet(viewsets.ModelViewSet):
-    queryset = Order.objects.all().order_by('-created_at')
+MAX_BATCH_SIZE = 500
+
+class OrderViewSet(ValuesListMixin, viewsets.ModelViewSet):
+    queryset = Order.objects.prefetch_related('items').order_by('-created_at', '-id')
     serializer_class = OrderSerializer
+    values_serializer = ValuesSerializer(OrderSerializer)
+    pagination_class = OrderCursorPagination
+    replica_actions = ('list',)
+
+    def update(self, request, *args, **kwargs):
+        try:
+            return super().update(request, *args, **kwargs)
+        except TransitionError as e:
+            code = status.HTTP_409_CONFLICT if e.code == 'conflict' else status.HTTP_400_BAD_REQUEST
+            return Response({'error': str(e)}, status=code)
+
+    def perform_update(self, serializer):
+        new_status = serializer.validated_data.pop('status', serializer.instance.status)
+        with transaction.atomic():
+            order = serializer.save()
+            if new_status != order.status:
+                transition_order(order, new_status)
+
+    @action(detail=False, methods=['post'])
+    def transition(self, request):
+        """Move every order in ``ids`` to ``status``, optionally only from ``expected``."""
+        serializer = OrderTransitionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = transition_orders(**serializer.validated_data)
+        failed = any(result['status'] == 'error' for result in results)
+        return Response(results, status=status.HTTP_207_MULTI_STATUS if failed else status.HTTP_200_OK)
+
+    @action(detail=True, methods=['get'])
+    def history(self, request, pk=None):
+        order = self.get_object()
+        return Response(OrderStatusHistorySerializer(order.status_history.order_by('changed_at', 'id'), many=True).data)
+
+    @action(detail=False, methods=['post'])
+    def batch(self, request):
+        """Ingest a list of orders; invalid entries are reported and skipped."""
+        payload = request.data
+        if not isinstance(payload, list):
+            return Response({'error': 'Expected a list of orders'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(payload) > MAX_BATCH_SIZE:
+            return Response(
+                {'error': f'A batch may contain at most {MAX_BATCH_SIZE} orders'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        results = [None] * len(payload)
+        valid = []
+        for index, data in enumerate(payload):
+            serializer = self.get_serializer(data=data)
+            if serializer.is_valid():
+                valid.append((index, serializer.validated_data))
+            else:
+                results[index] = {'index': index, 'status': 'error', 'errors': serializer.errors}
+
+        orders = create_orders([data for _, data in valid])
+        for (index, _), order in zip(valid, orders):
+            results[index] = {'index': index, 'status': 'created', 'id': order.id}
+
+        code = status.HTTP_201_CREATED if len(orders) == len(payload) else status.HTTP_207_MULTI_STATUS
+        return Response(results, status=code)
+
+    @action(detail=False, methods=['get'], renderer_classes=EXPORT_RENDERERS)
+    def export(self, request):
+        """Stream orders with their items as CSV (one line per item) or NDJSON (items nested)."""
+        query = ExportQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        if request.accepted_renderer.format == 'ndjson':
+            rows = nested_order_rows(**query.validated_data)
+        else:
+            rows = order_rows(**query.validated_data)
+        return stream_export(request, 'orders', CSV_FIELDS, rows)
+
+    @action(detail=False, methods=['get'])
+    def kitchen(self, request):
+        """Orders the kitchen still has to act on, most urgent first."""
+        return Response(kitchen_queue.snapshot())
+
+    @action(detail=False, methods=['post'], url_path='kitchen/bump')
+    def kitchen_bump(self, request):
+        """Move each order in ``ids`` on to its next kitchen status."""
+        serializer = KitchenBumpSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = serializer.validated_data['ids']
+
+        results = {}
+        groups = {}
+        orders = Order.objects.in_bulk(ids)
+        for order_id in ids:
+            order = orders.get(order_id)
+            new_status = next_kitchen_status(order) if order else None
+            if order is None:
+                results[order_id] = error_result(order_id, 'not_found', 'Order not found')
+            elif new_status is None:
+                results[order_id] = error_result(order_id, 'invalid', f'Order is {order.status}')
+            else:
+                groups.setdefault((order.status, new_status), []).append(order_id)
+        with transaction.atomic():
+            for (previous, new_status), group in groups.items():
+                for result in transition_orders(group, new_status, expected=previous):
+                    results[result['id']] = result
+
+        results = [results[order_id] for order_id in dict.fromkeys(ids)]
+        failed = any(result['status'] == 'error' for result in results)
+        return Response(results, status=status.HTTP_207_MULTI_STATUS if failed else status.HTTP_200_OK)
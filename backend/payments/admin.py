@@ -1,3 +1,15 @@
 from django.contrib import admin
+from .models import Payment, WebhookEvent
 
-# Register your models here.
+@admin.register(Payment)
+class PaymentAdmin(admin.ModelAdmin):
+    list_display = ('order', 'stripe_session_id', 'amount', 'status', 'created_at')
+    list_filter = ('status',)
+    search_fields = ('stripe_session_id',)
+
+@admin.register(WebhookEvent)
+class WebhookEventAdmin(admin.ModelAdmin):
+    list_display = ('event_id', 'type', 'status', 'attempts', 'received_at', 'processed_at')
+    list_filter = ('status', 'type')
+    search_fields = ('event_id',)
+    readonly_fields = ('event_id', 'type', 'payload', 'received_at', 'processed_at')
@@ -0,0 +1,75 @@
+"""Outbound calls to Stripe.
+
+All requests share one ``StripeClient`` per process, backed by a pooled
+``requests.Session`` so checkout traffic reuses warm TLS connections. Every
+call is bounded by ``STRIPE_TIMEOUT`` and at most
+``STRIPE_MAX_NETWORK_RETRIES`` retries. Intent creation is keyed by order
+and amount, so a retried or concurrent checkout gets the same intent back
+from Stripe instead of a second one.
+
+``STRIPE_API_BASE`` points the client at another host, e.g. the local fake
+gateway in ``benchmarks/fake_stripe.py``.
+"""
+import threading
+
+import requests
+import stripe
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+
+class PaymentGatewayError(Exception):
+    """Stripe could not be reached or rejected the request."""
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def _build_client():
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=settings.STRIPE_POOL_SIZE)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    base_addresses = {'api': settings.STRIPE_API_BASE} if settings.STRIPE_API_BASE else None
+    return stripe.StripeClient(
+        settings.STRIPE_SECRET_KEY,
+        base_addresses=base_addresses,
+        max_network_retries=settings.STRIPE_MAX_NETWORK_RETRIES,
+        http_client=stripe.RequestsClient(timeout=settings.STRIPE_TIMEOUT, session=session),
+    )
+
+
+def get_client():
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = _build_client()
+    return _client
+
+
+def reset_client():
+    """Drop the shared client so the next call picks up changed settings."""
+    global _client
+    with _client_lock:
+        _client = None
+
+
+def create_payment_intent(order):
+    amount = int(order.total * 100)
+    try:
+        return get_client().v1.payment_intents.create(
+            params={'amount': amount, 'currency': 'usd', 'metadata': {'order_id': order.id}},
+            # The amount is part of the key: Stripe rejects a reused key with different parameters
+            options={'idempotency_key': f'order-{order.id}-intent-{amount}'},
+        )
+    except stripe.StripeError as e:
+        raise PaymentGatewayError(str(e)) from e
+
+
+def retrieve_payment_intent(intent_id):
+    try:
+        return get_client().v1.payment_intents.retrieve(intent_id)
+    except stripe.StripeError as e:
+        raise PaymentGatewayError(str(e)) from e
@@ -0,0 +1,29 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from payments.webhooks import process_pending_events
+
+
+class Command(BaseCommand):
+    help = 'Apply stored Stripe webhook events, retrying failures with backoff'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100)
+        parser.add_argument('--watch', action='store_true', help='Keep polling for new events instead of exiting')
+        parser.add_argument('--interval', type=float, default=1.0, help='Seconds to sleep when the queue is empty')
+
+    def handle(self, *args, **options):
+        total_processed = total_failed = 0
+        while True:
+            processed, failed = process_pending_events(batch_size=options['batch_size'])
+            total_processed += processed
+            total_failed += failed
+            if failed:
+                self.stderr.write(f'{failed} event(s) failed and will be retried')
+            if processed + failed < options['batch_size']:
+                if not options['watch']:
+                    break
+                time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS(f'Processed {total_processed} event(s), {total_failed} failure(s)'))
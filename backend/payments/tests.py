@@ -1,3 +1,106 @@
-from django.test import TestCase
+import hashlib
+import hmac
+import json
+import time
 
-# Create your tests here.
+from datetime import timedelta
+
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from orders.models import Order
+from .models import Payment, WebhookEvent
+from .webhooks import CLAIM_SECONDS, claim_event, process_pending_events
+
+
+def signed(event, secret=None):
+    """``event`` as Stripe would deliver it: the JSON body and its ``Stripe-Signature`` header."""
+    payload = json.dumps(event)
+    timestamp = int(time.time())
+    signature = hmac.new((secret or settings.STRIPE_WEBHOOK_SECRET).encode(), f'{timestamp}.{payload}'.encode(),
+                         hashlib.sha256).hexdigest()
+    return payload, f't={timestamp},v1={signature}'
+
+
+def intent_event(event_id, intent_id, order_id, type='payment_intent.succeeded'):
+    return {
+        'id': event_id, 'object': 'event', 'type': type,
+        'data': {'object': {'id': intent_id, 'object': 'payment_intent', 'metadata': {'order_id': order_id}}},
+    }
+
+
+@override_settings(STRIPE_WEBHOOK_SECRET='whsec_test_stand_in')
+class WebhookTestCase(TestCase):
+    def setUp(self):
+        self.order = Order.objects.create(customer_name='Test', phone='0', delivery_method='pickup',
+                                          payment_method='card', subtotal='10.00', total='10.00')
+        Payment.objects.create(order=self.order, stripe_session_id='pi_test', amount='10.00')
+
+    def deliver(self, event):
+        payload, signature = signed(event)
+        return self.client.post('/api/payments/webhook/', payload, content_type='application/json',
+                                HTTP_STRIPE_SIGNATURE=signature)
+
+    def test_forged_signature_is_rejected(self):
+        payload, signature = signed(intent_event('evt_1', 'pi_test', str(self.order.id)), secret='whsec_other')
+        response = self.client.post('/api/payments/webhook/', payload, content_type='application/json',
+                                    HTTP_STRIPE_SIGNATURE=signature)
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(WebhookEvent.objects.exists())
+
+    def test_duplicate_delivery_is_applied_once(self):
+        event = intent_event('evt_1', 'pi_test', str(self.order.id))
+        self.assertEqual(self.deliver(event).status_code, 200)
+        self.assertEqual(self.deliver(event).status_code, 200)
+        self.assertEqual(WebhookEvent.objects.count(), 1)
+        self.assertEqual(process_pending_events(), (1, 0))
+        self.assertEqual(self.order.status_history.filter(status='confirmed').count(), 1)
+
+    def test_failure_arriving_after_success_is_ignored(self):
+        self.deliver(intent_event('evt_2', 'pi_test', str(self.order.id)))
+        process_pending_events()
+        self.deliver(intent_event('evt_1', 'pi_test', str(self.order.id), type='payment_intent.payment_failed'))
+        self.assertEqual(process_pending_events(), (1, 0))
+        self.assertEqual(Payment.objects.get(order=self.order).status, 'completed')
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.status, 'confirmed')
+
+    def test_success_after_a_failed_attempt_completes_payment(self):
+        self.deliver(intent_event('evt_1', 'pi_test', str(self.order.id), type='payment_intent.payment_failed'))
+        self.deliver(intent_event('evt_2', 'pi_test', str(self.order.id)))
+        self.assertEqual(process_pending_events(), (2, 0))
+        self.assertEqual(Payment.objects.get(order=self.order).status, 'completed')
+
+    def test_success_for_a_cancelled_order_leaves_it_cancelled(self):
+        Order.objects.filter(pk=self.order.pk).update(status='cancelled')
+        self.deliver(intent_event('evt_1', 'pi_test', str(self.order.id)))
+        self.assertEqual(process_pending_events(), (1, 0))
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.status, 'cancelled')
+
+    def test_string_order_id_confirms_order(self):
+        # Stripe sends metadata values back as strings
+        self.assertEqual(self.deliver(intent_event('evt_1', 'pi_test', str(self.order.id))).status_code, 200)
+        self.assertEqual(process_pending_events(), (1, 0))
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.status, 'confirmed')
+        self.assertEqual(Payment.objects.get(order=self.order).status, 'completed')
+
+    def test_claimed_event_is_left_to_its_worker(self):
+        self.deliver(intent_event('evt_1', 'pi_test', str(self.order.id)))
+        event = WebhookEvent.objects.get()
+        stale = WebhookEvent.objects.get()
+        self.assertTrue(claim_event(event, timezone.now()))
+        # A second worker that read the row before the claim cannot take it
+        self.assertFalse(claim_event(stale, timezone.now()))
+        self.assertEqual(process_pending_events(), (0, 0))
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.status, 'pending')
+
+    def test_expired_claim_is_taken_again(self):
+        self.deliver(intent_event('evt_1', 'pi_test', str(self.order.id)))
+        # The worker that claimed it died before finishing
+        claim_event(WebhookEvent.objects.get(), timezone.now() - timedelta(seconds=CLAIM_SECONDS + 1))
+        self.assertEqual(process_pending_events(), (1, 0))
+        self.assertEqual(WebhookEvent.objects.get().status, 'processed')
@@ -5,27 +5,32 @@ from rest_framework.response import Response
 from rest_framework import status
 from django.shortcuts import redirect
 from orders.models import Order
+from .gateway import PaymentGatewayError, create_payment_intent, retrieve_payment_intent
 from .models import Payment
-
-stripe.api_key = settings.STRIPE_SECRET_KEY
+from .webhooks import store_event
 
 class CreatePaymentIntentView(APIView):
     def post(self, request, *args, **kwargs):
         order_id = request.data.get('order_id')
         try:
-            order = Order.objects.get(id=order_id)
-            
-            intent = stripe.PaymentIntent.create(
-                amount=int(order.total * 100),
-                currency='usd',
-                metadata={'order_id': order.id}
-            )
+            order = Order.objects.select_related('payment').get(id=order_id)
+
+            # A pending intent for the same amount is still payable: hand it out again
+            payment = getattr(order, 'payment', None)
+            if payment and payment.status == 'pending' and payment.amount == order.total:
+                if not payment.client_secret:
+                    payment.client_secret = retrieve_payment_intent(payment.stripe_session_id).client_secret
+                    payment.save(update_fields=['client_secret'])
+                return Response({'clientSecret': payment.client_secret}, status=status.HTTP_200_OK)
+
+            intent = create_payment_intent(order)
 
             # Update or create Payment record
             payment, created = Payment.objects.update_or_create(
                 order=order,
                 defaults={
                     'stripe_session_id': intent.id, # We reuse this field for intent ID
+                    'client_secret': intent.client_secret,
                     'amount': order.total,
                     'status': 'pending'
                 }
@@ -36,6 +41,8 @@ class CreatePaymentIntentView(APIView):
             }, status=status.HTTP_201_CREATED)
         except Order.DoesNotExist:
             return Response({'error': 'Order not found'}, status=status.HTTP_404_NOT_FOUND)
+        except PaymentGatewayError as e:
+            return Response({'error': str(e)}, status=status.HTTP_502_BAD_GATEWAY)
         except Exception as e:
             return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -54,19 +61,7 @@ class StripeWebhookView(APIView):
         except stripe.error.SignatureVerificationError as e:
             return Response(status=status.HTTP_400_BAD_REQUEST)
 
-        if event['type'] == 'checkout.session.completed':
-            session = event['data']['object']
-            order_id = session.get('metadata').get('order_id')
-            
-            try:
-                payment = Payment.objects.get(stripe_session_id=session.id)
-                payment.status = 'completed'
-                payment.save()
-                
-                order = Order.objects.get(id=order_id)
-                order.status = 'confirmed' # Or whatever status signifies payment success
-                order.save()
-            except (Payment.DoesNotExist, Order.DoesNotExist):
-                pass
+        # Processing happens in the process_webhooks worker; duplicates are dropped here
+        store_event(event)
 
         return Response(status=status.HTTP_200_OK)
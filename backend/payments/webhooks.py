@@ -0,0 +1,118 @@
+"""Durable processing of Stripe webhook events.
+
+``StripeWebhookView`` only verifies the signature and stores the event in
+``WebhookEvent``; Stripe's event id is unique there, so redelivered events
+are dropped on insert. ``process_pending_events`` (run by the
+``process_webhooks`` command) then applies them in batches, retrying
+failures with exponential backoff until ``MAX_ATTEMPTS``. Handlers only
+move payments and orders forward, so an event applied twice is harmless.
+
+Several workers may run at once. Each claims an event before handling it
+with a conditional ``UPDATE ... SET status = 'processing'`` that only one
+of them can win. A claim lasts ``CLAIM_SECONDS``; an event whose worker
+died mid-way is picked up again once its claim has run out.
+"""
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from orders.transitions import transition_orders
+from .models import Payment, WebhookEvent
+
+MAX_ATTEMPTS = 5
+RETRY_BASE_SECONDS = 30
+CLAIM_SECONDS = 300
+
+
+def store_event(event):
+    """Queue a verified Stripe event; returns ``False`` for a duplicate delivery."""
+    try:
+        with transaction.atomic():
+            WebhookEvent.objects.create(
+                event_id=event['id'], type=event['type'], payload=event['data']['object'].to_dict(),
+            )
+    except IntegrityError:
+        return False
+    return True
+
+
+def complete_payment(intent_id, order_id):
+    """Mark the payment completed and confirm a still-pending order."""
+    Payment.objects.filter(stripe_session_id=intent_id).exclude(status='completed').update(status='completed')
+    if order_id is None:
+        return
+    # Stripe metadata values are always strings
+    transition_orders([int(order_id)], 'confirmed', expected='pending')
+
+
+def handle_checkout_completed(session):
+    complete_payment(session['id'], (session.get('metadata') or {}).get('order_id'))
+
+
+def handle_intent_succeeded(intent):
+    # CreatePaymentIntentView stores the intent id in Payment.stripe_session_id
+    complete_payment(intent['id'], (intent.get('metadata') or {}).get('order_id'))
+
+
+def handle_intent_failed(intent):
+    Payment.objects.filter(stripe_session_id=intent['id'], status='pending').update(status='failed')
+
+
+HANDLERS = {
+    'checkout.session.completed': handle_checkout_completed,
+    'payment_intent.succeeded': handle_intent_succeeded,
+    'payment_intent.payment_failed': handle_intent_failed,
+}
+
+
+def claim_event(event, now):
+    """Take ``event`` for this worker; ``False`` if another worker got to it first."""
+    expires = now + timedelta(seconds=CLAIM_SECONDS)
+    claimed = WebhookEvent.objects.filter(
+        pk=event.pk, status=event.status, next_attempt_at=event.next_attempt_at,
+    ).update(status='processing', next_attempt_at=expires)
+    if claimed:
+        event.status, event.next_attempt_at = 'processing', expires
+    return bool(claimed)
+
+
+def process_event(event):
+    now = timezone.now()
+    handler = HANDLERS.get(event.type)
+    try:
+        with transaction.atomic():
+            if handler is not None:
+                handler(event.payload)
+            event.status = 'processed'
+            event.processed_at = now
+            event.attempts += 1
+            event.last_error = ''
+            event.save(update_fields=['status', 'processed_at', 'attempts', 'last_error'])
+        return True
+    except Exception as e:
+        event.attempts += 1
+        event.last_error = repr(e)
+        if event.attempts >= MAX_ATTEMPTS:
+            event.status = 'failed'
+        else:
+            event.status = 'pending'
+            event.next_attempt_at = now + timedelta(seconds=RETRY_BASE_SECONDS * 2 ** (event.attempts - 1))
+        event.save(update_fields=['status', 'attempts', 'last_error', 'next_attempt_at'])
+        return False
+
+
+def process_pending_events(batch_size=100):
+    """Process one batch of due events and return ``(processed, failed)`` counts.
+
+    Events another worker claims in the meantime are skipped and not counted.
+    """
+    now = timezone.now()
+    events = [
+        event for event in
+        WebhookEvent.objects.filter(status__in=('pending', 'processing'), next_attempt_at__lte=now)
+        .order_by('next_attempt_at', 'id')[:batch_size]
+        if claim_event(event, now)
+    ]
+    processed = sum(process_event(event) for event in events)
+    return processed, len(events) - processed
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import StockCategory, StockItem
+from .models import LowStockAlert, RecipeIngredient, StockCategory, StockItem
 
 @admin.register(StockCategory)
 class StockCategoryAdmin(admin.ModelAdmin):
@@ -11,3 +11,14 @@ class StockItemAdmin(admin.ModelAdmin):
     list_display = ('name', 'category', 'quantity', 'unit', 'threshold')
     list_filter = ('category',)
     search_fields = ('name',)
+
+@admin.register(RecipeIngredient)
+class RecipeIngredientAdmin(admin.ModelAdmin):
+    list_display = ('menu_item', 'stock_item', 'quantity')
+    list_filter = ('stock_item__category',)
+    search_fields = ('menu_item__name', 'stock_item__name')
+
+@admin.register(LowStockAlert)
+class LowStockAlertAdmin(admin.ModelAdmin):
+    list_display = ('stock_item', 'quantity', 'threshold', 'since')
+    readonly_fields = ('stock_item', 'quantity', 'threshold', 'since')
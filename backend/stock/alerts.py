@@ -0,0 +1,28 @@
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import LowStockAlert, StockItem
+
+
+def refresh_low_stock_alerts(stock_item_ids=None):
+    """Bring ``LowStockAlert`` rows in line with the given stock items (all if ``None``)."""
+    items = StockItem.objects.all()
+    alerts = LowStockAlert.objects.all()
+    if stock_item_ids is not None:
+        stock_item_ids = list(stock_item_ids)
+        items = items.filter(pk__in=stock_item_ids)
+        alerts = alerts.filter(stock_item_id__in=stock_item_ids)
+
+    low = list(items.filter(quantity__lte=F('threshold')).values_list('pk', 'quantity', 'threshold'))
+    with transaction.atomic():
+        alerts.exclude(stock_item_id__in=[pk for pk, _, _ in low]).delete()
+        # Upsert so an existing alert keeps the time it was first raised
+        now = timezone.now()
+        LowStockAlert.objects.bulk_create(
+            [LowStockAlert(stock_item_id=pk, quantity=quantity, threshold=threshold, since=now)
+             for pk, quantity, threshold in low],
+            update_conflicts=True,
+            unique_fields=['stock_item'],
+            update_fields=['quantity', 'threshold'],
+        )
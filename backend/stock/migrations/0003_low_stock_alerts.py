@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def raise_existing_alerts(apps, schema_editor):
+    StockItem = apps.get_model('stock', 'StockItem')
+    LowStockAlert = apps.get_model('stock', 'LowStockAlert')
+    now = timezone.now()
+    LowStockAlert.objects.bulk_create(
+        LowStockAlert(stock_item_id=pk, quantity=quantity, threshold=threshold, since=now)
+        for pk, quantity, threshold in StockItem.objects.filter(
+            quantity__lte=models.F('threshold'),
+        ).values_list('pk', 'quantity', 'threshold')
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stock', '0002_recipe_ingredient'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LowStockAlert',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('quantity', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('threshold', models.IntegerField()),
+                ('since', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='stockitem',
+            index=models.Index(condition=models.Q(('quantity__lte', models.F('threshold'))), fields=['category'], name='stockitem_low_idx'),
+        ),
+        migrations.AddField(
+            model_name='lowstockalert',
+            name='stock_item',
+            field=models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='low_stock_alert', to='stock.stockitem'),
+        ),
+        migrations.RunPython(raise_existing_alerts, migrations.RunPython.noop),
+    ]
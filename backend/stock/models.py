@@ -14,5 +14,36 @@ class StockItem(models.Model):
     category = models.ForeignKey(StockCategory, on_delete=models.CASCADE, related_name='items')
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Partial index holding only the rows that are at or below threshold
+            models.Index(fields=['category'], name='stockitem_low_idx',
+                         condition=models.Q(quantity__lte=models.F('threshold'))),
+        ]
+
     def __str__(self):
         return self.name
+
+class LowStockAlert(models.Model):
+    """Stock items currently at or below threshold, kept up to date as stock changes."""
+    stock_item = models.OneToOneField(StockItem, on_delete=models.CASCADE, related_name='low_stock_alert')
+    quantity = models.DecimalField(max_digits=10, decimal_places=2)
+    threshold = models.IntegerField()
+    since = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Low stock: {self.stock_item} ({self.quantity}/{self.threshold})"
+
+class RecipeIngredient(models.Model):
+    """How much of a stock item one portion of a menu item uses."""
+    menu_item = models.ForeignKey('menu.MenuItem', on_delete=models.CASCADE, related_name='ingredients')
+    stock_item = models.ForeignKey(StockItem, on_delete=models.CASCADE, related_name='used_in')
+    quantity = models.DecimalField(max_digits=10, decimal_places=2)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['menu_item', 'stock_item'], name='unique_recipe_ingredient'),
+        ]
+
+    def __str__(self):
+        return f"{self.menu_item} uses {self.quantity} {self.stock_item.unit} {self.stock_item}"
@@ -0,0 +1,54 @@
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db.models import Case, DecimalField, F, Value, When
+from django.utils import timezone
+
+from .alerts import refresh_low_stock_alerts
+from .models import RecipeIngredient, StockItem
+
+
+def stock_usage(items):
+    """Map stock item id to the quantity used by ``(menu item name, portions)`` pairs.
+
+    Order lines only carry the menu item's name, so recipes are matched on it.
+    """
+    portions = defaultdict(int)
+    for name, quantity in items:
+        portions[name] += quantity
+
+    usage = defaultdict(Decimal)
+    ingredients = RecipeIngredient.objects.filter(menu_item__name__in=portions).values_list(
+        'menu_item__name', 'stock_item_id', 'quantity',
+    )
+    for name, stock_item_id, per_portion in ingredients:
+        usage[stock_item_id] += per_portion * portions[name]
+    return usage
+
+
+def _apply_usage(usage, sign):
+    if not usage:
+        return 0
+    # One UPDATE ... SET quantity = quantity - CASE id ... END for every row,
+    # so concurrent orders never overwrite each other's decrements.
+    amount = Case(
+        *[When(pk=pk, then=Value(sign * used)) for pk, used in usage.items()],
+        output_field=DecimalField(max_digits=10, decimal_places=2),
+    )
+    updated = StockItem.objects.filter(pk__in=usage).update(
+        quantity=F('quantity') + amount,
+        updated_at=timezone.now(),
+    )
+    # update() sends no post_save, so refresh the alerts for these rows here
+    refresh_low_stock_alerts(usage)
+    return updated
+
+
+def consume_stock(items):
+    """Take the ingredients for ``(name, portions)`` pairs out of stock."""
+    return _apply_usage(stock_usage(items), -1)
+
+
+def restock(items):
+    """Put the ingredients for ``(name, portions)`` pairs back into stock."""
+    return _apply_usage(stock_usage(items), 1)
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import StockCategory, StockItem
+from .models import LowStockAlert, RecipeIngredient, StockCategory, StockItem
 
 class StockCategorySerializer(serializers.ModelSerializer):
     class Meta:
@@ -12,3 +12,20 @@ class StockItemSerializer(serializers.ModelSerializer):
     class Meta:
         model = StockItem
         fields = '__all__'
+
+class RecipeIngredientSerializer(serializers.ModelSerializer):
+    menu_item_name = serializers.ReadOnlyField(source='menu_item.name')
+    stock_item_name = serializers.ReadOnlyField(source='stock_item.name')
+
+    class Meta:
+        model = RecipeIngredient
+        fields = '__all__'
+
+class LowStockAlertSerializer(serializers.ModelSerializer):
+    name = serializers.ReadOnlyField(source='stock_item.name')
+    unit = serializers.ReadOnlyField(source='stock_item.unit')
+    category_name = serializers.ReadOnlyField(source='stock_item.category.name')
+
+    class Meta:
+        model = LowStockAlert
+        fields = '__all__'
@@ -0,0 +1,31 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from orders.models import OrderItem
+from orders.signals import order_status_changed, orders_placed
+
+from .alerts import refresh_low_stock_alerts
+from .models import StockItem
+from .recipes import consume_stock, restock
+
+
+@receiver(orders_placed)
+def consume_stock_for_orders(sender, items, **kwargs):
+    consume_stock((item.name, item.quantity) for item in items)
+
+
+@receiver(order_status_changed)
+def restock_cancelled_order(sender, order, previous, status, **kwargs):
+    if 'cancelled' not in (previous, status):
+        return
+    items = OrderItem.objects.filter(order=order).values_list('name', 'quantity')
+    if status == 'cancelled':
+        restock(items)
+    else:
+        # Reinstated after a cancellation
+        consume_stock(items)
+
+
+@receiver(post_save, sender=StockItem)
+def refresh_alert_on_save(sender, instance, **kwargs):
+    refresh_low_stock_alerts([instance.pk])
@@ -1,3 +1,72 @@
-from django.test import TestCase
+import json
+from decimal import Decimal
 
-# Create your tests here.
+from django.db import connection
+from django.test import Client
+
+from config.testing import ConcurrentTestCase, run_concurrently
+from menu.models import MenuItem
+from .models import RecipeIngredient, StockCategory, StockItem
+from .recipes import consume_stock
+
+RECIPES = {
+    'Classic Burger': {'Burger Buns': 1, 'Beef Patties': 1},
+    'Double Burger': {'Burger Buns': 1, 'Beef Patties': 2},
+}
+OPENING_STOCK = Decimal('1000')
+
+
+class StockConcurrencyTestCase(ConcurrentTestCase):
+    def setUp(self):
+        category = StockCategory.objects.create(name='Kitchen')
+        stock = {
+            name: StockItem.objects.create(name=name, quantity=OPENING_STOCK, unit='pcs', threshold=10,
+                                           category=category)
+            for name in ('Burger Buns', 'Beef Patties')
+        }
+        for dish, ingredients in RECIPES.items():
+            menu_item = MenuItem.objects.create(name=dish, description=dish, price='10.00', category='Burgers')
+            for name, quantity in ingredients.items():
+                RecipeIngredient.objects.create(menu_item=menu_item, stock_item=stock[name], quantity=quantity)
+
+    def quantities(self):
+        return dict(StockItem.objects.values_list('name', 'quantity'))
+
+    def test_concurrent_orders_lose_no_decrements(self):
+        def place_orders(dish, portions, cancel):
+            def run():
+                client = Client()
+                for _ in range(5):
+                    response = client.post('/api/orders/', json.dumps({
+                        'customer_name': 'Load', 'phone': '0', 'delivery_method': 'pickup',
+                        'payment_method': 'cash', 'subtotal': '10.00', 'total': '10.00',
+                        'items': [{'name': dish, 'price': '10.00', 'quantity': portions}],
+                    }), content_type='application/json')
+                    assert response.status_code == 201, response.content
+                    if cancel:
+                        response = client.patch(f"/api/orders/{response.json()['id']}/",
+                                                json.dumps({'status': 'cancelled'}), content_type='application/json')
+                        assert response.status_code == 200, response.content
+            return run
+
+        workers = [('Classic Burger', 2, False), ('Double Burger', 1, False), ('Double Burger', 3, True)] * 3
+        run_concurrently(*(place_orders(*worker) for worker in workers))
+        # Three workers each of 5 x 2 Classic and 5 x 1 Double; cancelled orders are put back
+        self.assertEqual(self.quantities(), {
+            'Burger Buns': OPENING_STOCK - 3 * 5 * (2 + 1),
+            'Beef Patties': OPENING_STOCK - 3 * 5 * (2 * 1 + 1 * 2),
+        })
+
+    def test_decrement_committed_mid_order_is_kept(self):
+        # Another order's decrement lands between this one's recipe lookup and its UPDATE
+        raced = []
+
+        def decrement_first(execute, sql, params, many, context):
+            if sql.startswith('UPDATE "stock_stockitem"') and not raced:
+                raced.append(True)
+                execute('UPDATE "stock_stockitem" SET "quantity" = "quantity" - 7', [], False, context)
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(decrement_first):
+            consume_stock([('Double Burger', 1)])
+        self.assertEqual(self.quantities(), {'Burger Buns': OPENING_STOCK - 8, 'Beef Patties': OPENING_STOCK - 9})
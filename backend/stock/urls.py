@@ -1,10 +1,12 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import StockCategoryViewSet, StockItemViewSet
+from .views import LowStockAlertViewSet, RecipeIngredientViewSet, StockCategoryViewSet, StockItemViewSet
 
 router = DefaultRouter()
 router.register(r'categories', StockCategoryViewSet)
 router.register(r'items', StockItemViewSet)
+router.register(r'recipes', RecipeIngredientViewSet)
+router.register(r'alerts', LowStockAlertViewSet)
 
 urlpatterns = [
     path('', include(router.urls)),
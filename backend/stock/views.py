@@ -1,11 +1,34 @@
+from django.db.models import F
 from rest_framework import viewsets
-from .models import StockCategory, StockItem
-from .serializers import StockCategorySerializer, StockItemSerializer
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from config.fastread import ValuesListMixin, ValuesSerializer
+from .models import LowStockAlert, RecipeIngredient, StockCategory, StockItem
+from .serializers import (
+    LowStockAlertSerializer, RecipeIngredientSerializer, StockCategorySerializer, StockItemSerializer,
+)
 
-class StockCategoryViewSet(viewsets.ModelViewSet):
+class StockCategoryViewSet(ValuesListMixin, viewsets.ModelViewSet):
     queryset = StockCategory.objects.all()
     serializer_class = StockCategorySerializer
+    values_serializer = ValuesSerializer(StockCategorySerializer)
+    replica_actions = ('list', 'retrieve')
 
-class StockItemViewSet(viewsets.ModelViewSet):
-    queryset = StockItem.objects.all()
+class StockItemViewSet(ValuesListMixin, viewsets.ModelViewSet):
+    queryset = StockItem.objects.select_related('category')
     serializer_class = StockItemSerializer
+    values_serializer = ValuesSerializer(StockItemSerializer)
+
+    @action(detail=False, methods=['get'])
+    def low(self, request):
+        items = self.get_queryset().filter(quantity__lte=F('threshold'))
+        return Response(self.values_serializer.convert(self.values_serializer.rows(items)))
+
+class RecipeIngredientViewSet(viewsets.ModelViewSet):
+    queryset = RecipeIngredient.objects.select_related('menu_item', 'stock_item')
+    serializer_class = RecipeIngredientSerializer
+
+class LowStockAlertViewSet(ValuesListMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = LowStockAlert.objects.select_related('stock_item__category').order_by('since')
+    serializer_class = LowStockAlertSerializer
+    values_serializer = ValuesSerializer(LowStockAlertSerializer)
@@ -0,0 +1,102 @@
+"""JWT authentication that trusts the token's claims instead of the database.
+
+``MyTokenObtainPairSerializer`` already signs ``email``, ``is_admin`` and
+``is_customer`` into every token, so ``ClaimsJWTAuthentication`` builds a
+``ClaimsUser`` from them and skips the ``CustomUser`` lookup simplejwt's
+``JWTAuthentication`` does on each request. Code that genuinely needs the
+row uses ``request.user.db_user``, served from a short per-process cache.
+
+Claims are only as fresh as the token, so every request also checks the
+user's row, from the same cache: a deleted or deactivated user is rejected,
+and so is a token whose ``token_version`` claim no longer matches the row.
+``revoke_user`` bumps that column, which ends every outstanding token for
+good. Revocations live in the database, so every worker sees a revocation within
+``JWT_USER_CACHE_SECONDS`` (the revoking worker at once), and if the row
+cannot be read the request is refused.
+"""
+import threading
+import time
+
+from django.conf import settings
+from django.db import DatabaseError
+from django.db.models import F
+from django.utils.functional import cached_property
+from rest_framework_simplejwt.authentication import JWTStatelessUserAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.models import TokenUser
+
+from .models import CustomUser
+
+USER_CACHE_MAX_ENTRIES = 1000
+
+_user_cache = {}
+_user_cache_lock = threading.Lock()
+
+
+def revoke_user(user_id):
+    """Reject every token issued to the user so far; they must sign in again."""
+    CustomUser.objects.filter(pk=user_id).update(token_version=F('token_version') + 1)
+    forget_user(user_id)
+
+
+def is_revoked(user_id, token_version=0):
+    """Whether a token for ``user_id`` carrying ``token_version`` is no longer valid."""
+    user = get_cached_user(user_id)
+    return user is None or not user.is_active or user.token_version != token_version
+
+
+def forget_user(user_id):
+    with _user_cache_lock:
+        _user_cache.pop(str(user_id), None)
+
+
+def get_cached_user(user_id):
+    """Return the ``CustomUser`` row, at most ``JWT_USER_CACHE_SECONDS`` old, or ``None``."""
+    key = str(user_id)
+    now = time.monotonic()
+    entry = _user_cache.get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+
+    user = CustomUser.objects.filter(pk=user_id).first()
+    with _user_cache_lock:
+        if len(_user_cache) >= USER_CACHE_MAX_ENTRIES:
+            _user_cache.clear()
+        _user_cache[key] = (now + settings.JWT_USER_CACHE_SECONDS, user)
+    return user
+
+
+class ClaimsUser(TokenUser):
+    """A user built from token claims; the database row is loaded only on demand."""
+
+    @cached_property
+    def email(self):
+        return self.token.get('email', '')
+
+    @cached_property
+    def is_admin(self):
+        return self.token.get('is_admin', False)
+
+    @cached_property
+    def is_customer(self):
+        return self.token.get('is_customer', False)
+
+    @cached_property
+    def db_user(self):
+        return get_cached_user(self.id)
+
+    def __str__(self):
+        return self.email or super().__str__()
+
+
+class ClaimsJWTAuthentication(JWTStatelessUserAuthentication):
+    def get_user(self, validated_token):
+        user = super().get_user(validated_token)
+        try:
+            revoked = is_revoked(user.id, validated_token.get('token_version', 0))
+        except DatabaseError:
+            # Without the row there is no telling whether the token was revoked
+            raise AuthenticationFailed('Could not verify the token', code='token_not_valid')
+        if revoked:
+            raise AuthenticationFailed('User is inactive', code='user_inactive')
+        return user
@@ -24,6 +24,8 @@ class CustomUser(AbstractUser):
     name = models.CharField(max_length=255, blank=True)
     is_customer = models.BooleanField(default=False)
     is_admin = models.BooleanField(default=False)
+    # Signed into each token; bumping it revokes them all (users/authentication.py)
+    token_version = models.PositiveIntegerField(default=0)
 
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['name']
@@ -37,4 +37,5 @@ class MyTokenObtainPairSerializer(TokenObtainPairSerializer):
         token['email'] = user.email
         token['is_admin'] = user.is_admin
         token['is_customer'] = user.is_customer
+        token['token_version'] = user.token_version
         return token
@@ -0,0 +1,28 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .authentication import forget_user, revoke_user
+from .models import CustomUser
+
+
+def revoke(user):
+    revoke_user(user.pk)
+    # A later save() of this instance must not write the old version back
+    user.refresh_from_db(fields=['token_version'])
+
+
+@receiver(post_save, sender=CustomUser)
+def sync_revocation(sender, instance, created, **kwargs):
+    if created:
+        return
+    if instance.is_active:
+        transaction.on_commit(lambda: forget_user(instance.pk))
+    else:
+        transaction.on_commit(lambda: revoke(instance))
+
+
+@receiver(post_delete, sender=CustomUser)
+def revoke_deleted_user(sender, instance, **kwargs):
+    user_id = instance.pk
+    transaction.on_commit(lambda: forget_user(user_id))
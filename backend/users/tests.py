@@ -1,3 +1,50 @@
+from unittest import mock
+
+from django.db import DatabaseError
 from django.test import TestCase
 
-# Create your tests here.
+from .authentication import forget_user, revoke_user
+from .models import CustomUser
+from .serializers import MyTokenObtainPairSerializer
+
+PATH = '/api/stock/categories/'
+
+
+class RevocationTestCase(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(email='admin@example.com', password='x', name='Admin',
+                                                   is_admin=True)
+        forget_user(self.user.pk)  # the rows of earlier tests, rolled back, may share its id
+        self.token = str(MyTokenObtainPairSerializer.get_token(self.user).access_token)
+
+    def get(self, token=None):
+        return self.client.get(PATH, HTTP_AUTHORIZATION=f'Bearer {token or self.token}')
+
+    def test_revocation_is_stored_in_the_database(self):
+        self.assertEqual(self.get().status_code, 200)
+        with self.captureOnCommitCallbacks(execute=True):
+            revoke_user(self.user.pk)
+        # Another worker, or this one after its cache dropped the row, still sees it
+        forget_user(self.user.pk)
+        self.assertEqual(self.get().status_code, 401)
+        self.user.refresh_from_db()
+        self.assertEqual(self.get(str(MyTokenObtainPairSerializer.get_token(self.user).access_token)).status_code, 200)
+
+    def test_deactivation_outlives_reactivation(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+        self.assertEqual(self.get().status_code, 401)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = True
+            self.user.save()
+        self.assertEqual(self.get().status_code, 401)
+
+    def test_deleted_user_is_rejected(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.delete()
+        self.assertEqual(self.get().status_code, 401)
+
+    def test_unreadable_state_fails_closed(self):
+        with mock.patch('users.authentication.get_cached_user', side_effect=DatabaseError):
+            self.assertEqual(self.get().status_code, 401)
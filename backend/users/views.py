@@ -3,7 +3,6 @@ from rest_framework.response import Response
 from .serializers import UserSerializer, MyTokenObtainPairSerializer
 from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework.permissions import AllowAny
-from rest_framework_simplejwt.tokens import RefreshToken
 from .models import CustomUser
 
 class RegisterView(generics.CreateAPIView):
@@ -16,7 +15,8 @@ class RegisterView(generics.CreateAPIView):
         serializer.is_valid(raise_exception=True)
         user = serializer.save()
         
-        refresh = RefreshToken.for_user(user)
+        # get_token, not RefreshToken.for_user, so the claims auth relies on are present
+        refresh = MyTokenObtainPairSerializer.get_token(user)
         
         user_data = UserSerializer(user).data
         user_data['role'] = 'admin' if user.is_admin else 'customer'
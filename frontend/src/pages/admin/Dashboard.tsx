@@ -1,12 +1,25 @@
-import { DollarSign, ShoppingBag, Users, AlertTriangle, TrendingUp, TrendingDown, ArrowRight } from 'lucide-react';
+import { useEffect } from 'react';
+import { DollarSign, ShoppingBag, CalendarDays, AlertTriangle, TrendingUp, TrendingDown, ArrowRight } from 'lucide-react';
 import { motion } from 'framer-motion';
+import { useDashboardStore } from '../../store/useDashboardStore';
+
+const ACTIVE_STATUSES = ['pending', 'confirmed', 'preparing', 'out-for-delivery', 'ready-for-pickup'];
 
 export default function Dashboard() {
+    const { summary, fetchSummary } = useDashboardStore();
+
+    useEffect(() => {
+        fetchSummary();
+    }, [fetchSummary]);
+
+    const activeOrders = summary
+        ? ACTIVE_STATUSES.reduce((count, status) => count + (summary.ordersByStatus[status] || 0), 0)
+        : 0;
     const stats = [
-        { title: 'Total Revenue', value: '$12,845.50', icon: DollarSign, trend: '+12.5%', isPositive: true, color: 'from-emerald-500 to-teal-600' },
-        { title: 'Active Orders', value: '156', icon: ShoppingBag, trend: '+5.2%', isPositive: true, color: 'from-blue-500 to-indigo-600' },
-        { title: 'New Customers', value: '24', icon: Users, trend: '+18.1%', isPositive: true, color: 'from-orange-500 to-red-600' },
-        { title: 'Low Stock', value: '4 items', icon: AlertTriangle, trend: '-2', isPositive: false, color: 'from-rose-500 to-pink-600' },
+        { title: 'Revenue Today', value: `$${(summary?.revenueToday ?? 0).toFixed(2)}`, icon: DollarSign, trend: `${summary?.ordersToday ?? 0} orders`, isPositive: true, color: 'from-emerald-500 to-teal-600' },
+        { title: 'Active Orders', value: `${activeOrders}`, icon: ShoppingBag, trend: `${summary?.ordersByStatus.pending ?? 0} pending`, isPositive: true, color: 'from-blue-500 to-indigo-600' },
+        { title: 'Upcoming Bookings', value: `${summary?.upcomingBookings ?? 0}`, icon: CalendarDays, trend: `${summary?.pendingBookings ?? 0} pending`, isPositive: true, color: 'from-orange-500 to-red-600' },
+        { title: 'Low Stock', value: `${summary?.lowStock ?? 0} items`, icon: AlertTriangle, trend: `${summary?.unreadMessages ?? 0} unread messages`, isPositive: !summary?.lowStock, color: 'from-rose-500 to-pink-600' },
     ];
 
     const container = {
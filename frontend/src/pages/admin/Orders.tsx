@@ -1,10 +1,10 @@
 import { useEffect, useState } from 'react';
 import { Eye, CheckCircle, XCircle, Clock, Truck, ChefHat, MoreVertical, ShoppingBag, Calendar, User, Phone, MapPin } from 'lucide-react';
-import { useOrderStore, type OrderStatus } from '../../store/useOrderStore';
+import { useOrderStore, ORDER_TRANSITIONS, type OrderStatus } from '../../store/useOrderStore';
 import { motion, AnimatePresence } from 'framer-motion';
 
 export default function Orders() {
-    const { orders, updateOrderStatus, fetchOrders } = useOrderStore();
+    const { orders, nextPage, isLoading, error, updateOrderStatus, fetchOrders, fetchMoreOrders, subscribeToStatus } = useOrderStore();
     const [filter, setFilter] = useState('All');
     const [selectedOrder, setSelectedOrder] = useState<string | null>(null);
 
@@ -12,6 +12,8 @@ export default function Orders() {
         fetchOrders();
     }, [fetchOrders]);
 
+    useEffect(() => subscribeToStatus(), [subscribeToStatus]);
+
     const STATUS_OPTIONS: { value: OrderStatus; label: string; icon: any; color: string }[] = [
         { value: 'pending', label: 'Pending', icon: Clock, color: 'text-amber-600 bg-amber-50 border-amber-100' },
         { value: 'confirmed', label: 'Confirmed', icon: CheckCircle, color: 'text-blue-600 bg-blue-50 border-blue-100' },
@@ -69,6 +71,16 @@ export default function Orders() {
                 </div>
             </div>
 
+            {error && (
+                <motion.div
+                    initial={{ opacity: 0, y: -10 }}
+                    animate={{ opacity: 1, y: 0 }}
+                    className="bg-red-50 dark:bg-red-900/30 border border-red-200 dark:border-red-800 text-red-700 dark:text-red-300 px-4 py-3 rounded-xl text-sm text-center"
+                >
+                    {error}
+                </motion.div>
+            )}
+
             {/* Main Table Card */}
             <div className="bg-white dark:bg-slate-900 rounded-[40px] shadow-2xl shadow-slate-200/30 dark:shadow-none border border-slate-100 dark:border-slate-800 overflow-hidden">
                 <div className="overflow-x-auto">
@@ -198,13 +210,9 @@ export default function Orders() {
                                                         >
                                                             <div className="px-4 py-2 text-[8px] font-black text-slate-300 dark:text-slate-600 uppercase tracking-[2px] mb-1">Update Transition</div>
                                                             {STATUS_OPTIONS.filter(option => {
-                                                                const common = ['pending', 'confirmed', 'preparing', 'cancelled'];
-                                                                if (common.includes(option.value)) return true;
-                                                                if (order.deliveryMethod === 'pickup') {
-                                                                    return ['ready-for-pickup', 'picked-up'].includes(option.value);
-                                                                } else {
-                                                                    return ['out-for-delivery', 'delivered'].includes(option.value);
-                                                                }
+                                                                if (!(ORDER_TRANSITIONS[order.status] || []).includes(option.value)) return false;
+                                                                if (order.deliveryMethod === 'pickup') return option.value !== 'out-for-delivery';
+                                                                return option.value !== 'ready-for-pickup';
                                                             }).map((status) => (
                                                                 <button
                                                                     key={status.value}
@@ -218,9 +226,11 @@ export default function Orders() {
                                                                         <status.icon size={16} className="opacity-70" />
                                                                         {status.label}
                                                                     </div>
-                                                                    {order.status === status.value && <div className="w-1.5 h-1.5 rounded-full bg-orange-500 shadow-[0_0_8px_rgba(249,115,22,0.5)]" />}
                                                                 </button>
                                                             ))}
+                                                            {(ORDER_TRANSITIONS[order.status] || []).length === 0 && (
+                                                                <div className="px-4 py-3 text-[10px] font-bold text-slate-400 italic">This order is complete</div>
+                                                            )}
                                                         </motion.div>
                                                     )}
                                                 </AnimatePresence>
@@ -237,6 +247,17 @@ export default function Orders() {
                         </motion.tbody>
                     </table>
                 </div>
+                {nextPage && (
+                    <div className="flex justify-center p-6 border-t border-slate-50 dark:border-slate-800">
+                        <button
+                            onClick={() => fetchMoreOrders()}
+                            disabled={isLoading}
+                            className="px-8 py-3 rounded-2xl text-[10px] font-black uppercase tracking-widest bg-slate-900 dark:bg-orange-500 text-white shadow-lg shadow-slate-900/20 disabled:opacity-50 transition-all"
+                        >
+                            {isLoading ? 'Loading...' : 'Load older orders'}
+                        </button>
+                    </div>
+                )}
             </div>
 
             {/* Real-time Indicator */}
@@ -5,14 +5,33 @@ import { motion } from 'framer-motion';
 import { useMenuStore } from '../../store/useMenuStore';
 
 export default function Menu() {
-    const { items, fetchItems, isLoading } = useMenuStore();
+    const { items, fetchItems, searchItems, isLoading } = useMenuStore();
     const [activeCategory, setActiveCategory] = useState('All');
     const [searchQuery, setSearchQuery] = useState('');
+    const [matchIds, setMatchIds] = useState<string[] | null>(null);
 
     useEffect(() => {
         fetchItems();
     }, [fetchItems]);
 
+    // Search server-side once typing pauses; fall back to local matching on error
+    useEffect(() => {
+        if (!searchQuery.trim()) {
+            setMatchIds(null);
+            return;
+        }
+        let cancelled = false;
+        const timer = setTimeout(() => {
+            searchItems(searchQuery)
+                .then((ids) => { if (!cancelled) setMatchIds(ids); })
+                .catch(() => { if (!cancelled) setMatchIds(null); });
+        }, 200);
+        return () => {
+            cancelled = true;
+            clearTimeout(timer);
+        };
+    }, [searchQuery, searchItems]);
+
     if (isLoading) {
         return (
             <div className="min-h-screen flex items-center justify-center bg-white dark:bg-black">
@@ -24,10 +43,15 @@ export default function Menu() {
     // Get unique categories for filter from live items
     const categories = ['All', ...new Set((items || []).map(item => item?.category).filter(Boolean))];
 
-    const filteredItems = (items || []).filter((item) => {
+    const searchResults = matchIds
+        ? matchIds.map((id) => (items || []).find((item) => item?.id === id)).filter((item) => item !== undefined)
+        : items || [];
+
+    const filteredItems = searchResults.filter((item) => {
         if (!item) return false;
         const matchesCategory = activeCategory === 'All' || item.category === activeCategory;
-        const matchesSearch = (item.name || '').toLowerCase().includes(searchQuery.toLowerCase()) ||
+        const matchesSearch = matchIds !== null ||
+            (item.name || '').toLowerCase().includes(searchQuery.toLowerCase()) ||
             (item.description || '').toLowerCase().includes(searchQuery.toLowerCase());
         return matchesCategory && matchesSearch;
     });
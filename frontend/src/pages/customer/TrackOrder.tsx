@@ -9,11 +9,18 @@ import { Link } from 'react-router-dom';
 import { useOrderStore, type OrderStatus } from '../../store/useOrderStore';
 
 export default function TrackOrder() {
-    const { orders, activeOrderId, fetchOrders, isLoading } = useOrderStore();
+    const { orders, activeOrderId, fetchOrders, fetchOrder, subscribeToStatus, isLoading } = useOrderStore();
 
     useEffect(() => {
-        fetchOrders();
-    }, [fetchOrders]);
+        fetchOrders().then(() => {
+            // Only the newest page is loaded; an older active order is fetched on its own
+            const { orders, activeOrderId } = useOrderStore.getState();
+            if (activeOrderId && !orders.some(o => o.id === activeOrderId)) fetchOrder(activeOrderId);
+        });
+    }, [fetchOrders, fetchOrder]);
+
+    // Only the customer's own order; without one there is nothing to follow
+    useEffect(() => activeOrderId ? subscribeToStatus(activeOrderId) : undefined, [subscribeToStatus, activeOrderId]);
 
     if (isLoading) {
         return (
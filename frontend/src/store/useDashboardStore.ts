@@ -0,0 +1,49 @@
+import { create } from 'zustand';
+import api from '../api/axios';
+
+export interface DashboardSummary {
+    date: string;
+    ordersToday: number;
+    ordersByStatus: Record<string, number>;
+    revenueToday: number;
+    upcomingBookings: number;
+    pendingBookings: number;
+    lowStock: number;
+    unreadMessages: number;
+}
+
+interface DashboardState {
+    summary: DashboardSummary | null;
+    isLoading: boolean;
+    error: string | null;
+    fetchSummary: () => Promise<void>;
+}
+
+export const useDashboardStore = create<DashboardState>((set) => ({
+    summary: null,
+    isLoading: false,
+    error: null,
+
+    fetchSummary: async () => {
+        set({ isLoading: true, error: null });
+        try {
+            const response = await api.get('dashboard/summary/');
+            const data = response.data;
+            set({
+                summary: {
+                    date: data.date,
+                    ordersToday: data.orders_today,
+                    ordersByStatus: data.orders_by_status,
+                    revenueToday: parseFloat(data.revenue_today),
+                    upcomingBookings: data.upcoming_bookings,
+                    pendingBookings: data.pending_bookings,
+                    lowStock: data.low_stock,
+                    unreadMessages: data.unread_messages
+                },
+                isLoading: false
+            });
+        } catch (error: any) {
+            set({ error: error.message, isLoading: false });
+        }
+    },
+}));
@@ -20,6 +20,7 @@ interface MenuState {
     updateItem: (id: string, updates: Partial<MenuItem>) => Promise<void>;
     deleteItem: (id: string) => Promise<void>;
     getItem: (id: string) => MenuItem | undefined;
+    searchItems: (query: string) => Promise<string[]>;
 }
 
 export const useMenuStore = create<MenuState>((set, get) => ({
@@ -95,4 +96,10 @@ export const useMenuStore = create<MenuState>((set, get) => ({
     },
 
     getItem: (id) => get().items.find((item) => item.id === id),
+
+    // Ranked ids of items matching the query, best match first
+    searchItems: async (query) => {
+        const response = await api.get('menu/items/search/', { params: { q: query, limit: 100 } });
+        return response.data.map((item: { id: number }) => item.id.toString());
+    },
 }));
@@ -3,6 +3,18 @@ import api from '../api/axios';
 
 export type OrderStatus = 'pending' | 'confirmed' | 'preparing' | 'out-for-delivery' | 'delivered' | 'cancelled' | 'ready-for-pickup' | 'picked-up';
 
+// Mirrors Order.TRANSITIONS on the backend: the statuses an order may move to next
+export const ORDER_TRANSITIONS: Record<OrderStatus, OrderStatus[]> = {
+    'pending': ['confirmed', 'cancelled'],
+    'confirmed': ['preparing', 'cancelled'],
+    'preparing': ['out-for-delivery', 'ready-for-pickup', 'cancelled'],
+    'out-for-delivery': ['delivered'],
+    'ready-for-pickup': ['picked-up'],
+    'delivered': [],
+    'picked-up': [],
+    'cancelled': ['pending'],
+};
+
 export interface OrderItem {
     id: string;
     name: string;
@@ -28,20 +40,48 @@ export interface Order {
     estimatedArrival: string;
 }
 
+const mapOrder = (o: any): Order => ({
+    id: o.id.toString(),
+    items: (o.items || []).map((item: any) => ({
+        ...item,
+        price: typeof item.price === 'string' ? parseFloat(item.price) : item.price
+    })),
+    subtotal: parseFloat(o.subtotal || 0),
+    deliveryFee: parseFloat(o.delivery_fee || 0),
+    total: parseFloat(o.total || 0),
+    status: o.status,
+    customerName: o.customer_name,
+    phone: o.phone,
+    address: o.address,
+    deliveryMethod: o.delivery_method,
+    paymentMethod: o.payment_method,
+    createdAt: o.created_at,
+    estimatedArrival: o.estimated_arrival
+});
+
+// How often a page whose status stream failed refetches instead
+const STATUS_POLL_MS = 15000;
+
 interface OrderState {
     orders: Order[];
+    nextPage: string | null;
     isLoading: boolean;
     error: string | null;
     activeOrderId: string | null;
     fetchOrders: () => Promise<void>;
+    fetchMoreOrders: () => Promise<void>;
+    fetchOrder: (orderId: string) => Promise<void>;
+    refreshOrders: () => Promise<void>;
     addOrder: (order: Omit<Order, 'id' | 'status' | 'createdAt'>) => Promise<void>;
     updateOrderStatus: (orderId: string, status: OrderStatus) => Promise<void>;
     setActiveOrder: (orderId: string | null) => void;
+    subscribeToStatus: (orderId?: string) => () => void;
     getOrder: (orderId: string) => Order | undefined;
 }
 
 export const useOrderStore = create<OrderState>((set, get) => ({
     orders: [],
+    nextPage: null,
     isLoading: false,
     error: null,
     activeOrderId: null,
@@ -50,30 +90,57 @@ export const useOrderStore = create<OrderState>((set, get) => ({
         set({ isLoading: true, error: null });
         try {
             const response = await api.get('orders/');
-            const mappedData = response.data.map((o: any) => ({
-                id: o.id.toString(),
-                items: (o.items || []).map((item: any) => ({
-                    ...item,
-                    price: typeof item.price === 'string' ? parseFloat(item.price) : item.price
-                })),
-                subtotal: parseFloat(o.subtotal || 0),
-                deliveryFee: parseFloat(o.delivery_fee || 0),
-                total: parseFloat(o.total || 0),
-                status: o.status,
-                customerName: o.customer_name,
-                phone: o.phone,
-                address: o.address,
-                deliveryMethod: o.delivery_method,
-                paymentMethod: o.payment_method,
-                createdAt: o.created_at,
-                estimatedArrival: o.estimated_arrival
-            }));
-            set({ orders: mappedData, isLoading: false });
+            set({ orders: response.data.results.map(mapOrder), nextPage: response.data.next, isLoading: false });
+        } catch (error: any) {
+            set({ error: error.message, isLoading: false });
+        }
+    },
+
+    fetchMoreOrders: async () => {
+        const { nextPage } = get();
+        if (!nextPage) return;
+        set({ isLoading: true, error: null });
+        try {
+            // The list is cursor paginated: `next` is a full URL for the page after the last one loaded
+            const response = await api.get(nextPage);
+            set((state) => {
+                const loaded = new Set(state.orders.map((o) => o.id));
+                const more = response.data.results.map(mapOrder).filter((o: Order) => !loaded.has(o.id));
+                return { orders: [...state.orders, ...more], nextPage: response.data.next, isLoading: false };
+            });
         } catch (error: any) {
             set({ error: error.message, isLoading: false });
         }
     },
 
+    fetchOrder: async (orderId) => {
+        try {
+            const response = await api.get(`orders/${orderId}/`);
+            const order = mapOrder(response.data);
+            set((state) => ({
+                orders: state.orders.some((o) => o.id === order.id)
+                    ? state.orders.map((o) => o.id === order.id ? order : o)
+                    : [order, ...state.orders]
+            }));
+        } catch (error: any) {
+            set({ error: error.message });
+        }
+    },
+
+    refreshOrders: async () => {
+        // The newest page merged in place, keeping older pages and without a loading state
+        try {
+            const response = await api.get('orders/');
+            const fresh: Order[] = response.data.results.map(mapOrder);
+            set((state) => {
+                const ids = new Set(fresh.map((o) => o.id));
+                return { orders: [...fresh, ...state.orders.filter((o) => !ids.has(o.id))] };
+            });
+        } catch {
+            // The next poll tries again
+        }
+    },
+
     addOrder: async (orderData) => {
         set({ isLoading: true });
         try {
@@ -99,7 +166,7 @@ export const useOrderStore = create<OrderState>((set, get) => ({
     },
 
     updateOrderStatus: async (orderId, status) => {
-        set({ isLoading: true });
+        set({ isLoading: true, error: null });
         try {
             await api.patch(`orders/${orderId}/`, { status });
             set((state) => ({
@@ -107,10 +174,38 @@ export const useOrderStore = create<OrderState>((set, get) => ({
                 isLoading: false
             }));
         } catch (error: any) {
-            set({ error: error.message, isLoading: false });
+            // 400 for a move Order.TRANSITIONS does not allow, 409 when someone else moved the order first
+            set({ error: error.response?.data?.error || error.message, isLoading: false });
         }
     },
 
     setActiveOrder: (orderId) => set({ activeOrderId: orderId }),
+
+    subscribeToStatus: (orderId) => {
+        const path = orderId ? `orders/${orderId}/stream/` : 'orders/stream/';
+        const source = new EventSource(`${api.defaults.baseURL}${path}`);
+        let poller: ReturnType<typeof setInterval> | undefined;
+        source.addEventListener('status', (event) => {
+            const { id, status, estimated_arrival } = JSON.parse((event as MessageEvent).data);
+            set((state) => ({
+                orders: state.orders.map((o) => o.id === id.toString()
+                    ? { ...o, status, estimatedArrival: estimated_arrival ?? o.estimatedArrival }
+                    : o)
+            }));
+        });
+        // The stream needs the ASGI server (config/asgi.py); under plain WSGI runserver it is a 404.
+        // Rather than let EventSource retry forever, poll the REST API instead
+        source.onerror = () => {
+            source.close();
+            if (poller === undefined) {
+                const { fetchOrder, refreshOrders } = get();
+                poller = setInterval(() => orderId ? fetchOrder(orderId) : refreshOrders(), STATUS_POLL_MS);
+            }
+        };
+        return () => {
+            source.close();
+            clearInterval(poller);
+        };
+    },
     getOrder: (orderId) => get().orders.find((o) => o.id === orderId),
 }));